@@ -0,0 +1,55 @@
+"""
+Benchmark of the vectorized Fresnel reflection coefficients against a per-pixel loop.
+
+Usage: python benchmarks/bench_fresnel.py [size] [max_workers]
+"""
+from __future__ import division, print_function
+
+import cmath
+import math
+import sys
+import timeit
+
+import numpy as np
+
+from respy import Angles
+from respy.fresnel import fresnel_reflection
+
+size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+iza = np.random.uniform(0, 70, size)
+epsilon = np.random.uniform(3, 30, size) - 1j * np.random.uniform(0, 5, size)
+angles = Angles(iza=iza, vza=30, raa=0)
+
+
+def loop(iza, epsilon):
+    result = np.empty(iza.shape, dtype=np.complex128)
+
+    for i in range(iza.shape[0]):
+        mui, sini = math.cos(iza[i]), math.sin(iza[i])
+        root = cmath.sqrt(epsilon[i] - sini ** 2)
+        result[i] = (mui - root) / (mui + root)
+
+    return result
+
+
+# The loop is timed on a subset and extrapolated.
+subset = min(size, 10 ** 5)
+runtime = min(timeit.repeat(lambda: loop(angles.iza[:subset], epsilon[:subset]), number=1, repeat=3))
+
+print("Elements: {0}".format(size))
+print("{0:<12} {1:>8} {2:>12} {3:>10}".format("method", "workers", "time [ms]", "speedup"))
+reference = runtime * size / subset
+print("{0:<12} {1:>8} {2:>12.2f} {3:>10.2f}".format("loop", 1, reference * 1e3, 1.))
+
+workers_list = [None, 1]
+while workers_list[-1] * 2 <= max_workers:
+    workers_list.append(workers_list[-1] * 2)
+
+for workers in workers_list:
+    runtime = min(timeit.repeat(lambda: fresnel_reflection(angles, epsilon, 'H', workers=workers), number=1,
+                                repeat=3))
+
+    print("{0:<12} {1:>8} {2:>12.2f} {3:>10.2f}".format("vectorized", str(workers), runtime * 1e3,
+                                                        reference / runtime))
@@ -0,0 +1,40 @@
+"""
+Benchmark of the thread-parallel blockwise evaluation of the conversion kernels.
+
+Usage: python benchmarks/bench_parallel.py [size] [max_workers]
+"""
+from __future__ import division, print_function
+
+import sys
+import timeit
+
+import numpy as np
+
+from respy import dB, linear, BRDF, BSC
+
+size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+value = np.random.uniform(0.001, 0.5, size)
+vza = np.random.uniform(0.1, 1.0, size)
+
+KERNELS = (('dB', lambda workers: dB(value, workers=workers)),
+           ('linear', lambda workers: linear(value, workers=workers)),
+           ('BRDF', lambda workers: BRDF(value, vza, workers=workers)),
+           ('BSC', lambda workers: BSC(value, vza, workers=workers)))
+
+workers_list = [1]
+while workers_list[-1] * 2 <= max_workers:
+    workers_list.append(workers_list[-1] * 2)
+
+print("Elements: {0}".format(size))
+print("{0:<8} {1:>8} {2:>12} {3:>10}".format("kernel", "workers", "time [ms]", "speedup"))
+
+for name, kernel in KERNELS:
+    reference = None
+
+    for workers in workers_list:
+        runtime = min(timeit.repeat(lambda: kernel(workers), number=1, repeat=5))
+        reference = runtime if reference is None else reference
+
+        print("{0:<8} {1:>8} {2:>12.2f} {3:>10.2f}".format(name, workers, runtime * 1e3, reference / runtime))
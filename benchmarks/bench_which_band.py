@@ -0,0 +1,42 @@
+"""
+Benchmark of the vectorized band lookup against the former Python loop implementation.
+
+Usage: python benchmarks/bench_which_band.py [size]
+"""
+from __future__ import division, print_function
+
+import sys
+import timeit
+
+import numpy as np
+
+from respy import which_band
+from respy.emw.emw import EMS
+
+
+def which_band_loop(frequence):
+    """
+    Former implementation: O(N x B) Python loop over all elements and bands (including SLF).
+    """
+    item_list = list()
+    for i in range(frequence.shape[0]):
+        for item in EMS:
+            if EMS[item][0] <= frequence[i] <= EMS[item][-1]:
+                item_list.append(item)
+
+    return list(set(item_list))
+
+
+size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+frequency = 10 ** np.random.uniform(-8, 7, size)
+
+loop_size = min(size, 10 ** 5)
+loop = min(timeit.repeat(lambda: which_band_loop(frequency[:loop_size]), number=1, repeat=3)) * size / loop_size
+vectorized = min(timeit.repeat(lambda: which_band(frequency), number=1, repeat=5))
+
+assert set(which_band(frequency[:loop_size])) == set(which_band_loop(frequency[:loop_size]))
+
+print("Elements            : {0}".format(size))
+print("Python loop [ms]    : {0:.1f} (extrapolated from {1} elements)".format(loop * 1e3, loop_size))
+print("searchsorted [ms]   : {0:.1f}".format(vectorized * 1e3))
+print("Speedup             : {0:.0f}".format(loop / vectorized))
@@ -1,6 +1,12 @@
 from .angles import Angles
 from .auxiliary import (rad, deg, sec, cot, align_all, max_length, asarrays, same_len, stacks, zeros_likes, inf_to_num,
                         get_geometries, PI, C, RAD_TO_DEG, DEG_TO_RAD)
-from .conversion import dB, linear, BSC, BRDF, BRF, Conversion
+from .conversion import (dB, linear, BSC, BRDF, BRF, Conversion, cos_angle, convert, block_reduce, multilook,
+                         boxcar, intensity, complex_to_BSC, radiometric)
 from .emw import (EMW, compute_wavelength, compute_frequency, compute_wavenumber, convert_frequency,
-                  convert_wavelength, select_band, select_region, which_band, which_region)
+                  convert_wavelength, select_band, select_region, which_band, which_region, band_codes, region_codes,
+                  register_band, BandRegistry)
+
+# The subsystems respy.streaming, respy.statistics, respy.normalization, respy.calibration, respy.fresnel,
+# respy.roughness, respy.srf, respy.emw.grid and respy.emw.converter are not imported here to keep the import of
+# respy fast. Import them as submodules, e.g. from respy.srf import SpectralResponse.
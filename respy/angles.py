@@ -3,7 +3,7 @@ import sys
 import warnings
 
 import numpy as np
-from respy.auxiliary import (sec, align_all, asarrays, DTYPES, PI)
+from respy.auxiliary import (sec, align_all, asarrays, digitize, DTYPES, PI)
 
 # python 3.6 comparability
 if sys.version_info < (3, 0):
@@ -56,6 +56,8 @@ class Angles(object):
             The result of (1/cos(vza)+1/cos(iza)).
         mui, muv : array_like
             Cosine of iza and vza in [RAD].
+        sini : array_like
+            Sine of iza in [RAD].
         geometries : tuple
             If raa is defined it shows a tuple with (iza, vza, raa, alpha, beta) in [RAD]. If iaa and vaa is defined
             the tuple will be (iza, vza, iaa, vaa, alpha, beta) in [RAD]
@@ -74,6 +76,7 @@ class Angles(object):
         Methods
         -------
         align_with : Expand all input values to the same length depend on an external array.
+        digitize : Find the bin indices of an angle for arbitrary bin edges.
 
         Note
         ----
@@ -166,6 +169,8 @@ class Angles(object):
         self.__norm = None
         self.__dtype = dtype
 
+        self.__reset_cache()
+
         self.angle_unit = angle_unit
         self.align = align
 
@@ -468,8 +473,37 @@ class Angles(object):
         Returns
         -------
         mui : array_like
+
+        Note
+        ----
+        The cosine is computed once and cached until the angles change. The cached array is read-only and in-place
+        changes of the angle arrays (e.g. through Angles.iza) are not tracked.
+        """
+        if self.__mui is None:
+            self.__mui = np.cos(self.__array[0])
+            self.__mui.flags.writeable = False
+
+        return self.__mui
+
+    @property
+    def sini(self):
         """
-        return np.cos(self.__array[0])
+        Access the sine zenith angle of incidence [RAD].
+
+        Returns
+        -------
+        sini : array_like
+
+        Note
+        ----
+        The sine is computed once and cached until the angles change. The cached array is read-only and in-place
+        changes of the angle arrays (e.g. through Angles.iza) are not tracked.
+        """
+        if self.__sini is None:
+            self.__sini = np.sin(self.__array[0])
+            self.__sini.flags.writeable = False
+
+        return self.__sini
 
     @property
     def muv(self):
@@ -478,9 +512,18 @@ class Angles(object):
 
         Returns
         -------
-        mui : array_like
+        muv : array_like
+
+        Note
+        ----
+        The cosine is computed once and cached until the angles change. The cached array is read-only and in-place
+        changes of the angle arrays (e.g. through Angles.iza) are not tracked.
         """
-        return np.cos(self.__array[1])
+        if self.__muv is None:
+            self.__muv = np.cos(self.__array[1])
+            self.__muv.flags.writeable = False
+
+        return self.__muv
 
     @property
     def phi(self):
@@ -568,6 +611,7 @@ class Angles(object):
 
         self.__array = self.__change_dtype(self.__array, self.__nbar, self.__dtype)
         self.__arrayDeg = self.__change_dtype(self.__arrayDeg, self.__nbarDeg, self.__dtype)
+        self.__reset_cache()
 
     @property
     def nbar(self):
@@ -601,6 +645,7 @@ class Angles(object):
         if self.normalize is True:
             self.__array[0][-1] = self.__nbar
             self.__arrayDeg[0][-1] = self.__nbarDeg
+            self.__reset_cache()
 
         else:
             pass
@@ -637,6 +682,7 @@ class Angles(object):
         if self.normalize is True:
             self.__array[0][-1] = self.__nbar
             self.__arrayDeg[0][-1] = self.__nbarDeg
+            self.__reset_cache()
 
         else:
             pass
@@ -682,6 +728,7 @@ class Angles(object):
                 self.__normalize = value
                 self.__array = self.__normalize_angles(self.__array, self.__nbar)
                 self.__arrayDeg = self.__normalize_angles(self.__arrayDeg, self.__nbar)
+                self.__reset_cache()
         else:
             if self.__normalize is False:
                 pass
@@ -689,6 +736,7 @@ class Angles(object):
                 self.__array = np.delete(self.__array, np.s_[-1:], axis=1)
                 self.__arrayDeg = np.delete(self.__arrayDeg, np.s_[-1:], axis=1)
                 self.__normalize = value
+                self.__reset_cache()
 
     # ------------------------------------------------------------------------------------------------------------------
     # Public Methods
@@ -734,9 +782,35 @@ class Angles(object):
 
         self.__array = np.asarray(data[-7:])
         self.__arrayDeg = np.asarray(dataDeg[-7:])
+        self.__reset_cache()
 
         return data[0:-7]
 
+    def digitize(self, edges=0.5, field='izaDeg'):
+        """
+        Find the bin indices of an angle.
+
+        Parameters
+        ----------
+        edges : float or array_like
+            Monotonically increasing bin edges or, if edges is a scalar, the width of equally spaced bins which cover
+            the range of the angle. Default is 0.5.
+        field : str
+            Name of the angle attribute, e.g. 'izaDeg', 'vza' or 'raaDeg'. Default is 'izaDeg'.
+
+        Returns
+        -------
+        index, edges : array_like
+            Bin index of each angle and the bin edges. The bins are half-open [a, b) except the last bin which
+            includes the right edge. Angles outside of the bins have the index -1.
+        """
+        try:
+            angle = np.asarray(getattr(self, field))
+        except AttributeError:
+            raise ValueError("The field {0} is not an attribute of Angles.".format(str(field)))
+
+        return digitize(angle, edges)
+
     # ------------------------------------------------------------------------------------------------------------------
     # Private Methods
     # ------------------------------------------------------------------------------------------------------------------
@@ -752,3 +826,9 @@ class Angles(object):
     def __change_dtype(self, array, nbar, dtype):
         array = array.astype(dtype)
         return self.__normalize_angles(array, nbar)
+
+    # Private Methods for Caching --------------------------------------------------------------------------------------
+    def __reset_cache(self):
+        self.__mui = None
+        self.__muv = None
+        self.__sini = None
@@ -13,6 +13,9 @@ C = 299792458
 RAD_TO_DEG = 180.0 / PI
 DEG_TO_RAD = PI / 180.0
 
+TILE_SIZE = 2 ** 22
+
+
 def rad(angle):
     """
     Convert degrees to radians.
@@ -177,6 +180,91 @@ def inf_to_num(data, num=0, nan=True):
         return data
 
 
+def tiles(shape, tile_size=TILE_SIZE):
+    """
+    Split an array shape into tiles with a bounded number of elements.
+
+    The tiles are contiguous slices along the leading axes of the array. If a single slice of an axis has more
+    elements than tile_size, the next axis is split too.
+
+    Parameters
+    ----------
+    shape : tuple
+        Shape of the array.
+    tile_size : int
+        Maximum number of elements per tile. Default is 2**22.
+
+    Returns
+    -------
+    tiles : generator
+        A generator of tuples with slices.
+    """
+    shape = tuple(shape)
+    tile_size = int(tile_size) if tile_size > 1 else 1
+
+    if len(shape) == 0:
+        yield ()
+        return
+
+    # Find the first axis whose trailing elements fit into a single tile.
+    axis = 0
+    trailing = int(np.prod(shape[1:]))
+    while trailing > tile_size and axis < len(shape) - 1:
+        axis += 1
+        trailing = int(np.prod(shape[axis + 1:]))
+
+    step = tile_size // trailing if trailing > 0 else tile_size
+    step = step if step > 1 else 1
+
+    for index in np.ndindex(*shape[:axis]):
+        for start in range(0, shape[axis], step):
+            yield tuple(index) + (slice(start, min(start + step, shape[axis])),)
+
+
+def digitize(data, edges):
+    """
+    Find the bin indices of values for arbitrary or equally spaced bins.
+
+    Parameters
+    ----------
+    data : array_like
+        Values.
+    edges : float or array_like
+        Monotonically increasing bin edges or, if edges is a scalar, the width of equally spaced bins which cover
+        the range of the finite values of data.
+
+    Returns
+    -------
+    index, edges : array_like
+        Bin index of each value and the bin edges. The bins are half-open [a, b) except the last bin which
+        includes the right edge. Values outside of the bins have the index -1.
+    """
+    data = np.atleast_1d(asarray(data, dtype=np.double))
+
+    if np.ndim(edges) == 0:
+        width = float(edges)
+
+        if width <= 0:
+            raise ValueError("The bin width must be greater than 0.")
+
+        finite = data[np.isfinite(data)]
+
+        # Without finite values there is a single empty bin [0, width).
+        if finite.size == 0:
+            edges = np.asarray([0., width])
+        else:
+            lower = np.floor(finite.min() / width) * width
+            edges = lower + width * np.arange(int(np.floor((finite.max() - lower) / width)) + 2)
+    else:
+        edges = asarray(edges, dtype=np.double)
+
+    index = np.searchsorted(edges, data, side='right') - 1
+    index[data == edges[-1]] = len(edges) - 2
+    index[(index < 0) | (index > len(edges) - 2) | np.isnan(data)] = -1
+
+    return index, edges
+
+
 def get_geometries(type='HB'):
     """
     Function to return typical geometries for different aquicistions.
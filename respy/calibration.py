@@ -0,0 +1,223 @@
+from __future__ import division
+
+import numpy as np
+
+from respy.auxiliary import TILE_SIZE
+from respy.conversion import complex_to_BSC
+from respy.streaming import open_cube, create_cube, process_tiles
+
+
+class CalibrationLUT(object):
+    def __init__(self, lines, pixels, values, shape=None):
+        """
+        Calibration look-up table (LUT) defined at sparse tie points.
+
+        Calibration products (e.g. the sigma0, beta0 or gamma0 vectors of Sentinel-1) define the calibration
+        constants only at sparse lines and pixels. The LUT is expanded to full resolution lazily with a bilinear
+        interpolation for single tiles, so a full-size gain raster is never held in memory.
+
+        Parameters
+        ----------
+        lines : array_like
+            Increasing line (row) numbers of the tie points with shape (L,).
+        pixels : array_like
+            Increasing pixel (column) numbers of the tie points. Either shape (P,) if all lines share the same
+            pixels or shape (L, P) for individual pixels per line.
+        values : array_like
+            Calibration constants at the tie points with shape (L, P).
+        shape : tuple, optional
+            (rows, columns) of the calibrated image. Default is the extent of the tie points, i.e.
+            (lines[-1] + 1, max(pixels) + 1).
+
+        Attributes
+        ----------
+        lines, pixels, values : array_like
+            Tie points and calibration constants. pixels has always the shape (L, P).
+        shape : tuple
+            (rows, columns) of the calibrated image.
+
+        Methods
+        -------
+        tile : Interpolate the LUT for a tile.
+
+        Note
+        ----
+        Outside of the tie points the constants of the outermost tie points are used. A tile can also be accessed
+        with slices: CalibrationLUT[row_start:row_stop, col_start:col_stop]. Open and negative slice bounds refer to
+        shape and the step of the slices must be 1.
+        """
+        lines = np.asarray(lines, dtype=np.double)
+        values = np.asarray(values, dtype=np.double)
+        pixels = np.asarray(pixels, dtype=np.double)
+
+        if values.ndim != 2 or values.shape[0] != lines.shape[0]:
+            raise ValueError("The values must have the shape (len(lines), len(pixels)). The actual shape is "
+                             "{0}".format(str(values.shape)))
+
+        if pixels.ndim == 1:
+            pixels = np.broadcast_to(pixels, values.shape)
+
+        if pixels.shape != values.shape:
+            raise ValueError("The shape of pixels {0} must agree with the shape of values {1}.".format(
+                str(pixels.shape), str(values.shape)))
+
+        if lines.shape[0] > 1 and np.any(np.diff(lines) <= 0):
+            raise ValueError("The lines must be strictly increasing.")
+
+        if shape is None:
+            shape = (int(np.ceil(lines[-1])) + 1, int(np.ceil(pixels.max())) + 1)
+
+        self.lines = lines
+        self.pixels = pixels
+        self.values = values
+        self.shape = tuple(int(item) for item in shape)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Magic Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def __getitem__(self, key):
+        if not isinstance(key, tuple) or len(key) != 2 or not all(isinstance(item, slice) for item in key):
+            raise IndexError("A CalibrationLUT can only be accessed with two slices (rows, columns).")
+
+        ranges = list()
+
+        for item, size in zip(key, self.shape):
+            start, stop, step = item.indices(size)
+
+            if step != 1:
+                raise IndexError("The step of the slices must be 1. The actual step is {0}".format(str(step)))
+
+            ranges.append((start, stop if stop > start else start))
+
+        return self.tile(*ranges)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Public Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def tile(self, rows, cols):
+        """
+        Interpolate the calibration constants for a tile.
+
+        Parameters
+        ----------
+        rows, cols : tuple
+            (start, stop) of the rows and columns of the tile. stop is exclusive.
+
+        Returns
+        -------
+        values : array_like
+            Calibration constants with the shape (rows[1] - rows[0], cols[1] - cols[0]).
+        """
+        row = np.arange(rows[0], rows[1], dtype=np.double)
+        col = np.arange(cols[0], cols[1], dtype=np.double)
+
+        if row.shape[0] == 0:
+            return np.empty((0, col.shape[0]))
+
+        if self.lines.shape[0] == 1:
+            return np.broadcast_to(self.__interpolate_line(0, col), (row.shape[0], col.shape[0])).copy()
+
+        index = np.clip(np.searchsorted(self.lines, row, side='right') - 1, 0, self.lines.shape[0] - 2)
+        weight = np.clip((row - self.lines[index]) / (self.lines[index + 1] - self.lines[index]), 0., 1.)
+
+        # Only the few tie point lines that bracket the tile are interpolated along the pixels.
+        needed = np.unique(np.concatenate((index, index + 1)))
+        position = np.searchsorted(needed, np.arange(self.lines.shape[0]))
+        interpolated = np.asarray([self.__interpolate_line(item, col) for item in needed])
+
+        upper = interpolated[position[index + 1]]
+        result = interpolated[position[index]]
+        result *= (1. - weight)[:, np.newaxis]
+        result += weight[:, np.newaxis] * upper
+
+        return result
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Private Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def __interpolate_line(self, line, col):
+        return np.interp(col, self.pixels[line], self.values[line])
+
+
+def calibrate(src, dst, lut, output='BSCdB', interleaved=False, shape=None, dtype=None, offset=0,
+              out_dtype=np.float32, tile_size=TILE_SIZE, callback=None, verbose=False):
+    """
+    Calibrate a complex or detected image on disk tile by tile.
+
+    For each tile the sparse calibration LUT is interpolated to full resolution and applied with
+    respy.conversion.complex_to_BSC, i.e. BSC = abs(DN)**2 / A**2.
+
+    Parameters
+    ----------
+    src : str or numpy.ndarray
+        Input image with shape (rows, cols). A path to a '.npy' or raw binary file or an (memory-mapped) array. The
+        image can be complex, real (detected amplitudes) or, if interleaved is True, real with interleaved real and
+        imaginary parts and shape (rows, 2 * cols).
+    dst : str or numpy.ndarray
+        Output image. A path to a '.npy' or raw binary file or a writable (memory-mapped) array.
+    lut : CalibrationLUT
+        Calibration constants (e.g. sigmaNought of Sentinel-1).
+    output : {'BSC', 'BSCdB'}
+        Output unit. Default is 'BSCdB'.
+    interleaved : bool
+        Set to True if src contains interleaved real and imaginary parts. Default is False.
+    shape, dtype, offset : optional
+        Shape, data type and byte offset of a raw binary input file. See respy.streaming.open_cube.
+    out_dtype : numpy.dtype
+        Data type of a newly created output file. Default is np.float32.
+    tile_size : int
+        Maximum number of elements per tile. Default is 2**22.
+    callback : callable, optional
+        A function callback(done, total, elapsed) which is called after each tile.
+    verbose : bool
+        If True, the progress and throughput is printed to stdout. Default is False.
+
+    Returns
+    -------
+    report : dict
+        See respy.streaming.process_tiles.
+    """
+    image = src if isinstance(src, np.ndarray) else open_cube(src, shape=shape, dtype=dtype, offset=offset)
+
+    if image.ndim != 2:
+        raise ValueError("The image must have two dimensions. The actual shape is {0}".format(str(image.shape)))
+
+    factor = 2 if interleaved else 1
+    nrows, ncols = image.shape[0], image.shape[1] // factor
+
+    if isinstance(dst, np.ndarray):
+        result = dst
+    else:
+        result = create_cube(dst, (nrows, ncols), out_dtype)
+
+    if result.shape != (nrows, ncols):
+        raise ValueError("The shape of dst {0} must be {1}.".format(str(result.shape), str((nrows, ncols))))
+
+    def func(tile):
+        rows, cols = _tile_ranges(tile, result.shape)
+        shape = np.shape(result[tile])
+
+        gains = lut.tile(rows, cols)
+        data = image[rows[0]:rows[1], factor * cols[0]:factor * cols[1]]
+
+        return complex_to_BSC(data, gains, output=output, interleaved=interleaved).reshape(shape)
+
+    return process_tiles(func, result, tile_size=tile_size, callback=callback, verbose=verbose,
+                         itemsize=image.dtype.itemsize * factor)
+
+
+def _tile_ranges(tile, shape):
+    """
+    Convert a tile of respy.auxiliary.tiles of a 2-D array into (start, stop) ranges of rows and columns.
+    """
+    ranges = list()
+
+    for axis in range(2):
+        item = tile[axis] if axis < len(tile) else slice(0, shape[axis])
+
+        if isinstance(item, slice):
+            ranges.append((item.start, item.stop))
+        else:
+            ranges.append((int(item), int(item) + 1))
+
+    return tuple(ranges)
@@ -1,8 +1,11 @@
 from __future__ import division
 
+import numpy as np
 from numpy import cos, log10, errstate, nan_to_num
 
-from respy.auxiliary import rad, PI
+from respy.angles import Angles
+from respy.auxiliary import rad, tiles, PI, TILE_SIZE
+from respy.parallel import blockwise
 
 
 class Conversion(object):
@@ -14,17 +17,19 @@ class Conversion(object):
         ----------
         value : float, array_like
             Input value in BRDF, BRF, BSC or BSCdB. See parameter value_unit.
-        vza : int, float, array_like
-            Viewing zenith angle in DEG or RAD. See parameter angle_unit.
+        vza : int, float, array_like or Angles
+            Viewing zenith angle in DEG or RAD, or its cosine. See parameter angle_unit. If vza is an Angles object
+            the cached cosine of the viewing zenith angle (Angles.muv) is used and angle_unit is ignored.
         value_unit : {'BRDF', 'BRF', 'BSC', 'BSCdB'}
             The unit of input value:
             * BRDF : Bidirectional Reflectance Distribution Function (Intensity) (default).
             * BRF : Bidirectional Reflectance Factor.
             * BSC : Back Scattering Coefficient (no unit).
             *BSCdB : Back Scattering Coefficient in dB.
-        angle_unit : {'DEG', 'RAD', 'deg', 'rad'}, optional
+        angle_unit : {'DEG', 'RAD', 'COS', 'deg', 'rad', 'cos'}, optional
             * 'DEG': Input angle in [DEG].
             * 'RAD': Input angle  in [RAD] (default).
+            * 'COS': Input is the precomputed cosine of the angle.
 
         Attributes
         ----------
@@ -52,36 +57,41 @@ class Conversion(object):
         """
         self.value_unit = value_unit
 
-        if angle_unit is "rad":
+        if angle_unit == "rad":
             angle_unit = "RAD"
-        elif angle_unit is "deg":
+        elif angle_unit == "deg":
             angle_unit = "DEG"
+        elif angle_unit == "cos":
+            angle_unit = "COS"
 
         self.angle_unit = angle_unit
 
+        # The cosine of vza is computed only once for all conversions.
+        muv = cos_angle(vza, self.angle_unit)
+
         if self.value_unit is "BRDF":
             self.BRDF = value
-            self.BSC = BSC(value, vza, self.angle_unit)
-            self.BSCdB = dB(BSC(value, vza, self.angle_unit))
+            self.BSC = BSC(value, muv, 'COS')
+            self.BSCdB = dB(self.BSC)
             self.BRF = BRF(value)
 
         elif self.value_unit is "BSC":
             self.BSC = value
-            self.BRDF = BRDF(value, vza, self.angle_unit)
+            self.BRDF = BRDF(value, muv, 'COS')
             self.BRF = BRF(self.BRDF)
             self.BSCdB = dB(value)
 
         elif self.value_unit is "BSCdB":
             self.BSCdB = value
             self.BSC = linear(value)
-            self.BRDF = BRDF(self.BSC, vza, self.angle_unit)
+            self.BRDF = BRDF(self.BSC, muv, 'COS')
             self.BRF = BRF(self.BRDF)
 
         elif self.value_unit is "BRF":
             self.BRF = value
             self.BRDF = value / PI
-            self.BSC = BSC(self.BRDF, vza, self.angle_unit)
-            self.BSCdB = dB(BSC(self.BRDF, vza, self.angle_unit))
+            self.BSC = BSC(self.BRDF, muv, 'COS')
+            self.BSCdB = dB(self.BSC)
 
         else:
             raise ValueError("the unit of value must be 'BRDF', 'BRF', 'BSC' or 'BSCdB'")
@@ -96,22 +106,66 @@ class Conversion(object):
         return linear(x)
 
 
-def dB(x):
+def cos_angle(angle, angle_unit='RAD'):
+    """
+    Cosine of an angle for the conversion routines.
+
+    Parameters
+    ----------
+    angle : int, float, array_like or Angles
+        Angle in [RAD] or [DEG] or the precomputed cosine of the angle. If angle is an Angles object, the cached
+        cosine of the viewing zenith angle (Angles.muv) is returned.
+    angle_unit : {'DEG', 'RAD', 'COS'} (default = 'RAD'), optional
+        * 'DEG': Input angle is in [DEG].
+        * 'RAD': Input angle is in [RAD].
+        * 'COS': Input angle is already the cosine of the angle.
+
+    Returns
+    -------
+    cosine : int, float or array_like
+    """
+    if isinstance(angle, Angles):
+        return angle.muv
+
+    if angle_unit == 'RAD':
+        return cos(angle)
+    elif angle_unit == 'DEG':
+        return cos(rad(angle))
+    elif angle_unit == 'COS':
+        return angle
+    else:
+        raise ValueError("angle_unit must be 'RAD', 'DEG' or 'COS'")
+
+
+def dB(x, workers=None):
     """
     Convert a linear value to dB.
+
+    Parameters
+    ----------
+    x : int, float or array_like
+        Linear value.
+    workers : int, optional
+        Number of threads for a blockwise evaluation of large arrays. Default is None (single-threaded).
     """
-    with errstate(invalid='ignore'):
-        return nan_to_num(10 * log10(x))
+    return blockwise(_dB, (x,), workers)
 
 
-def linear(x):
+def linear(x, workers=None):
     """
     Convert a dB value in linear.
+
+    Parameters
+    ----------
+    x : int, float or array_like
+        Value in dB.
+    workers : int, optional
+        Number of threads for a blockwise evaluation of large arrays. Default is None (single-threaded).
     """
-    return 10 ** (x / 10)
+    return blockwise(_linear, (x,), workers)
 
 
-def BRDF(BSC, vza, angle_unit='RAD'):
+def BRDF(BSC, vza, angle_unit='RAD', workers=None):
     """
     Convert a Radar Backscatter Coefficient (BSC) into a BRDF.
 
@@ -123,24 +177,24 @@ def BRDF(BSC, vza, angle_unit='RAD'):
     ----------
     BSC : int, float or array_like
         Radar Backscatter Coefficient (sigma 0).
-    vza : int, float or array_like
-        View or scattering zenith angle.
-    angle_unit : {'DEG', 'RAD'} (default = 'RAD'), optional
+    vza : int, float, array_like or Angles
+        View or scattering zenith angle. If vza is an Angles object the cached cosine Angles.muv is used.
+    angle_unit : {'DEG', 'RAD', 'COS'} (default = 'RAD'), optional
         * 'DEG': All input angles (iza, vza, raa) are in [DEG].
         * 'RAD': All input angles (iza, vza, raa) are in [RAD].
+        * 'COS': vza is the precomputed cosine of the viewing zenith angle.
+    workers : int, optional
+        Number of threads for a blockwise evaluation of large arrays. Default is None (single-threaded).
 
     Returns
     -------
     BRDF value : int, float or array_like
 
     """
-    if angle_unit == 'RAD':
-        return BSC / (cos(vza) * (4 * PI))
+    if isinstance(vza, Angles):
+        vza, angle_unit = vza.muv, 'COS'
 
-    elif angle_unit == 'DEG':
-        return BSC / (cos(rad(vza)) * (4 * PI))
-    else:
-        raise ValueError("angle_unit must be 'RAD' or 'DEG'")
+    return blockwise(lambda value, angle: value / (cos_angle(angle, angle_unit) * (4 * PI)), (BSC, vza), workers)
 
 
 def BRF(BRDF):
@@ -164,7 +218,7 @@ def BRF(BRDF):
     return PI * BRDF
 
 
-def BSC(BRDF, vza, angle_unit='RAD'):
+def BSC(BRDF, vza, angle_unit='RAD', workers=None):
     """
     Convert a BRDF in to a Radar Backscatter Coefficient (BSC).
 
@@ -176,21 +230,466 @@ def BSC(BRDF, vza, angle_unit='RAD'):
     ----------
     BSC : int, float or array_like
         Radar Backscatter Coefficient (sigma 0).
-    vza : int, float or array_like
-        View or scattering zenith angle.
-    angle_unit : {'DEG', 'RAD'} (default = 'RAD'), optional
+    vza : int, float, array_like or Angles
+        View or scattering zenith angle. If vza is an Angles object the cached cosine Angles.muv is used.
+    angle_unit : {'DEG', 'RAD', 'COS'} (default = 'RAD'), optional
         * 'DEG': All input angles (iza, vza, raa) are in [DEG].
         * 'RAD': All input angles (iza, vza, raa) are in [RAD].
+        * 'COS': vza is the precomputed cosine of the viewing zenith angle.
+    workers : int, optional
+        Number of threads for a blockwise evaluation of large arrays. Default is None (single-threaded).
 
     Returns
     -------
     BRDF value : int, float or array_like
 
     """
-    if angle_unit == 'RAD':
-        return BRDF * cos(vza) * 4 * PI
+    if isinstance(vza, Angles):
+        vza, angle_unit = vza.muv, 'COS'
+
+    return blockwise(lambda value, angle: value * cos_angle(angle, angle_unit) * (4 * PI), (BRDF, vza), workers)
+
+
+def convert(value, vza, value_unit='BSCdB', output='BSC', angle_unit='RAD'):
+    """
+    Convert a value between BRDF, BRF, BSC and BSC in dB.
+
+    In contrast to the Conversion class only the requested output is computed and the cosine of vza is only
+    evaluated if the conversion needs it.
+
+    Parameters
+    ----------
+    value : int, float or array_like
+        Input value in BRDF, BRF, BSC or BSCdB. See parameter value_unit.
+    vza : int, float, array_like or Angles
+        Viewing zenith angle in DEG or RAD, or its cosine. See parameter angle_unit.
+    value_unit, output : {'BRDF', 'BRF', 'BSC', 'BSCdB'}
+        The unit of the input value and the desired output unit.
+    angle_unit : {'DEG', 'RAD', 'COS'} (default = 'RAD'), optional
+        * 'DEG': Input angle in [DEG].
+        * 'RAD': Input angle  in [RAD].
+        * 'COS': Input is the precomputed cosine of the angle.
+
+    Returns
+    -------
+    value : int, float or array_like
+        Value in the unit of output.
+
+    See Also
+    --------
+    respy.Conversion
+    """
+    units = ('BRDF', 'BRF', 'BSC', 'BSCdB')
+
+    if value_unit not in units or output not in units:
+        raise ValueError("the unit of value and output must be 'BRDF', 'BRF', 'BSC' or 'BSCdB'")
+
+    if value_unit == output:
+        return value
+
+    if value_unit == 'BSC' and output == 'BSCdB':
+        return dB(value)
+    elif value_unit == 'BSCdB' and output == 'BSC':
+        return linear(value)
+
+    # Convert to BRDF -------------------------------------------------------------------------------------------------
+    if value_unit == 'BRF':
+        value = value / PI
+    elif value_unit == 'BSC':
+        value = BRDF(value, vza, angle_unit)
+    elif value_unit == 'BSCdB':
+        value = BRDF(linear(value), vza, angle_unit)
+
+    # Convert BRDF to Output ------------------------------------------------------------------------------------------
+    if output == 'BRF':
+        return BRF(value)
+    elif output == 'BSC':
+        return BSC(value, vza, angle_unit)
+    elif output == 'BSCdB':
+        return dB(BSC(value, vza, angle_unit))
+    else:
+        return value
+
+
+def block_reduce(value, block, unit='dB', output=None, tile_size=TILE_SIZE):
+    """
+    Average non-overlapping blocks of the trailing axes in linear space.
+
+    Speckled backscatter must be averaged in linear units. The input is processed in tiles of whole blocks: each tile
+    is converted to linear units, averaged with a strided reshape and converted to the desired output unit, so no
+    full-size linear copy of the input is created.
+
+    Parameters
+    ----------
+    value : array_like
+        Input values.
+    block : int or tuple
+        Size of the blocks. An integer or a tuple with one size for each of the trailing axes of value. If the shape
+        of an axis is not a multiple of the block size, the remaining elements at the end of the axis are discarded.
+    unit : {'dB', 'linear'}
+        Unit of the input values. Default is 'dB'.
+    output : {'dB', 'linear'}, optional
+        Unit of the output. Default is the unit of the input.
+    tile_size : int
+        Maximum number of input elements per tile. Default is 2**22.
+
+    Returns
+    -------
+    value : array_like
+        Block averaged values.
+
+    See Also
+    --------
+    respy.multilook
+    respy.boxcar
+    """
+    output = _check_units(unit, output)
+    value = np.asarray(value)
+
+    block = (int(block),) if np.ndim(block) == 0 else tuple(int(item) for item in block)
+    naxes = len(block)
+
+    if naxes > value.ndim:
+        raise ValueError("The block {0} has more dimensions than the value {1}.".format(str(block), str(value.shape)))
+
+    nlead = value.ndim - naxes
+    lead = value.shape[:nlead]
+    counts = tuple(size // item for size, item in zip(value.shape[nlead:], block))
+    axes = tuple(nlead + 2 * i + 1 for i in range(naxes))
+
+    result = np.empty(lead + counts)
+
+    for tile in tiles(result.shape, tile_size // int(np.prod(block))):
+        # Integer indices of the tile are kept as slices of length 1, so the tile has the dimensions of result.
+        tile = tuple(item if isinstance(item, slice) else slice(item, item + 1) for item in tile)
+        tile = tile + tuple(slice(0, size) for size in result.shape[len(tile):])
+
+        source = tile[:nlead] + tuple(slice(item.start * size, item.stop * size)
+                                      for item, size in zip(tile[nlead:], block))
+
+        chunk = np.asarray(value[source], dtype=np.double)
+        chunk = _linear(chunk) if unit == 'dB' else chunk
+
+        shape = chunk.shape[:nlead]
+        for count, item in zip(chunk.shape[nlead:], block):
+            shape = shape + (count // item, item)
+
+        result[tile] = chunk.reshape(shape).mean(axis=axes)
+
+    return _from_linear(result, output)
+
+
+def multilook(value, looks, unit='dB', output=None):
+    """
+    Multilook an image by averaging looks[0] x looks[1] pixel blocks in linear space.
+
+    Parameters
+    ----------
+    value : array_like
+        Input image. The last two axes are the azimuth and range axes.
+    looks : int or tuple
+        Number of looks in azimuth and range. An integer means the same number of looks in both directions.
+    unit : {'dB', 'linear'}
+        Unit of the input values. Default is 'dB'.
+    output : {'dB', 'linear'}, optional
+        Unit of the output. Default is the unit of the input.
+
+    Returns
+    -------
+    value : array_like
+        Multilooked image.
+
+    See Also
+    --------
+    respy.block_reduce
+    """
+    looks = (looks, looks) if np.ndim(looks) == 0 else tuple(looks)
+
+    if len(looks) != 2:
+        raise ValueError("The parameter looks must be an integer or a tuple with two integers.")
+
+    return block_reduce(value, looks, unit=unit, output=output)
+
+
+def boxcar(value, size, unit='dB', output=None):
+    """
+    Moving average (boxcar filter) of an image in linear space.
+
+    The window sums are computed with cumulative sums, so the cost is independent of the window size. At the edges
+    of the image the average is computed over the part of the window that lies inside the image.
+
+    Parameters
+    ----------
+    value : array_like
+        Input image. The filter is applied along the last two axes.
+    size : int or tuple
+        Size of the window in azimuth and range. An integer means a square window.
+    unit : {'dB', 'linear'}
+        Unit of the input values. Default is 'dB'.
+    output : {'dB', 'linear'}, optional
+        Unit of the output. Default is the unit of the input.
+
+    Returns
+    -------
+    value : array_like
+        Filtered image with the shape of value.
+    """
+    size = (size, size) if np.ndim(size) == 0 else tuple(size)
+
+    if len(size) != 2:
+        raise ValueError("The parameter size must be an integer or a tuple with two integers.")
+
+    value, output = _to_linear(value, unit, output)
+
+    if value.ndim < 2:
+        raise ValueError("The value must have at least two dimensions.")
+
+    for axis, width in zip((-2, -1), size):
+        value = _moving_sum(value, width, axis)
+
+    counts = _moving_sum(np.ones(value.shape[-2:]), size[0], 0)
+    counts = _moving_sum(counts, size[1], 1)
 
+    return _from_linear(value / counts, output)
+
+
+def intensity(z, interleaved=False, out=None, workers=1):
+    """
+    Compute the intensity abs(z)**2 of complex (single look complex) data.
+
+    The intensity is computed from the real and imaginary parts as strided views without an intermediate complex
+    or amplitude array. The output has the floating precision of the input, e.g. float32 for complex64.
+
+    Parameters
+    ----------
+    z : array_like
+        Complex values or, if interleaved is True, real values with interleaved real and imaginary parts in the
+        last axis, e.g. a float32 or int16 buffer [re, im, re, im, ...].
+    interleaved : bool
+        Set to True if z contains interleaved real and imaginary parts. Default is False.
+    out : array_like, optional
+        Array in which the result is written.
+    workers : int or None
+        Number of threads. The evaluation is done in blocks to bound the size of temporary arrays. Default is 1.
+
+    Returns
+    -------
+    intensity : array_like
+    """
+    real, imag = _complex_parts(z, interleaved)
+
+    return blockwise(_intensity, (real, imag), workers=workers, out=out)
+
+
+def complex_to_BSC(z, calibration=1., output='BSCdB', interleaved=False, out=None, workers=1):
+    """
+    Convert complex (single look complex) data into a calibrated Radar Backscatter Coefficient (BSC).
+
+    Intensity, calibration and the conversion to dB are fused in one blockwise loop. The calibrated backscatter is
+    abs(z)**2 / calibration**2.
+
+    Parameters
+    ----------
+    z : array_like
+        Complex values or, if interleaved is True, real values with interleaved real and imaginary parts in the
+        last axis.
+    calibration : int, float or array_like
+        Calibration constant (e.g. the sigma0 calibration LUT value A). It must be broadcastable to the shape of the
+        complex values. Default is 1.
+    output : {'BSC', 'BSCdB'}
+        Output unit. Default is 'BSCdB'.
+    interleaved : bool
+        Set to True if z contains interleaved real and imaginary parts. Default is False.
+    out : array_like, optional
+        Array in which the result is written.
+    workers : int or None
+        Number of threads. The evaluation is done in blocks to bound the size of temporary arrays. Default is 1.
+
+    Returns
+    -------
+    BSC : array_like
+        Calibrated backscatter in linear units or dB.
+
+    See Also
+    --------
+    respy.intensity
+    """
+    if output == 'BSC':
+        kernel = _calibrate
+    elif output == 'BSCdB':
+        kernel = _calibrate_dB
+    else:
+        raise ValueError("The output must be 'BSC' or 'BSCdB'. The actual output is {0}".format(str(output)))
+
+    real, imag = _complex_parts(z, interleaved)
+
+    return blockwise(kernel, (real, imag, calibration), workers=workers, out=out)
+
+
+def radiometric(value, iza, value_unit='sigma0', output='gamma0', unit='linear', angle_unit='RAD', out=None):
+    """
+    Convert between the radar normalization conventions beta0, sigma0 and gamma0.
+
+    The conventions are related by sigma0 = beta0 * sin(iza) and sigma0 = gamma0 * cos(iza).
+
+    Parameters
+    ----------
+    value : int, float or array_like
+        Backscatter in the convention of value_unit.
+    iza : int, float, array_like or Angles
+        Incidence zenith angle, e.g. the local incidence angle. If iza is an Angles object, the cached cosine and sine
+        of the incidence zenith angle (Angles.mui, Angles.sini) are used and angle_unit is ignored.
+    value_unit, output : {'beta0', 'sigma0', 'gamma0'}
+        Convention of the input value and of the output.
+    unit : {'linear', 'dB'}
+        Unit of value and output. Default is 'linear'.
+    angle_unit : {'DEG', 'RAD'} (default = 'RAD'), optional
+        * 'DEG': iza is in [DEG].
+        * 'RAD': iza is in [RAD].
+    out : array_like, optional
+        Array in which the result is written.
+
+    Returns
+    -------
+    value : int, float or array_like
+        Backscatter in the convention of output.
+    """
+    conventions = ('beta0', 'sigma0', 'gamma0')
+
+    if value_unit not in conventions or output not in conventions:
+        raise ValueError("The value_unit and output must be 'beta0', 'sigma0' or 'gamma0'.")
+
+    _check_units(unit)
+
+    if isinstance(iza, Angles):
+        mui, sini = iza.mui, iza.sini
+    elif angle_unit == 'RAD':
+        mui, sini = np.cos(iza), np.sin(iza)
     elif angle_unit == 'DEG':
-        return BRDF * cos(rad(vza)) * (4 * PI)
+        mui, sini = np.cos(rad(iza)), np.sin(rad(iza))
     else:
         raise ValueError("angle_unit must be 'RAD' or 'DEG'")
+
+    factors = {'beta0': sini, 'sigma0': 1., 'gamma0': mui}
+    numerator, denominator = factors[value_unit], factors[output]
+
+    if unit == 'linear':
+        result = np.multiply(value, numerator, out=out)
+        return np.divide(result, denominator, out=out)
+    else:
+        # The correction is computed before out is written, so out may be value itself.
+        with errstate(divide='ignore', invalid='ignore'):
+            correction = 10 * log10(np.divide(numerator, denominator))
+
+        return np.add(value, correction, out=out)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+# ----------------------------------------------------------------------------------------------------------------------
+def _dB(x):
+    with errstate(invalid='ignore'):
+        return nan_to_num(10 * log10(x))
+
+
+def _linear(x):
+    return 10 ** (x / 10)
+
+
+def _check_units(unit, output=None):
+    """
+    Check that unit and output are 'dB' or 'linear'. Returns output, which defaults to unit.
+    """
+    if unit not in ('dB', 'linear'):
+        raise ValueError("The unit must be 'dB' or 'linear'. The actual unit is {0}".format(str(unit)))
+
+    output = unit if output is None else output
+
+    if output not in ('dB', 'linear'):
+        raise ValueError("The output must be 'dB' or 'linear'. The actual output is {0}".format(str(output)))
+
+    return output
+
+
+def _to_linear(value, unit, output):
+    output = _check_units(unit, output)
+    value = np.asarray(value, dtype=np.double)
+
+    return (_linear(value) if unit == 'dB' else value), output
+
+
+def _from_linear(value, output, keep_nan=False):
+    """
+    Convert linear values into output. Like respy.dB, NaN values become 0 dB unless keep_nan is True, which keeps
+    NaN values (e.g. of empty bins) and converts 0 into -inf.
+    """
+    if output != 'dB':
+        return value
+
+    if keep_nan:
+        with errstate(invalid='ignore', divide='ignore'):
+            return 10 * log10(value)
+
+    return _dB(value)
+
+
+def _moving_sum(value, width, axis):
+    """
+    Centered moving sum along an axis with cumulative sums. The window is truncated at the edges.
+    """
+    value = np.moveaxis(value, axis, -1)
+    n = value.shape[-1]
+
+    cumsum = np.zeros(value.shape[:-1] + (n + 1,))
+    np.cumsum(value, axis=-1, out=cumsum[..., 1:])
+
+    index = np.arange(n)
+    lower = np.clip(index - (width - 1) // 2, 0, n)
+    upper = np.clip(index + width // 2 + 1, 0, n)
+
+    return np.moveaxis(cumsum[..., upper] - cumsum[..., lower], -1, axis)
+
+
+def _complex_parts(z, interleaved):
+    z = np.asarray(z)
+
+    if interleaved:
+        if np.iscomplexobj(z):
+            raise ValueError("Interleaved data must be real.")
+
+        if z.ndim == 0 or z.shape[-1] % 2 != 0:
+            raise ValueError("The last axis of interleaved data must have an even length.")
+
+        return z[..., 0::2], z[..., 1::2]
+
+    if np.iscomplexobj(z):
+        return z.real, z.imag
+
+    return z, np.zeros((), dtype=z.dtype)
+
+
+def _intensity(real, imag):
+    dtype = np.result_type(real.dtype, np.float32)
+
+    result = np.square(real, dtype=dtype)
+    result += np.square(imag, dtype=dtype)
+
+    return result
+
+
+def _calibrate(real, imag, calibration):
+    result = _intensity(real, imag)
+    result /= np.square(calibration, dtype=result.dtype)
+
+    return result
+
+
+def _calibrate_dB(real, imag, calibration):
+    result = _calibrate(real, imag, calibration)
+
+    with errstate(invalid='ignore', divide='ignore'):
+        log10(result, out=result)
+
+    result *= 10
+
+    return nan_to_num(result, copy=False)
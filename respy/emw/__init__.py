@@ -1,2 +1,4 @@
 from .emw import (EMW, compute_wavelength, compute_frequency, compute_wavenumber, convert_frequency,
-                  convert_wavelength, select_band, select_region, which_band, which_region)
+                  convert_wavelength, select_band, select_region, which_band, which_region, band_codes, region_codes,
+                  register_band)
+from .registry import BandRegistry
@@ -55,3 +55,36 @@ def check_unit_wavelength(unit):
         return None
     else:
         raise ValueError("Unit of wavelength must be {0}.".format(str(CONVERT_WAVE.keys())))
+
+# Definition of the grids of each band as (start, stop, step, unit) of np.arange. Bands in wavelength units are
+# converted to frequencies. The dense grids are only generated on request (see respy.emw.select_band).
+BAND_GRIDS = {"GAMMA": (0., 1.1, 0.1, 'nm'),
+              "XRAY": (1.1, 10.1, 0.1, 'nm'),
+              "UV": (10.1, 400, 0.1, 'nm'),
+              "VIS": (400., 751., 1, 'nm'),
+              "NIR": (751., 1001., 1, 'nm'),
+              "SWIR": (1001., 2501., 1, 'nm'),
+              "MWIR": (3000., 5001., 1, 'nm'),
+              "LWIR": (8000., 12001., 1, 'nm'),
+              "L": (1, 2.1, 0.1, 'GHz'),
+              "S": (2.1, 4.1, 0.1, 'GHz'),
+              "C": (4.1, 8.1, 0.1, 'GHz'),
+              "X": (8.1, 12.1, 0.1, 'GHz'),
+              "Ku": (12.1, 18.1, 0.1, 'GHz'),
+              "K": (18.1, 26.6, 0.1, 'GHz'),
+              "Ka": (26.6, 40.1, 0.1, 'GHz'),
+              "V": (50.1, 75.1, 0.1, 'GHz'),
+              "W": (75.1, 110.1, 0.1, 'GHz'),
+              "D": (110.1, 170.1, 0.1, 'GHz'),
+              "ELF": (3, 30.1, 0.1, 'Hz'),
+              "SLF": (30.1, 300.1, 0.1, 'Hz'),
+              "ULF": (300.1, 3000.1, 0.1, 'Hz'),
+              "VLF": (3.1, 30.1, 0.1, 'kHz'),
+              "LF": (30.1, 300.1, 0.1, 'kHz'),
+              "MF": (300.1, 3000.1, 0.1, 'kHz'),
+              "HF": (3.1, 30.1, 0.1, 'MHz'),
+              "VHF": (30.1, 300.1, 0.1, 'MHz'),
+              "UHF": (300.1, 1000, 0.1, 'MHz')}
+
+# A wavelength of zero is replaced by this value (in the unit of the band).
+MIN_WAVELENGTH = 0.0000001
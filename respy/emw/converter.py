@@ -0,0 +1,148 @@
+from __future__ import division
+
+import numpy as np
+
+from respy.auxiliary import PI, C
+from respy.emw.auxiliary import check_unit_frequency, check_unit_wavelength, CONVERT_FREQ, CONVERT_WAVE
+
+
+class UnitConverter(object):
+    def __init__(self, factor, reciprocal=False):
+        """
+        Base class of the precompiled unit converters.
+
+        The units are validated once at construction and all scale factors are folded into a single constant, so a
+        call is a single ufunc: value * factor or, if reciprocal is True, factor / value.
+
+        Parameters
+        ----------
+        factor : float
+            Combined scale factor.
+        reciprocal : bool
+            If True, the converter computes factor / value. Default is False.
+
+        Attributes
+        ----------
+        factor : float
+        reciprocal : bool
+        """
+        self.factor = float(factor)
+        self.reciprocal = reciprocal
+
+    def __call__(self, value, out=None):
+        """
+        Convert values.
+
+        Parameters
+        ----------
+        value : int, float or array_like
+        out : array_like, optional
+            Array in which the result is written.
+
+        Returns
+        -------
+        value : float or array_like
+        """
+        if self.reciprocal:
+            return np.divide(self.factor, value, out=out)
+
+        return np.multiply(value, self.factor, out=out)
+
+    def __repr__(self):
+        return "{0}(factor={1}, reciprocal={2})".format(type(self).__name__, str(self.factor), str(self.reciprocal))
+
+
+class FrequencyToWavelength(UnitConverter):
+    def __init__(self, unit='GHz', output='cm'):
+        """
+        Precompiled conversion of frequencies into wavelengths (see respy.emw.compute_wavelength).
+
+        Parameters
+        ----------
+        unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'}
+            Unit of the frequencies. Default is 'GHz'.
+        output : {'dm', 'nm', 'cm', 'mm', 'm', 'km', 'um'}
+            Unit of the wavelengths. Default is 'cm'.
+        """
+        check_unit_frequency(unit)
+        check_unit_wavelength(output)
+
+        self.unit, self.output = unit, output
+
+        super(FrequencyToWavelength, self).__init__(C * CONVERT_WAVE[output] / CONVERT_FREQ[unit], reciprocal=True)
+
+
+class WavelengthToFrequency(UnitConverter):
+    def __init__(self, unit='cm', output='GHz'):
+        """
+        Precompiled conversion of wavelengths into frequencies (see respy.emw.compute_frequency).
+
+        Parameters
+        ----------
+        unit : {'dm', 'nm', 'cm', 'mm', 'm', 'km', 'um'}
+            Unit of the wavelengths. Default is 'cm'.
+        output : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'}
+            Unit of the frequencies. Default is 'GHz'.
+        """
+        check_unit_wavelength(unit)
+        check_unit_frequency(output)
+
+        self.unit, self.output = unit, output
+
+        super(WavelengthToFrequency, self).__init__(C * CONVERT_WAVE[unit] / CONVERT_FREQ[output], reciprocal=True)
+
+
+class FrequencyToWavenumber(UnitConverter):
+    def __init__(self, unit='GHz', output='cm'):
+        """
+        Precompiled conversion of frequencies into free space wavenumbers (see respy.emw.compute_wavenumber).
+
+        Parameters
+        ----------
+        unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'}
+            Unit of the frequencies. Default is 'GHz'.
+        output : {'dm', 'nm', 'cm', 'mm', 'm', 'km', 'um'}
+            Length unit of the wavenumber (1/output). Default is 'cm'.
+        """
+        check_unit_frequency(unit)
+        check_unit_wavelength(output)
+
+        self.unit, self.output = unit, output
+
+        super(FrequencyToWavenumber, self).__init__(2 * PI * CONVERT_FREQ[unit] / (C * CONVERT_WAVE[output]))
+
+
+class FrequencyConverter(UnitConverter):
+    def __init__(self, unit='GHz', output='Hz'):
+        """
+        Precompiled conversion of frequencies into other units (see respy.emw.convert_frequency).
+
+        Parameters
+        ----------
+        unit, output : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'}
+            Unit of the entered and of the desired frequencies. Default is 'GHz' and 'Hz'.
+        """
+        check_unit_frequency(unit)
+        check_unit_frequency(output)
+
+        self.unit, self.output = unit, output
+
+        super(FrequencyConverter, self).__init__(CONVERT_FREQ[unit] / CONVERT_FREQ[output])
+
+
+class WavelengthConverter(UnitConverter):
+    def __init__(self, unit='cm', output='m'):
+        """
+        Precompiled conversion of wavelengths into other units (see respy.emw.convert_wavelength).
+
+        Parameters
+        ----------
+        unit, output : {'dm', 'nm', 'cm', 'mm', 'm', 'km', 'um'}
+            Unit of the entered and of the desired wavelengths. Default is 'cm' and 'm'.
+        """
+        check_unit_wavelength(unit)
+        check_unit_wavelength(output)
+
+        self.unit, self.output = unit, output
+
+        super(WavelengthConverter, self).__init__(CONVERT_WAVE[output] / CONVERT_WAVE[unit])
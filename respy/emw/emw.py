@@ -2,8 +2,11 @@ from __future__ import division
 
 import numpy as np
 
+from respy.angles import Angles
 from respy.auxiliary import align_all, PI, C
-from respy.emw.auxiliary import check_unit_frequency, check_unit_wavelength, BANDS, CONVERT_FREQ, CONVERT_WAVE
+from respy.emw.auxiliary import (check_unit_frequency, check_unit_wavelength, BANDS, BAND_GRIDS, CONVERT_FREQ,
+                                 CONVERT_WAVE)
+from respy.emw.registry import BandRegistry
 
 REGION = {"GAMMA": "GAMMA",
           "XRAY": "XRAY",
@@ -24,6 +27,7 @@ REGION = {"GAMMA": "GAMMA",
           "W": "MICROWAVE",
           "D": "MICROWAVE",
           "ELF": "RADIO",
+          "SLF": "RADIO",
           "ULF": "RADIO",
           "VLF": "RADIO",
           "LF": "RADIO",
@@ -62,14 +66,24 @@ class EMW(object):
         wavelength_unit : str
             Unit of wavelength.
 
+        Methods
+        -------
+        wavenumber : Complex wavenumber in a lossy medium.
+        penetration_depth : Power penetration depth in a lossy medium.
+        skin_depth : Skin depth in a lossy medium.
+        broadcast_with : Broadcast angles against the wavenumbers.
+
         Note
         ----
-        Frequency, wavelength, frequency_unit and wavelength_unit can be changed.
-        
+        Frequency, wavelength, frequency_unit and wavelength_unit can be changed. The shape of input is kept for
+        wavelength, frequency, k0 and the band and region codes.
+
         """
 
         # Prepare Input Data and set values ----------------------------------------------------------------------------
-        input = np.asarray(input).flatten()
+        # The shape of input is kept. Arrays are not copied.
+        if not isinstance(input, str):
+            input = np.atleast_1d(np.asarray(input))
 
         # Self Definitions ---------------------------------------------------------------------------------------------
         self.__unit = unit
@@ -85,7 +99,7 @@ class EMW(object):
             else:
                 self.__frequency = input
 
-            self.__wavelength = self.__compute_wavelength()
+            self.__wavelength = None
 
         elif unit in CONVERT_WAVE.keys() and output in CONVERT_FREQ.keys():
             self.__frequency_unit = output
@@ -96,7 +110,7 @@ class EMW(object):
             else:
                 self.__wavelength = input
 
-            self.__frequency = self.__compute_frequency()
+            self.__frequency = None
 
         else:
             raise ValueError("Input must be a frequency or a wavelength. "
@@ -105,11 +119,8 @@ class EMW(object):
                                                                                              str(CONVERT_WAVE.keys())))
 
         # Additional Calculation ---------------------------------------------------------------------------------------
-        self.__k0 = self.__compute_wavenumver()
-        self.__region = which_region(self.__frequency, self.__frequency_unit)
-        self.__band = which_band(self.__frequency, self.__frequency_unit)
-        self.__array = np.asarray([self.__frequency, self.__wavelength, self.k0])
-        self.array = self.__array
+        # The missing one of frequency and wavelength, k0, the classification and array are computed on first access.
+        self.__reset_cache()
 
     # ------------------------------------------------------------------------------------------------------------------
     # Magic Methods
@@ -130,7 +141,7 @@ class EMW(object):
         return info
 
     def __len__(self):
-        return len(self.__frequency)
+        return len(self.frequency)
 
     # ------------------------------------------------------------------------------------------------------------------
     # Property Access
@@ -145,7 +156,7 @@ class EMW(object):
         -------
         len : int
         """
-        return len(self.__frequency)
+        return len(self.frequency)
 
     @property
     def shape(self):
@@ -156,42 +167,92 @@ class EMW(object):
         -------
         shape : tuple
         """
-        return self.__frequency.shape
+        return self.frequency.shape
+
+    @property
+    def ndim(self):
+        """
+        Number of dimensions of array
+
+        Returns
+        -------
+        ndim : int
+        """
+        return self.frequency.ndim
 
     # ------------------------------------------------------------------------------------------------------------------
     # Property with Setter
     # ------------------------------------------------------------------------------------------------------------------
     @property
     def band(self):
+        if self.__band is None:
+            self.__band = names_from_codes(self.band_codes, REGISTRY.band_names)
+
         return self.__band
 
     @property
     def region(self):
+        if self.__region is None:
+            self.__region = names_from_codes(self.region_codes, REGISTRY.region_names)
+
         return self.__region
 
+    @property
+    def band_codes(self):
+        """
+        Band code of each frequency (see respy.emw.band_codes).
+
+        Returns
+        -------
+        band_codes : array_like
+        """
+        if self.__band_codes is None:
+            if self.__frequency is None:
+                self.__band_codes, _ = band_codes(self.__wavelength, self.__wavelength_unit)
+            else:
+                self.__band_codes, _ = band_codes(self.__frequency, self.__frequency_unit)
+
+        return self.__band_codes
+
+    @property
+    def region_codes(self):
+        """
+        Region code of each frequency (see respy.emw.region_codes).
+
+        Returns
+        -------
+        region_codes : array_like
+        """
+        if self.__region_codes is None:
+            self.__region_codes = REGISTRY.region_lookup[self.band_codes]
+
+        return self.__region_codes
+
     @property
     def frequency(self):
+        if self.__frequency is None:
+            self.__frequency = self.__compute_frequency()
+
         return self.__frequency
 
     @frequency.setter
     def frequency(self, value):
         self.__frequency = value
-        self.__wavelength = self.__compute_wavelength()
-        self.__k0 = self.__compute_wavenumver()
-        self.__region = which_region(self.__frequency, self.__frequency_unit)
-        self.__band = which_band(self.__frequency, self.__frequency_unit)
+        self.__wavelength = None
+        self.__reset_cache()
 
     @property
     def wavelength(self):
+        if self.__wavelength is None:
+            self.__wavelength = self.__compute_wavelength()
+
         return self.__wavelength
 
     @wavelength.setter
     def wavelength(self, value):
         self.__wavelength = value
-        self.__frequency = self.__compute_frequency()
-        self.__k0 = self.__compute_wavenumver()
-        self.__region = which_region(self.__frequency, self.__frequency_unit)
-        self.__band = which_band(self.__frequency, self.__frequency_unit)
+        self.__frequency = None
+        self.__reset_cache()
 
     @property
     def frequency_unit(self):
@@ -202,6 +263,7 @@ class EMW(object):
         if value in CONVERT_FREQ.keys():
             self.__frequency = self.__convert_frequency(value)
             self.__frequency_unit = value
+            self.__array = None
         else:
             raise ValueError("If input is a frequency, unit must be equal to {0}. ".format(str(CONVERT_FREQ.keys())))
 
@@ -214,17 +276,138 @@ class EMW(object):
         if value in CONVERT_WAVE.keys():
             self.__wavelength = self.__convert_wavelength(value)
             self.__wavelength_unit = value
+            self.__k0 = None
+            self.__array = None
 
         else:
             raise ValueError("When entering a wavelength, unit must be equal to {0}.".format(str(CONVERT_WAVE.keys())))
 
     @property
     def k0(self):
+        """
+        Free space wavenumber in the inverse wavelength unit.
+
+        Returns
+        -------
+        k0 : array_like
+        """
+        if self.__k0 is None:
+            self.__k0 = self.__compute_wavenumver()
+
         return self.__k0
 
+    @property
+    def array(self):
+        """
+        Stacked frequency, wavelength and k0.
+
+        Returns
+        -------
+        array : array_like
+        """
+        if self.__array is None:
+            self.__array = np.asarray([self.frequency, self.wavelength, self.k0])
+
+        return self.__array
+
     # ------------------------------------------------------------------------------------------------------------------
     # Public Methods
     # ------------------------------------------------------------------------------------------------------------------
+    def wavenumber(self, epsilon, out=None):
+        """
+        Complex wavenumber k = k0 * sqrt(epsilon) in a lossy medium.
+
+        Parameters
+        ----------
+        epsilon : int, float, complex or array_like
+            Relative permittivity of the medium. Must be broadcastable against EMW.shape.
+        out : array_like, optional
+            Complex array in which the result is written.
+
+        Returns
+        -------
+        k : array_like
+            Complex wavenumber in the inverse wavelength unit. The result is complex64 if epsilon is a single precision
+            array (float32 or complex64) and complex128 otherwise.
+        """
+        epsilon = np.asarray(epsilon)
+        dtype = out.dtype if out is not None else _complex_dtype(epsilon.dtype)
+
+        k0 = self.k0.astype(np.finfo(dtype).dtype, copy=False)
+
+        return np.multiply(k0, np.sqrt(epsilon.astype(dtype, copy=False)), out=out)
+
+    def penetration_depth(self, epsilon, out=None):
+        """
+        Power penetration depth 1 / (2 * Im(k)) in a lossy medium.
+
+        Parameters
+        ----------
+        epsilon : int, float, complex or array_like
+            Relative permittivity of the medium. Must be broadcastable against EMW.shape.
+        out : array_like, optional
+            Real array in which the result is written.
+
+        Returns
+        -------
+        depth : array_like
+            Penetration depth in the wavelength unit. Lossless media have an infinite depth.
+        """
+        return self.__attenuation_depth(epsilon, 2., out)
+
+    def skin_depth(self, epsilon, out=None):
+        """
+        Skin depth 1 / Im(k) of the field amplitude in a lossy medium.
+
+        Parameters
+        ----------
+        epsilon : int, float, complex or array_like
+            Relative permittivity of the medium. Must be broadcastable against EMW.shape.
+        out : array_like, optional
+            Real array in which the result is written.
+
+        Returns
+        -------
+        depth : array_like
+            Skin depth in the wavelength unit. Lossless media have an infinite depth.
+        """
+        return self.__attenuation_depth(epsilon, 1., out)
+
+    def broadcast_with(self, angles, field='iza'):
+        """
+        Broadcast angles against the wavenumbers.
+
+        Parameters
+        ----------
+        angles : int, float, array_like or Angles
+            Angles. If angles is an Angles object, the attribute defined by field is used.
+        field : str
+            Name of the angle attribute if angles is an Angles object. Default is 'iza'.
+
+        Returns
+        -------
+        angle, k0 : array_like
+            Read-only broadcast views of the angles and of k0.
+
+        Note
+        ----
+        If angles is one dimensional and has as many elements as the EMW object, it is reshaped to EMW.shape, i.e.
+        one angle per frequency. Otherwise the usual numpy broadcasting rules apply.
+        """
+        if isinstance(angles, Angles):
+            try:
+                angles = getattr(angles, field)
+            except AttributeError:
+                raise ValueError("Angles has no attribute {0}.".format(str(field)))
+
+        angles = np.asarray(angles)
+        k0 = self.k0
+
+        if angles.ndim == 1 and k0.ndim > 1 and angles.size == k0.size:
+            angles = angles.reshape(k0.shape)
+
+        return tuple(np.broadcast_arrays(angles, k0))
+
     def align_with(self, value):
         """
         Align all angles with another array.
@@ -245,7 +428,7 @@ class EMW(object):
         effect on the angles within the Angles class.
         """
         # RAD Angles
-        data = [item for item in self.__array]
+        data = [item for item in self.array]
 
         if isinstance(value, tuple) or isinstance(value, list):
             data = tuple(value) + tuple(data, )
@@ -254,7 +437,9 @@ class EMW(object):
 
         data = align_all(data)
 
-        self.__frequency, self.__wavelength, self.k0 = np.asarray(data[-3:])
+        self.__frequency, self.__wavelength, k0 = np.asarray(data[-3:])
+        self.__reset_cache()
+        self.__k0 = k0
 
         return data[0:-3]
 
@@ -262,11 +447,33 @@ class EMW(object):
     # Private Methods
     # ------------------------------------------------------------------------------------------------------------------
     def __convert_frequency(self, value):
+        if self.__frequency is None:
+            return None
+
         return convert_frequency(frequency=self.__frequency, unit=self.__frequency_unit, output=value)
 
     def __convert_wavelength(self, value):
+        if self.__wavelength is None:
+            return None
+
         return convert_wavelength(wavelength=self.__wavelength, unit=self.__wavelength_unit, output=value)
 
+    def __attenuation_depth(self, epsilon, factor, out):
+        k = self.wavenumber(epsilon)
+        loss = np.abs(k.imag)
+        loss *= factor
+
+        with np.errstate(divide='ignore'):
+            return np.divide(1., loss, out=out)
+
+    def __reset_cache(self):
+        self.__k0 = None
+        self.__array = None
+        self.__band_codes = None
+        self.__region_codes = None
+        self.__band = None
+        self.__region = None
+
     def __update_variables(self):
         self.__frequency = self.__compute_frequency()
         self.__wavelength = self.__compute_wavelength()
@@ -280,7 +487,7 @@ class EMW(object):
                                  output=self.__frequency_unit)
 
     def __compute_wavenumver(self):
-        return compute_wavenumber(frequency=self.__frequency, unit=self.__frequency_unit, output=self.__wavelength_unit)
+        return compute_wavenumber(frequency=self.frequency, unit=self.__frequency_unit, output=self.__wavelength_unit)
 
 
 def compute_wavelength(frequency, unit='GHz', output="cm"):
@@ -439,111 +646,105 @@ def select_band(band="L", output="GHz"):
     This is only a auxiliary function. Thus the output is only as frequency. The function 'select_region'
     is more convenient to use which allows a output in wavelength.
 
+    The grids are generated on the first request and cached.
+
     See Also
     --------
     respy.emw.select_region
 
     """
-    # ---- Other Regions ----
-    if band is "GAMMA":
-        GAMMA = np.arange(0, 1.1, 0.1)
-        GAMMA[0] = 0.0000001
-        return compute_frequency(GAMMA[np.argsort(-GAMMA)], 'nm', output)
-    elif band is "XRAY":
-        XRAY = np.arange(1.1, 10.1, 0.1)
-        return compute_frequency(XRAY[np.argsort(-XRAY)], 'nm', output)
-    elif band is "UV":
-        UV = np.arange(10.1, 400, 0.1)
-        return compute_frequency(UV[np.argsort(-UV)], 'nm', output)
-
-    # ---- Optical Region ----
-    elif band is "VIS":
-        VIS = np.arange(400., 751., 1)
-        return compute_frequency(VIS[np.argsort(-VIS)], 'nm', output)
-    elif band is "NIR":
-        NIR = np.arange(751., 1001., 1)
-        return compute_frequency(NIR[np.argsort(-NIR)], 'nm', output)
-    elif band is "SWIR":
-        SWIR = np.arange(1001., 2501., 1)
-        return compute_frequency(SWIR[np.argsort(-SWIR)], 'nm', output)
-    elif band is "MWIR":
-        MWIR = np.arange(3000., 5001., 1)
-        return compute_frequency(MWIR[np.argsort(-MWIR)], 'nm', output)
-    elif band is "LWIR":
-        LWIR = np.arange(8000., 12001., 1)
-        return compute_frequency(LWIR[np.argsort(-LWIR)], 'nm', output)
-
-    # ---- Microwave Region ----
-    elif band is "L":
-        return (np.arange(1, 2.1, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-    elif band is "S":
-        return (np.arange(2.1, 4.1, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-    elif band is "C":
-        return (np.arange(4.1, 8.1, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-    elif band is "X":
-        return (np.arange(8.1, 12.1, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-    elif band is "Ku":
-        return (np.arange(12.1, 18.1, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-    elif band is "K":
-        return (np.arange(18.1, 26.6, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-    elif band is "Ka":
-        return (np.arange(26.6, 40.1, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-    elif band is "V":
-        return (np.arange(50.1, 75.1, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-    elif band is "W":
-        return (np.arange(75.1, 110.1, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-    elif band is "D":
-        return (np.arange(110.1, 170.1, 0.1) * CONVERT_FREQ['GHz']) / CONVERT_FREQ[output]
-
-    # ---- Radio Region ----
-    elif band is "ELF":
-        return (np.arange(3, 30.1, 0.1) * CONVERT_FREQ['Hz']) / CONVERT_FREQ[output]
-    elif band is "SLF":
-        return (np.arange(30.1, 300.1, 0.1) * CONVERT_FREQ['Hz']) / CONVERT_FREQ[output]
-    elif band is "ULF":
-        return (np.arange(300.1, 3000.1, 0.1) * CONVERT_FREQ['Hz']) / CONVERT_FREQ[output]
-    elif band is "VLF":
-        return (np.arange(3.1, 30.1, 0.1) * CONVERT_FREQ['kHz']) / CONVERT_FREQ[output]
-    elif band is "LF":
-        return (np.arange(30.1, 300.1, 0.1) * CONVERT_FREQ['kHz']) / CONVERT_FREQ[output]
-    elif band is "MF":
-        return (np.arange(300.1, 3000.1, 0.1) * CONVERT_FREQ['kHz']) / CONVERT_FREQ[output]
-    elif band is "HF":
-        return (np.arange(3.1, 30.1, 0.1) * CONVERT_FREQ['MHz']) / CONVERT_FREQ[output]
-    elif band is "VHF":
-        return (np.arange(30.1, 300.1, 0.1) * CONVERT_FREQ['MHz']) / CONVERT_FREQ[output]
-    elif band is "UHF":
-        return (np.arange(300.1, 1000, 0.1) * CONVERT_FREQ['MHz']) / CONVERT_FREQ[output]
-    else:
-        raise ValueError("Supported regions are  {0}.".format(str(BANDS)))
-
-
-EMS = {"GAMMA": select_band("GAMMA"),
-       "XRAY": select_band("XRAY"),
-       "UV": select_band("UV"),
-       "VIS": select_band("VIS"),
-       "NIR": select_band("NIR"),
-       "SWIR": select_band("SWIR"),
-       "MWIR": select_band("MWIR"),
-       "LWIR": select_band("LWIR"),
-       "L": select_band("L"),
-       "S": select_band("S"),
-       "C": select_band("C"),
-       "X": select_band("X"),
-       "Ku": select_band("Ku"),
-       "K": select_band("K"),
-       "Ka": select_band("Ka"),
-       "V": select_band("V"),
-       "W": select_band("W"),
-       "D": select_band("D"),
-       "ELF": select_band("ELF"),
-       "ULF": select_band("ULF"),
-       "VLF": select_band("VLF"),
-       "LF": select_band("LF"),
-       "MF": select_band("MF"),
-       "HF": select_band("HF"),
-       "VHF": select_band("VHF"),
-       "UHF": select_band("UHF")}
+    return REGISTRY.grid(band, output).copy()
+
+
+def band_edges(band):
+    """
+    Lowest and highest frequency of the grid of a band in GHz.
+
+    The edges are computed from the band definition without generating the grid.
+
+    Parameters
+    ----------
+    band : str
+        Band of the EM spectrum.
+
+    Returns
+    -------
+    lower, upper : float
+        Frequency edges in GHz.
+    """
+    return REGISTRY.edges(band)
+
+
+def register_band(name, lower, upper, unit='GHz', region='CUSTOM', step=None):
+    """
+    Add a band to the band registry, e.g. a mission-specific band or sensor channel.
+
+    The band is used by which_band, band_codes, select_band, select_region and EMW. In overlapping parts the band
+    which was registered last takes precedence.
+
+    Parameters
+    ----------
+    name : str
+        Name of the band.
+    lower, upper : int or float
+        Edges of the band (both included).
+    unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'nm', 'um', 'cm', 'dm', 'mm', 'm', 'km'}
+        Unit of lower, upper and step. Default is 'GHz'.
+    region : str
+        Region of the band. Default is 'CUSTOM'.
+    step : int or float, optional
+        Step of the band grid (see select_band). Default is (upper - lower) / 100.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    respy.emw.registry.BandRegistry
+    """
+    REGISTRY.register(name, lower, upper, unit=unit, region=region, step=step)
+
+
+class BandGrids(object):
+    """
+    Lazy mapping of the bands to their frequency grids in GHz.
+
+    The grids are generated on the first access and cached. The cached grids are read-only.
+    """
+
+    def __getitem__(self, band):
+        if band not in REGISTRY:
+            raise KeyError(band)
+
+        return REGISTRY.grid(band, 'GHz')
+
+    def __contains__(self, band):
+        return band in REGISTRY
+
+    def __iter__(self):
+        return iter(REGISTRY)
+
+    def __len__(self):
+        return len(REGISTRY)
+
+    def keys(self):
+        return list(REGISTRY.bands)
+
+
+# Default bands of the registry.
+REGISTRY = BandRegistry()
+
+# Bands which are only selectable (e.g. SLF) are defined after BANDS, so the codes of BANDS do not change.
+for _band in BANDS + [item for item in BAND_GRIDS.keys() if item not in BANDS]:
+    REGISTRY.define(_band, *BAND_GRIDS[_band], region=REGION[_band])
+
+del _band
+
+REGISTRY.group("RADAR", ["L", "S", "C", "X"])
+REGISTRY.group("RADIO", ["ELF", "ULF", "VLF", "LF", "MF", "HF", "VHF", "UHF"])
+
+EMS = BandGrids()
 
 
 def select_region(region, output="GHz"):
@@ -566,38 +767,7 @@ def select_region(region, output="GHz"):
     -------
     Range : array_like
     """
-    if region is "RADAR":
-        Lb = EMS["L"]
-        Sb = EMS["S"]
-        Cb = EMS["C"]
-        Xb = EMS["X"]
-
-        output_region = np.concatenate((Lb, Sb, Cb, Xb))
-
-    elif region is "OPTIC":
-        VIS = EMS["VIS"]
-        NIR = EMS["NIR"]
-        SWIR = EMS["SWIR"]
-        output_region = np.concatenate((SWIR, NIR, VIS))
-
-    elif region is "THERMAL":
-        MWIR = EMS["MWIR"]
-        LWIR = EMS["LWIR"]
-        output_region = np.concatenate((LWIR, MWIR))
-
-    elif region is "RADIO":
-        ELF = EMS["ELF"]
-        ULF = EMS["ULF"]
-        VLF = EMS["VLF"]
-        LF = EMS["LF"]
-        MF = EMS["MF"]
-        HF = EMS["HF"]
-        VHF = EMS["VHF"]
-        UHF = EMS["UHF"]
-
-        output_region = np.concatenate((ELF, ULF, VLF, LF, MF, HF, VHF, UHF))
-
-    elif isinstance(region, list):
+    if isinstance(region, list):
         output_list = list()
 
         for item in region:
@@ -606,17 +776,19 @@ def select_region(region, output="GHz"):
 
             except ValueError:
                 raise ValueError("The input region is not valid. It must be 'RADAR', 'OPTIC', 'THERMAL', 'RADIO', "
-                                 "or {1}. The actual region is {0}".format(str(region), str(BANDS)))
+                                 "or {1}. The actual region is {0}".format(str(region), str(REGISTRY.bands)))
 
         output_list = tuple(output_list)
         output_region = np.concatenate(output_list)
 
     else:
         try:
-            output_region = EMS[region]
-        except KeyError:
+            bands = REGISTRY.members(region)
+        except ValueError:
             raise ValueError("The input region is not valid. It must be 'RADAR', 'OPTIC', 'THERMAL', 'RADIO', "
-                             "or {1}. The actual region is {0}".format(str(region), str(BANDS)))
+                             "or {1}. The actual region is {0}".format(str(region), str(REGISTRY.bands)))
+
+        output_region = np.concatenate([REGISTRY.grid(item, 'GHz') for item in bands])
 
     if output in CONVERT_WAVE.keys():
         output_region = compute_wavelength(output_region, unit="GHz", output=output)
@@ -650,47 +822,82 @@ def which_band(input, unit='GHz'):
     band : str
         Output contains "VIS", "NIR", "SWIR", "MWIR", "LWIR", "L", "S", "C", "X", "Ku", "K", "Ka", "V", "W", "D".
     """
-    if unit in CONVERT_FREQ.keys():
-        frequence = convert_frequency(input, unit=unit, output='GHz')
+    codes, names = band_codes(input, unit)
 
-    elif unit in CONVERT_WAVE.keys():
-        frequence = compute_frequency(input, unit, 'GHz')
-    else:
-        raise ValueError("Input must be a frequency or a wavelength. "
-                         "If input is a frequency, unit must be equal to {0}. "
-                         "When entering a wavelength, unit must be equal to {1}.".format(str(CONVERT_FREQ.keys()),
-                                                                                         str(CONVERT_WAVE.keys())))
-
-    if isinstance(frequence, np.ndarray) and len(frequence) > 1:
-        item_list = list()
-        for i in range(frequence.shape[0]):
-            for item in BANDS:
-                if EMS[item][0] <= frequence[i] <= EMS[item][-1]:
-                    item_list.append(item)
-                else:
-                    pass
-
-        item_list = list(set(item_list))
+    return names_from_codes(codes, names)
 
-    else:
-        item_list = list()
-        for item in BANDS:
-            if EMS[item][0] <= frequence <= EMS[item][-1]:
-                item_list.append(item)
-            else:
-                pass
 
-        item_list = list(set(item_list))
+def band_codes(input, unit='GHz'):
+    """
+    Classify each frequency or wavelength into a band code.
 
-    if len(item_list) == 0:
-        # warnings.warn("Input region not supported. Returning None.")
-        return "NONE"
+    Parameters
+    ----------
+    input : int, float or array_like
+        Frequency or wavelength.
+    unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'dm', 'nm', 'cm', 'mm', 'm', 'km', 'um'}
+        Unit of input.
 
-    elif len(item_list) == 1:
-        return item_list[0]
+    Returns
+    -------
+    codes, names : array_like, tuple
+        Band code (np.uint8) of each element with the shape of input and the table of the band names of each code.
+        The code 0 ("NONE") marks elements outside of all bands.
 
-    else:
-        return item_list
+    See Also
+    --------
+    respy.emw.region_codes
+    """
+    # The band edges are cached per unit, so the input is classified without a conversion to GHz.
+    index = REGISTRY.index(input, unit)
+
+    return (index + 1).astype(np.uint8), REGISTRY.band_names
+
+
+def region_codes(input, unit='GHz'):
+    """
+    Classify each frequency or wavelength into a region code.
+
+    Parameters
+    ----------
+    input : int, float or array_like
+        Frequency or wavelength.
+    unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'dm', 'nm', 'cm', 'mm', 'm', 'km', 'um'}
+        Unit of input.
+
+    Returns
+    -------
+    codes, names : array_like, tuple
+        Region code (np.uint8) of each element with the shape of input and the table of the region names of each
+        code. The code 0 ("NONE") marks elements outside of all bands.
+
+    See Also
+    --------
+    respy.emw.band_codes
+    """
+    codes, _ = band_codes(input, unit)
+
+    return REGISTRY.region_lookup[codes], REGISTRY.region_names
+
+
+def band_index(frequency):
+    """
+    Find the index of the band in the band registry for frequencies in GHz.
+
+    The lookup is a binary search (np.searchsorted) over the sorted interval index of the band registry.
+
+    Parameters
+    ----------
+    frequency : int, float or array_like
+        Frequency in GHz.
+
+    Returns
+    -------
+    index : array_like
+        Index of the band in REGISTRY.band_names[1:] for each frequency. Frequencies outside of all bands have the
+        index -1.
+    """
+    return REGISTRY.index(frequency)
 
 
 def which_region(input, unit='GHz'):
@@ -706,34 +913,53 @@ def which_region(input, unit='GHz'):
 
     Returns
     -------
-    region : str
-        Output contains 'OPTIC', 'MICROWAVE'.
+    region : str or list
+        Output contains 'GAMMA', 'XRAY', 'UV', 'OPTIC', 'THERMAL', 'MICROWAVE' or 'RADIO'. If the input belongs to
+        no region 'NONE' is returned.
     """
-    if isinstance(input, np.ndarray) and len(input) > 1:
-        band_list = list()
+    codes, names = region_codes(input, unit)
 
-        for i in range(input.shape[0]):
-            band_list.append(which_band(input[i], unit))
+    return names_from_codes(codes, names)
 
-        region_list = list()
-        for item in band_list:
-            if item is not None:
-                region_list.append(REGION[item])
-            else:
-                region_list.append(None)
 
-            region_list = list(set(region_list))
+def names_from_codes(codes, names):
+    """
+    Collect the names of the band or region codes that occur in an array.
+
+    Parameters
+    ----------
+    codes : array_like
+        Band or region codes, see respy.emw.band_codes and respy.emw.region_codes.
+    names : tuple
+        Table of the names of each code.
 
-        if len(region_list) == 1:
-            region_list = region_list[0]
-        else:
-            pass
+    Returns
+    -------
+    names : str or list
+        "NONE" if no code belongs to a band, the name if only one band or region occurs, otherwise a list of names.
+    """
+    present = np.bincount(np.asarray(codes).ravel(), minlength=len(names))[1:] > 0
+    item_list = [names[item + 1] for item in np.flatnonzero(present)]
+
+    # A band which was removed and registered again has two codes with the same name.
+    item_list = [item for i, item in enumerate(item_list) if item not in item_list[:i]]
+
+    if len(item_list) == 0:
+        # warnings.warn("Input region not supported. Returning None.")
+        return "NONE"
+
+    elif len(item_list) == 1:
+        return item_list[0]
 
     else:
-        band = which_band(input, unit)
-        if band is not None:
-            region_list = REGION[band]
-        else:
-            region_list = "NONE"
+        return item_list
+
+
+def _complex_dtype(dtype):
+    """
+    Complex data type of the same precision as dtype (complex64 for single precision, otherwise complex128).
+    """
+    if dtype in (np.float16, np.float32, np.complex64):
+        return np.dtype(np.complex64)
 
-    return region_list
+    return np.dtype(np.complex128)
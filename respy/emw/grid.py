@@ -0,0 +1,249 @@
+from __future__ import division
+
+import numpy as np
+
+from respy.auxiliary import TILE_SIZE
+from respy.emw.auxiliary import CONVERT_FREQ, CONVERT_WAVE
+from respy.emw.emw import band_edges, compute_frequency, compute_wavelength, convert_frequency, convert_wavelength
+
+
+class SpectralGrid(object):
+    def __init__(self, start, stop, num=None, step=None, spacing='linear', unit='GHz'):
+        """
+        A lazy grid of frequencies or wavelengths.
+
+        Only the definition of the grid is stored. The values are computed on access, so huge spectral sweeps can
+        be processed chunk by chunk without materializing the whole grid.
+
+        Parameters
+        ----------
+        start, stop : int or float
+            First and last value of the grid in the unit of unit.
+        num : int, optional
+            Number of grid points. If num is defined, stop is included (like np.linspace or np.geomspace).
+        step : int or float, optional
+            Distance between the grid points. If step is defined, stop is excluded (like np.arange). If spacing is
+            'log', step is the distance in decades.
+        spacing : {'linear', 'log'}
+            Spacing of the grid points. Default is 'linear'.
+        unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'nm', 'um', 'cm', 'dm', 'mm', 'm', 'km'}
+            Unit of start, stop and step. Default is 'GHz'.
+
+        Attributes
+        ----------
+        size : int
+            Number of grid points.
+        shape : tuple
+            Shape of the grid.
+        unit : str
+            Unit of the grid.
+
+        Methods
+        -------
+        values : Compute all grid values in a specific unit.
+        chunks : Iterate over the grid in chunks.
+
+        Note
+        ----
+        Either num or step must be defined. Grid points can be accessed with integers, slices and integer arrays and
+        np.asarray(SpectralGrid) materializes the whole grid.
+        """
+        if (num is None) == (step is None):
+            raise ValueError("Either num or step must be defined.")
+
+        if spacing not in ('linear', 'log'):
+            raise ValueError("spacing must be 'linear' or 'log'. The actual spacing is {0}".format(str(spacing)))
+
+        if unit not in CONVERT_FREQ.keys() and unit not in CONVERT_WAVE.keys():
+            raise ValueError("The unit must be {0} or {1}. The actual unit is {2}".format(str(CONVERT_FREQ.keys()),
+                                                                                          str(CONVERT_WAVE.keys()),
+                                                                                          str(unit)))
+
+        if spacing == 'log' and (start <= 0 or stop <= 0):
+            raise ValueError("start and stop must be greater than 0 for a logarithmic spacing.")
+
+        self.start = float(start)
+        self.stop = float(stop)
+        self.spacing = spacing
+        self.unit = unit
+
+        first, last = (np.log10(self.start), np.log10(self.stop)) if spacing == 'log' else (self.start, self.stop)
+
+        if num is not None:
+            num = int(num)
+
+            if num < 1:
+                raise ValueError("num must be greater than 0. The actual num is {0}".format(str(num)))
+
+            self.__size = num
+            self.__delta = (last - first) / (num - 1) if num > 1 else 0.
+
+        else:
+            if step <= 0:
+                raise ValueError("step must be greater than 0. The actual step is {0}".format(str(step)))
+
+            self.__size = int(np.ceil((last - first) / step)) if last > first else 0
+            self.__delta = float(step)
+
+        self.__first = first
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Magic Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def __len__(self):
+        return self.__size
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.__evaluate(np.arange(*key.indices(self.__size)))
+
+        index = np.asarray(key)
+
+        if not np.issubdtype(index.dtype, np.integer):
+            raise IndexError("A SpectralGrid can only be accessed with integers, slices or integer arrays.")
+
+        if np.any((index >= self.__size) | (index < -self.__size)):
+            raise IndexError("Index out of range for a SpectralGrid with {0} points.".format(str(self.__size)))
+
+        return self.__evaluate(np.where(index < 0, index + self.__size, index))
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            for item in chunk:
+                yield item
+
+    def __array__(self, dtype=None):
+        values = self.values()
+
+        return values if dtype is None else values.astype(dtype)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Property Access
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def size(self):
+        return self.__size
+
+    @property
+    def shape(self):
+        return (self.__size,)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Public Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def values(self, output=None):
+        """
+        Compute all grid values.
+
+        Parameters
+        ----------
+        output : str, optional
+            Output unit. A frequency grid can be returned as wavelengths and vice versa. Default is the unit of the
+            grid.
+
+        Returns
+        -------
+        values : array_like
+        """
+        return self.__convert(self.__evaluate(np.arange(self.__size)), output)
+
+    def chunks(self, chunk_size=TILE_SIZE, output=None):
+        """
+        Iterate over the grid in chunks.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Maximum number of grid points per chunk. Default is 2**22.
+        output : str, optional
+            Output unit. Default is the unit of the grid.
+
+        Returns
+        -------
+        chunks : generator
+            Arrays with at most chunk_size grid values.
+        """
+        chunk_size = int(chunk_size)
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0. The actual chunk_size is {0}".format(str(chunk_size)))
+
+        for start in range(0, self.__size, chunk_size):
+            index = np.arange(start, start + chunk_size if start + chunk_size < self.__size else self.__size)
+            yield self.__convert(self.__evaluate(index), output)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Private Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def __evaluate(self, index):
+        values = self.__first + index * self.__delta
+
+        if self.spacing == 'log':
+            values = 10 ** values
+
+        return values
+
+    def __convert(self, values, output):
+        if output is None or output == self.unit:
+            return values
+
+        return convert_spectral(values, self.unit, output)
+
+
+def band_grid(band, num=None, step=None, spacing='linear', unit='GHz'):
+    """
+    Create a SpectralGrid which spans a band of the EM spectrum.
+
+    Parameters
+    ----------
+    band : str
+        Band of the EM spectrum. See respy.emw.emw.REGISTRY.
+    num : int, optional
+        Number of grid points. The band edges are included.
+    step : int or float, optional
+        Distance between the grid points in the unit of unit (or in decades if spacing is 'log').
+    spacing : {'linear', 'log'}
+        Spacing of the grid points. Default is 'linear'.
+    unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'nm', 'um', 'cm', 'dm', 'mm', 'm', 'km'}
+        Unit of the grid. Default is 'GHz'.
+
+    Returns
+    -------
+    grid : SpectralGrid
+        Grid with increasing values in the unit of unit.
+
+    See Also
+    --------
+    respy.emw.select_band
+    """
+    lower, upper = band_edges(band)
+    edges = convert_spectral(np.asarray([lower, upper]), 'GHz', unit)
+
+    return SpectralGrid(edges.min(), edges.max(), num=num, step=step, spacing=spacing, unit=unit)
+
+
+def convert_spectral(values, unit, output):
+    """
+    Convert frequencies or wavelengths into any frequency or wavelength unit.
+
+    Parameters
+    ----------
+    values : int, float or array_like
+        Frequencies or wavelengths.
+    unit, output : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'nm', 'um', 'cm', 'dm', 'mm', 'm', 'km'}
+        Unit of values and desired unit.
+
+    Returns
+    -------
+    values : int, float or array_like
+    """
+    if unit in CONVERT_FREQ.keys():
+        if output in CONVERT_FREQ.keys():
+            return convert_frequency(values, unit, output)
+
+        return compute_wavelength(values, unit, output)
+
+    if output in CONVERT_FREQ.keys():
+        return compute_frequency(values, unit, output)
+
+    return convert_wavelength(values, unit, output)
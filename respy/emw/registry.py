@@ -0,0 +1,452 @@
+from __future__ import division
+
+import numpy as np
+
+from respy.auxiliary import C
+from respy.emw.auxiliary import CONVERT_FREQ, CONVERT_WAVE, MIN_WAVELENGTH
+
+
+class BandRegistry(object):
+    def __init__(self):
+        """
+        A registry of the bands of the EM spectrum which can be extended at runtime.
+
+        Each band is defined as a grid (start, stop, step, unit) with the semantics of np.arange and belongs to a
+        region. The band lookup is a binary search over a sorted interval index of the band edges, i.e. O(log B) per
+        value for B bands.
+
+        Attributes
+        ----------
+        bands : tuple
+            Names of the bands in the order of registration.
+        band_names, region_names : tuple
+            Code tables of the bands and regions. The code 0 ("NONE") marks values outside of all bands. The codes
+            are stable: removed bands keep their code and name, and codes are never reused.
+        region_lookup : array_like
+            Region code of each band code.
+
+        Methods
+        -------
+        define : Add a band from a grid definition.
+        register : Add a band from its edges.
+        remove : Remove a band.
+        group : Define a named group of bands (e.g. 'RADAR').
+        edges : Frequency edges of a band in GHz.
+        grid : Frequency grid of a band.
+        members : Bands of a group, a band or a region.
+        index : Band index of frequencies or wavelengths.
+
+        Note
+        ----
+        Bands may overlap. In overlapping parts the band which was registered last takes precedence, so
+        mission-specific bands (e.g. P-band) can be placed on top of the default bands.
+        """
+        self.__bands = list()
+        self.__codes = list()
+        self.__code_regions = list()
+        self.__positions = dict()
+        self.__definitions = dict()
+        self.__regions = dict()
+        self.__edges = dict()
+        self.__native = dict()
+        self.__groups = dict()
+        self.__region_names = ["NONE"]
+
+        self.__grids = dict()
+        self.__indices = dict()
+        self.__region_lookup = None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Magic Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def __contains__(self, band):
+        return band in self.__definitions
+
+    def __iter__(self):
+        return iter(self.bands)
+
+    def __len__(self):
+        return len(self.__bands)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Property Access
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def bands(self):
+        return tuple(self.__bands)
+
+    @property
+    def band_names(self):
+        return ("NONE",) + tuple(self.__codes)
+
+    @property
+    def region_names(self):
+        return tuple(self.__region_names)
+
+    @property
+    def region_lookup(self):
+        if self.__region_lookup is None:
+            self.__region_lookup = np.asarray(
+                [0] + [self.__region_names.index(item) for item in self.__code_regions], dtype=np.uint8)
+
+        return self.__region_lookup
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Public Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def define(self, name, start, stop, step, unit='GHz', region='CUSTOM'):
+        """
+        Add a band from a grid definition.
+
+        Parameters
+        ----------
+        name : str
+            Name of the band.
+        start, stop, step : int or float
+            Grid of the band with the semantics of np.arange (stop is excluded).
+        unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'nm', 'um', 'cm', 'dm', 'mm', 'm', 'km'}
+            Unit of start, stop and step. Default is 'GHz'.
+        region : str
+            Region of the band. Default is 'CUSTOM'.
+
+        Returns
+        -------
+        None
+        """
+        if name in self.__definitions or name in self.__groups or name == "NONE":
+            raise ValueError("The band {0} is already defined.".format(str(name)))
+
+        if unit not in CONVERT_FREQ.keys() and unit not in CONVERT_WAVE.keys():
+            raise ValueError("The unit must be {0} or {1}. The actual unit is {2}".format(str(CONVERT_FREQ.keys()),
+                                                                                          str(CONVERT_WAVE.keys()),
+                                                                                          str(unit)))
+
+        if step <= 0 or stop <= start:
+            raise ValueError("The grid of a band must have a positive step and stop must be greater than start.")
+
+        if len(self.__codes) >= np.iinfo(np.uint8).max:
+            raise ValueError("The number of band codes is limited to {0}.".format(str(np.iinfo(np.uint8).max)))
+
+        self.__definitions[name] = (start, stop, step, unit)
+        self.__native[name] = self.__compute_edges(start, stop, step, unit)
+        self.__edges[name] = _convert_edges(self.__native[name], 'GHz')
+        self.__regions[name] = region
+        self.__bands.append(name)
+        self.__positions[name] = len(self.__codes)
+        self.__codes.append(name)
+        self.__code_regions.append(region)
+
+        if region not in self.__region_names:
+            self.__region_names.append(region)
+
+        self.__reset_index()
+
+    def register(self, name, lower, upper, unit='GHz', region='CUSTOM', step=None):
+        """
+        Add a band from its edges.
+
+        Parameters
+        ----------
+        name : str
+            Name of the band.
+        lower, upper : int or float
+            Edges of the band (both included).
+        unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'nm', 'um', 'cm', 'dm', 'mm', 'm', 'km'}
+            Unit of lower, upper and step. Default is 'GHz'.
+        region : str
+            Region of the band. Default is 'CUSTOM'.
+        step : int or float, optional
+            Step of the band grid (see select_band). Default is (upper - lower) / 100.
+
+        Returns
+        -------
+        None
+        """
+        if upper <= lower:
+            raise ValueError("upper must be greater than lower.")
+
+        step = (upper - lower) / 100. if step is None else step
+
+        self.define(name, lower, upper + step / 2., step, unit, region)
+
+    def remove(self, name):
+        """
+        Remove a band.
+
+        The code of the band is not reused, so previously computed band codes keep their names (see band_names).
+        Values inside the removed band are classified as other bands or "NONE" afterwards.
+
+        Parameters
+        ----------
+        name : str
+            Name of the band.
+
+        Returns
+        -------
+        None
+        """
+        self.__check(name)
+
+        self.__bands.remove(name)
+
+        for item in (self.__definitions, self.__edges, self.__native, self.__regions, self.__positions):
+            del item[name]
+
+        for key in [item for item in self.__grids.keys() if item[0] == name]:
+            del self.__grids[key]
+
+        for key in self.__groups.keys():
+            self.__groups[key] = [item for item in self.__groups[key] if item != name]
+
+        self.__reset_index()
+
+    def group(self, name, bands):
+        """
+        Define a named group of bands (e.g. 'RADAR').
+
+        Parameters
+        ----------
+        name : str
+            Name of the group.
+        bands : list
+            Names of the bands in the group.
+
+        Returns
+        -------
+        None
+        """
+        if name in self.__definitions or name == "NONE":
+            raise ValueError("The group {0} is already defined as a band.".format(str(name)))
+
+        for item in bands:
+            self.__check(item)
+
+        self.__groups[name] = list(bands)
+
+    def edges(self, band):
+        """
+        Lowest and highest frequency of the grid of a band in GHz.
+
+        Parameters
+        ----------
+        band : str
+
+        Returns
+        -------
+        lower, upper : float
+        """
+        self.__check(band)
+
+        return self.__edges[band]
+
+    def region(self, band):
+        """
+        Region of a band.
+
+        Parameters
+        ----------
+        band : str
+
+        Returns
+        -------
+        region : str
+        """
+        self.__check(band)
+
+        return self.__regions[band]
+
+    def grid(self, band, output='GHz'):
+        """
+        Read-only frequency grid of a band. The grids are generated on the first request and cached.
+
+        Parameters
+        ----------
+        band : str
+        output : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'}
+            Output unit. Default is 'GHz'.
+
+        Returns
+        -------
+        grid : array_like
+        """
+        try:
+            return self.__grids[(band, output)]
+        except KeyError:
+            pass
+
+        self.__check(band)
+        start, stop, step, unit = self.__definitions[band]
+
+        grid = np.arange(start, stop, step)
+
+        if unit in CONVERT_WAVE.keys():
+            grid[grid == 0] = MIN_WAVELENGTH
+            grid = _wavelength_to_frequency(grid[np.argsort(-grid)], unit, output)
+        else:
+            grid = (grid * CONVERT_FREQ[unit]) / CONVERT_FREQ[output]
+
+        grid.flags.writeable = False
+        self.__grids[(band, output)] = grid
+
+        return grid
+
+    def members(self, name):
+        """
+        Bands of a group, a band or a region.
+
+        Parameters
+        ----------
+        name : str
+            Name of a group, a band or a region (in this order of precedence).
+
+        Returns
+        -------
+        bands : list
+            Names of the bands. The bands of a region are sorted by increasing frequency.
+        """
+        if name in self.__groups:
+            return list(self.__groups[name])
+
+        if name in self.__definitions:
+            return [name]
+
+        bands = [item for item in self.__bands if self.__regions[item] == name]
+
+        if len(bands) == 0:
+            raise ValueError("{0} is neither a group, a band nor a region. Supported bands are {1}.".format(
+                str(name), str(self.bands)))
+
+        return sorted(bands, key=lambda item: self.__edges[item][0])
+
+    def index(self, input, unit='GHz'):
+        """
+        Find the index of the band in band_names[1:] for frequencies or wavelengths.
+
+        The band edges are converted once per unit and cached, so the input is classified directly in its own unit
+        without a conversion of the input array.
+
+        Parameters
+        ----------
+        input : int, float or array_like
+            Frequency or wavelength.
+        unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'nm', 'um', 'cm', 'dm', 'mm', 'm', 'km'}
+            Unit of input. Default is 'GHz'.
+
+        Returns
+        -------
+        index : array_like
+            Index of the band in band_names[1:] (band code - 1) for each value. Values outside of all bands have the
+            index -1.
+        """
+        boundaries, codes = self.edge_table(unit)
+        input = np.asarray(input, dtype=np.double)
+
+        if codes.shape[0] == 0:
+            return np.full(input.shape, -1, dtype=np.int64)
+
+        position = np.searchsorted(boundaries, input, side='right') - 1
+        valid = (position >= 0) & (position < codes.shape[0])
+
+        return np.where(valid, codes[np.clip(position, 0, codes.shape[0] - 1)], -1)
+
+    def edge_table(self, unit='GHz'):
+        """
+        Sorted interval index of the bands in a frequency or wavelength unit.
+
+        The closed band intervals [lower, upper] are stored as half-open intervals [lower, nextafter(upper)). The
+        sorted unique edges split the axis into elementary segments and each segment gets the code of the last
+        registered band which covers it. The tables are built on the first request per unit and cached.
+
+        Parameters
+        ----------
+        unit : {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'} or {'nm', 'um', 'cm', 'dm', 'mm', 'm', 'km'}
+            Unit of the edges. Default is 'GHz'.
+
+        Returns
+        -------
+        boundaries, codes : array_like
+            Increasing boundaries of the segments and the band index (band code - 1) of each segment (-1 for no
+            band).
+        """
+        try:
+            return self.__indices[unit]
+        except KeyError:
+            pass
+
+        if unit not in CONVERT_FREQ.keys() and unit not in CONVERT_WAVE.keys():
+            raise ValueError("Input must be a frequency or a wavelength. "
+                             "If input is a frequency, unit must be equal to {0}. "
+                             "When entering a wavelength, unit must be equal to {1}.".format(str(CONVERT_FREQ.keys()),
+                                                                                             str(CONVERT_WAVE.keys())))
+
+        edges = [self.__edges[item] if unit == 'GHz' else _convert_edges(self.__native[item], unit)
+                 for item in self.__bands]
+
+        lower = np.asarray([item[0] for item in edges])
+        upper = np.nextafter(np.asarray([item[1] for item in edges]), np.inf)
+
+        boundaries = np.unique(np.concatenate((lower, upper)))
+        codes = np.full(boundaries.shape[0] - 1 if boundaries.shape[0] > 0 else 0, -1, dtype=np.int64)
+
+        for i in range(len(self.__bands)):
+            covered = (boundaries[:-1] >= lower[i]) & (boundaries[1:] <= upper[i])
+            codes[covered] = self.__positions[self.__bands[i]]
+
+        self.__indices[unit] = (boundaries, codes)
+
+        return self.__indices[unit]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Private Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def __check(self, band):
+        if band not in self.__definitions:
+            raise ValueError("Supported regions are  {0}.".format(str(self.bands)))
+
+    def __reset_index(self):
+        self.__indices = dict()
+        self.__region_lookup = None
+
+    @staticmethod
+    def __compute_edges(start, stop, step, unit):
+        # Same arithmetic as np.arange: n = ceil((stop - start) / step) values start + i * ((start + step) - start).
+        count = int(np.ceil((stop - start) / step))
+        first, last = float(start), start + (count - 1) * ((start + step) - start)
+
+        if unit in CONVERT_WAVE.keys():
+            first = MIN_WAVELENGTH if first == 0 else first
+
+        return float(first), float(last), unit
+
+
+def _convert_edges(native, output):
+    """
+    Convert the (first, last, unit) edges of a band definition into increasing (lower, upper) edges in output.
+
+    The arithmetic is the same as in respy.emw.compute_frequency, compute_wavelength, convert_frequency and
+    convert_wavelength, so the edges match the band grids (see select_band). Wavelength edges in the unit of the
+    definition are not converted at all.
+    """
+    first, last, unit = native
+
+    if unit in CONVERT_WAVE.keys():
+        if output == unit:
+            return first, last
+
+        if output in CONVERT_FREQ.keys():
+            return _wavelength_to_frequency(last, unit, output), _wavelength_to_frequency(first, unit, output)
+
+        return (first * CONVERT_WAVE[output]) / CONVERT_WAVE[unit], (last * CONVERT_WAVE[output]) / CONVERT_WAVE[unit]
+
+    if output in CONVERT_FREQ.keys():
+        return (first * CONVERT_FREQ[unit]) / CONVERT_FREQ[output], (last * CONVERT_FREQ[unit]) / CONVERT_FREQ[output]
+
+    return ((C / (last * CONVERT_FREQ[unit])) * CONVERT_WAVE[output],
+            (C / (first * CONVERT_FREQ[unit])) * CONVERT_WAVE[output])
+
+
+def _wavelength_to_frequency(wavelength, unit, output):
+    """
+    Same arithmetic as respy.emw.compute_frequency without the unit checks.
+    """
+    return (C / (wavelength / CONVERT_WAVE[unit])) / CONVERT_FREQ[output]
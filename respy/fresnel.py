@@ -0,0 +1,177 @@
+from __future__ import division
+
+import numpy as np
+
+from respy.angles import Angles
+from respy.auxiliary import rad
+from respy.parallel import blockwise, BLOCK_SIZE
+
+
+def fresnel_reflection(iza, epsilon, polarization='V', angle_unit='RAD', workers=None, block_size=BLOCK_SIZE,
+                       out=None):
+    """
+    Fresnel reflection coefficient of a smooth surface between air and a dielectric medium.
+
+    rh = (cos(iza) - sqrt(epsilon - sin(iza)**2)) / (cos(iza) + sqrt(epsilon - sin(iza)**2))
+    rv = (epsilon * cos(iza) - sqrt(epsilon - sin(iza)**2)) / (epsilon * cos(iza) + sqrt(epsilon - sin(iza)**2))
+
+    Parameters
+    ----------
+    iza : int, float, array_like or Angles
+        Incidence zenith angle in DEG or RAD. See parameter angle_unit. If iza is an Angles object the cached cosine
+        and sine (Angles.mui, Angles.sini) are used and angle_unit is ignored.
+    epsilon : int, float, complex or array_like
+        Relative permittivity of the medium. Must be broadcastable against iza.
+    polarization : {'H', 'V'}
+        Polarization. Default is 'V'.
+    angle_unit : {'DEG', 'RAD'}
+        Unit of iza. Default is 'RAD'.
+    workers : int or None
+        Number of threads for a blockwise evaluation of large arrays. Default is None (single-threaded).
+    block_size : int
+        Maximum number of elements per block. Default is 2**18.
+    out : array_like, optional
+        Complex array in which the result is written.
+
+    Returns
+    -------
+    r : complex or array_like
+        Complex amplitude reflection coefficient.
+    """
+    kernel = _reflection_h if _check_polarization(polarization) == 'H' else _reflection_v
+
+    return blockwise(kernel, _geometry(iza, angle_unit) + (epsilon,), workers=workers, block_size=block_size,
+                     out=out)
+
+
+def fresnel_transmission(iza, epsilon, polarization='V', angle_unit='RAD', workers=None, block_size=BLOCK_SIZE,
+                         out=None):
+    """
+    Fresnel transmission coefficient of a smooth surface between air and a dielectric medium.
+
+    th = 2 * cos(iza) / (cos(iza) + sqrt(epsilon - sin(iza)**2))
+    tv = 2 * sqrt(epsilon) * cos(iza) / (epsilon * cos(iza) + sqrt(epsilon - sin(iza)**2))
+
+    Parameters
+    ----------
+    iza : int, float, array_like or Angles
+        Incidence zenith angle in DEG or RAD. See parameter angle_unit. If iza is an Angles object the cached cosine
+        and sine (Angles.mui, Angles.sini) are used and angle_unit is ignored.
+    epsilon : int, float, complex or array_like
+        Relative permittivity of the medium. Must be broadcastable against iza.
+    polarization : {'H', 'V'}
+        Polarization. Default is 'V'.
+    angle_unit : {'DEG', 'RAD'}
+        Unit of iza. Default is 'RAD'.
+    workers : int or None
+        Number of threads for a blockwise evaluation of large arrays. Default is None (single-threaded).
+    block_size : int
+        Maximum number of elements per block. Default is 2**18.
+    out : array_like, optional
+        Complex array in which the result is written.
+
+    Returns
+    -------
+    t : complex or array_like
+        Complex amplitude transmission coefficient of the electric field.
+    """
+    kernel = _transmission_h if _check_polarization(polarization) == 'H' else _transmission_v
+
+    return blockwise(kernel, _geometry(iza, angle_unit) + (epsilon,), workers=workers, block_size=block_size,
+                     out=out)
+
+
+def fresnel_reflectivity(iza, epsilon, polarization='V', angle_unit='RAD', workers=None, block_size=BLOCK_SIZE,
+                         out=None):
+    """
+    Fresnel power reflectivity abs(r)**2 of a smooth surface between air and a dielectric medium.
+
+    Parameters
+    ----------
+    iza : int, float, array_like or Angles
+        Incidence zenith angle in DEG or RAD. See parameter angle_unit. If iza is an Angles object the cached cosine
+        and sine (Angles.mui, Angles.sini) are used and angle_unit is ignored.
+    epsilon : int, float, complex or array_like
+        Relative permittivity of the medium. Must be broadcastable against iza.
+    polarization : {'H', 'V'}
+        Polarization. Default is 'V'.
+    angle_unit : {'DEG', 'RAD'}
+        Unit of iza. Default is 'RAD'.
+    workers : int or None
+        Number of threads for a blockwise evaluation of large arrays. Default is None (single-threaded).
+    block_size : int
+        Maximum number of elements per block. Default is 2**18.
+    out : array_like, optional
+        Real array in which the result is written.
+
+    Returns
+    -------
+    reflectivity : float or array_like
+
+    See Also
+    --------
+    respy.fresnel.fresnel_reflection
+    """
+    kernel = _reflection_h if _check_polarization(polarization) == 'H' else _reflection_v
+
+    def reflectivity(mui, sini, epsilon):
+        r = kernel(mui, sini, epsilon)
+
+        return r.real ** 2 + r.imag ** 2
+
+    return blockwise(reflectivity, _geometry(iza, angle_unit) + (epsilon,), workers=workers, block_size=block_size,
+                     out=out)
+
+
+def _geometry(iza, angle_unit):
+    """
+    Cosine and sine of the incidence zenith angle. The cached values of Angles objects are reused.
+    """
+    if isinstance(iza, Angles):
+        return iza.mui, iza.sini
+
+    if angle_unit == 'DEG':
+        iza = rad(np.asarray(iza, dtype=np.double))
+    elif angle_unit == 'RAD':
+        iza = np.asarray(iza, dtype=np.double)
+    else:
+        raise ValueError("angle_unit must be 'RAD' or 'DEG'")
+
+    return np.cos(iza), np.sin(iza)
+
+
+def _check_polarization(polarization):
+    if polarization not in ('H', 'V'):
+        raise ValueError("The polarization must be 'H' or 'V'. The actual polarization is {0}".format(
+            str(polarization)))
+
+    return polarization
+
+
+def _root(sini, epsilon):
+    return np.sqrt(np.asarray(epsilon, dtype=np.complex128) - sini ** 2)
+
+
+def _reflection_h(mui, sini, epsilon):
+    root = _root(sini, epsilon)
+
+    return (mui - root) / (mui + root)
+
+
+def _reflection_v(mui, sini, epsilon):
+    root = _root(sini, epsilon)
+    product = epsilon * mui
+
+    return (product - root) / (product + root)
+
+
+def _transmission_h(mui, sini, epsilon):
+    root = _root(sini, epsilon)
+
+    return 2 * mui / (mui + root)
+
+
+def _transmission_v(mui, sini, epsilon):
+    root = _root(sini, epsilon)
+
+    return 2 * np.sqrt(np.asarray(epsilon, dtype=np.complex128)) * mui / (epsilon * mui + root)
@@ -0,0 +1,324 @@
+from __future__ import division
+
+import numpy as np
+
+from respy.angles import Angles
+from respy.auxiliary import tiles, rad, TILE_SIZE
+from respy.conversion import dB, linear, _check_units
+
+
+def cosine_normalization(value, iza, reference=40., n=2., unit='dB', output=None, angle_unit='DEG'):
+    """
+    Normalize backscatter to a reference incidence angle with the cosine law.
+
+    The normalized backscatter is sigma0 * (cos(reference) / cos(iza))**n in linear units.
+
+    Parameters
+    ----------
+    value : int, float or array_like
+        Backscatter in dB or linear units. See parameter unit.
+    iza : int, float, array_like or Angles
+        Incidence zenith angle. If iza is an Angles object the cached cosine (Angles.mui) is used. Angles objects
+        and 1-D arrays with one angle per element of the leading (time) axis are aligned with the leading axis of
+        value. Other arrays are broadcast against value.
+    reference : float
+        Reference incidence angle in the unit of angle_unit. Default is 40.
+    n : float
+        Exponent of the cosine law. Default is 2.
+    unit : {'dB', 'linear'}
+        Unit of value. Default is 'dB'.
+    output : {'dB', 'linear'}, optional
+        Unit of the output. Default is the unit of value.
+    angle_unit : {'DEG', 'RAD'}
+        Unit of iza and reference. Default is 'DEG'.
+
+    Returns
+    -------
+    value : int, float or array_like
+        Normalized backscatter.
+    """
+    output = _check_units(unit, output)
+
+    if angle_unit == 'DEG':
+        reference = rad(reference)
+    elif angle_unit != 'RAD':
+        raise ValueError("angle_unit must be 'RAD' or 'DEG'")
+
+    value = np.asarray(value, dtype=np.double)
+
+    if isinstance(iza, Angles):
+        mui = _along_time(iza.mui, value)
+    else:
+        iza = np.asarray(iza)
+        mui = _along_time(np.cos(iza if angle_unit == 'RAD' else rad(iza)), value, strict=False)
+
+    ratio = np.cos(reference) / mui
+
+    if unit == 'dB':
+        normalized = value + 10 * n * np.log10(ratio)
+        return normalized if output == 'dB' else linear(normalized)
+    else:
+        normalized = value * ratio ** n
+        return normalized if output == 'linear' else dB(normalized)
+
+
+class SlopeNormalization(object):
+    def __init__(self, reference=40., unit='dB'):
+        """
+        Per-pixel linear incidence angle normalization of backscatter in dB.
+
+        For each pixel the linear relation sigma0_dB = intercept + slope * (iza - reference) is fitted by least
+        squares. The fit is accumulated from streaming sufficient statistics, so scenes or blocks of a (time, pixel)
+        stack can be ingested one after another and accumulators of different processes can be merged.
+
+        Parameters
+        ----------
+        reference : float
+            Reference incidence angle in [DEG]. Default is 40.
+        unit : {'dB', 'linear'}
+            Unit of the ingested backscatter. Default is 'dB'.
+
+        Attributes
+        ----------
+        slope : array_like
+            Slope per pixel in [dB/DEG].
+        intercept : array_like
+            Backscatter in [dB] at the reference angle per pixel.
+        count : array_like
+            Number of valid samples per pixel.
+
+        All attributes are None until the first scene is ingested.
+
+        Methods
+        -------
+        update : Ingest a single scene.
+        fit : Ingest a whole (time, pixel) stack blockwise.
+        merge : Merge with another SlopeNormalization object.
+        normalize : Normalize backscatter to the reference angle.
+
+        Note
+        ----
+        For stacks, Angles objects and 1-D arrays with one angle per time step are aligned with the leading axis of
+        the stack. Other arrays are broadcast against the backscatter (e.g. angles per pixel with shape
+        (1, pixel)). NaN values are treated as missing values.
+        """
+        _check_units(unit)
+
+        self.reference = reference
+        self.unit = unit
+
+        self.__n = None
+        self.__sx = None
+        self.__sy = None
+        self.__sxx = None
+        self.__sxy = None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Property Access
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def count(self):
+        return self.__n
+
+    @property
+    def slope(self):
+        if self.__n is None:
+            return None
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (self.__n * self.__sxy - self.__sx * self.__sy) / (self.__n * self.__sxx - self.__sx ** 2)
+
+    @property
+    def intercept(self):
+        if self.__n is None:
+            return None
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (self.__sy - self.slope * self.__sx) / self.__n
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Public Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def update(self, scene, iza):
+        """
+        Ingest a single scene.
+
+        Parameters
+        ----------
+        scene : array_like
+            Backscatter of one acquisition with shape (pixel, ...). See parameter unit.
+        iza : int, float, array_like or Angles
+            Incidence zenith angle in [DEG] with a shape broadcastable to scene.
+
+        Returns
+        -------
+        self : SlopeNormalization
+        """
+        scene = self.__as_dB(scene)
+        iza = np.broadcast_to(np.asarray(iza.izaDeg if isinstance(iza, Angles) else iza, dtype=np.double),
+                              scene.shape)
+
+        return self.__accumulate(scene[np.newaxis], iza[np.newaxis])
+
+    def fit(self, value, iza, block_size=TILE_SIZE):
+        """
+        Ingest a (time, pixel, ...) stack blockwise along the time axis.
+
+        Parameters
+        ----------
+        value : array_like
+            Backscatter stack with the time steps on the leading axis. See parameter unit.
+        iza : int, float, array_like or Angles
+            Incidence zenith angle in [DEG].
+        block_size : int
+            Maximum number of elements per block. Default is 2**22.
+
+        Returns
+        -------
+        self : SlopeNormalization
+        """
+        value = np.asarray(value)
+        iza = np.broadcast_to(self.__incidence(iza, value), value.shape)
+        step = self.__time_step(value, block_size)
+
+        for start in range(0, value.shape[0], step):
+            self.__accumulate(self.__as_dB(value[start:start + step]), iza[start:start + step])
+
+        return self
+
+    def merge(self, other):
+        """
+        Merge the sufficient statistics of another accumulator.
+
+        Parameters
+        ----------
+        other : SlopeNormalization
+
+        Returns
+        -------
+        self : SlopeNormalization
+        """
+        if not isinstance(other, SlopeNormalization):
+            raise TypeError("Only SlopeNormalization objects can be merged.")
+
+        if other.reference != self.reference:
+            raise ValueError("The reference angles must be equal.")
+
+        if other.count is None:
+            return self
+
+        if self.__n is None:
+            self.__initialize(other.count.shape)
+
+        self.__n += other.__n
+        self.__sx += other.__sx
+        self.__sy += other.__sy
+        self.__sxx += other.__sxx
+        self.__sxy += other.__sxy
+
+        return self
+
+    def normalize(self, value, iza, output=None, block_size=TILE_SIZE):
+        """
+        Normalize backscatter to the reference angle with the fitted slopes.
+
+        Parameters
+        ----------
+        value : array_like
+            Backscatter with shape (time, pixel, ...) or (pixel, ...). See parameter unit.
+        iza : int, float, array_like or Angles
+            Incidence zenith angle in [DEG].
+        output : {'dB', 'linear'}, optional
+            Unit of the output. Default is the unit of the accumulator.
+        block_size : int
+            Maximum number of elements per block. Default is 2**22.
+
+        Returns
+        -------
+        value : array_like
+            Normalized backscatter.
+        """
+        output = _check_units(self.unit, output)
+
+        if self.__n is None:
+            raise ValueError("The slopes must be fitted before the normalization.")
+
+        value = np.asarray(value)
+        iza = np.broadcast_to(self.__incidence(iza, value), value.shape)
+        slope = np.broadcast_to(self.slope, value.shape)
+
+        result = np.empty(value.shape, dtype=np.double)
+
+        for tile in tiles(value.shape, block_size):
+            normalized = self.__as_dB(value[tile]) - slope[tile] * (iza[tile] - self.reference)
+            result[tile] = normalized if output == 'dB' else linear(normalized)
+
+        return result
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Private Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def __initialize(self, shape):
+        self.__n = np.zeros(shape, dtype=np.int64)
+        self.__sx = np.zeros(shape)
+        self.__sy = np.zeros(shape)
+        self.__sxx = np.zeros(shape)
+        self.__sxy = np.zeros(shape)
+
+    def __accumulate(self, value, iza):
+        x = np.broadcast_to(iza - self.reference, value.shape)
+        valid = ~(np.isnan(value) | np.isnan(x))
+        x = np.where(valid, x, 0.)
+        y = np.where(valid, value, 0.)
+
+        if self.__n is None:
+            self.__initialize(value.shape[1:])
+
+        elif value.shape[1:] != self.__n.shape:
+            raise ValueError("The pixel shape {0} must be equal to {1}.".format(str(value.shape[1:]),
+                                                                               str(self.__n.shape)))
+
+        self.__n += valid.sum(axis=0)
+        self.__sx += x.sum(axis=0)
+        self.__sy += y.sum(axis=0)
+        self.__sxx += (x * x).sum(axis=0)
+        self.__sxy += (x * y).sum(axis=0)
+
+        return self
+
+    def __as_dB(self, value):
+        value = np.asarray(value, dtype=np.double)
+
+        if self.unit == 'linear':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return 10 * np.log10(value)
+
+        return value
+
+    @staticmethod
+    def __incidence(iza, value):
+        if isinstance(iza, Angles):
+            return _along_time(iza.izaDeg, value)
+
+        return _along_time(np.asarray(iza, dtype=np.double), value, strict=False)
+
+    @staticmethod
+    def __time_step(value, block_size):
+        pixels = int(np.prod(value.shape[1:]))
+        step = block_size // pixels if pixels > 0 else block_size
+
+        return step if step > 1 else 1
+
+
+def _along_time(angle, value, strict=True):
+    """
+    Reshape 1-D angles to broadcast along the leading (time) axis of value. If strict is False, only angles with
+    one value per element of the leading axis are reshaped (angles of Angles objects are always reshaped).
+    """
+    value = np.asarray(value)
+    angle = np.asarray(angle)
+
+    if value.ndim > 1 and angle.ndim == 1 and (strict or angle.shape[0] == value.shape[0]):
+        return angle.reshape((-1,) + (1,) * (value.ndim - 1))
+
+    return angle
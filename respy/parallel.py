@@ -0,0 +1,169 @@
+from __future__ import division
+
+import numpy as np
+
+from respy.auxiliary import tiles
+
+BLOCK_SIZE = 2 ** 18
+
+_POOLS = dict()
+
+
+def get_pool(workers):
+    """
+    Access a module-level thread pool.
+
+    The pools are created once per number of workers and reused by all blockwise evaluations.
+
+    Parameters
+    ----------
+    workers : int
+        Number of threads.
+
+    Returns
+    -------
+    pool : multiprocessing.pool.ThreadPool
+    """
+    workers = _check_workers(workers)
+
+    try:
+        return _POOLS[workers]
+    except KeyError:
+        # multiprocessing is imported on the first request of a pool, because it is slow to import.
+        from multiprocessing.pool import ThreadPool
+
+        pool = ThreadPool(workers)
+        _POOLS[workers] = pool
+
+        return pool
+
+
+def blockwise(func, args, workers=None, block_size=BLOCK_SIZE, out=None):
+    """
+    Evaluate an element-wise function in blocks on a thread pool.
+
+    NumPy releases the GIL within ufuncs, so element-wise kernels scale with the number of threads. The arguments are
+    broadcast against each other without copying and split into blocks of at most block_size elements.
+
+    Parameters
+    ----------
+    func : callable
+        Element-wise function func(*args) that returns an array with the broadcast shape of its arguments.
+    args : tuple
+        Arguments of func. All arguments must be broadcastable against each other.
+    workers : int or None
+        Number of threads. If None (default), func is called once with all arguments. If 1, the blocks are
+        evaluated one after another in the calling thread, which bounds the size of temporary arrays.
+    block_size : int
+        Maximum number of elements per block. Default is 2**18.
+    out : array_like, optional
+        Array with the broadcast shape in which the result is written.
+
+    Returns
+    -------
+    result : int, float or array_like
+    """
+    workers = _check_workers(workers)
+
+    if workers is None:
+        if out is None:
+            return func(*args)
+
+        out[...] = func(*args)
+        return out
+
+    arrays = np.broadcast_arrays(*[np.asarray(item) for item in args])
+    shape = arrays[0].shape
+    size = int(np.prod(shape))
+
+    if size <= block_size:
+        if out is None:
+            return func(*args)
+
+        out[...] = func(*args)
+        return out
+
+    blocks = list(tiles(shape, block_size))
+
+    # The first block determines the data type of the output.
+    first = func(*[item[blocks[0]] for item in arrays])
+
+    if out is None:
+        out = np.empty(shape, dtype=np.asarray(first).dtype)
+
+    out[blocks[0]] = first
+
+    def compute(block):
+        out[block] = func(*[item[block] for item in arrays])
+
+    if workers == 1:
+        for block in blocks[1:]:
+            compute(block)
+    else:
+        get_pool(workers).map(compute, blocks[1:])
+
+    return out
+
+
+def outer(func, angles, emw, angle_fields=('iza',), emw_fields=('k0',), workers=1, block_size=BLOCK_SIZE, out=None):
+    """
+    Evaluate a kernel for every pair of geometry and frequency.
+
+    The angles are presented along the leading axis and the EMW quantities along the trailing axes as broadcast views,
+    so no (geometry, frequency) grid is materialized. The kernel is evaluated blockwise (see
+    respy.parallel.blockwise) and only the output and the temporary arrays of a single block are allocated.
+
+    Parameters
+    ----------
+    func : callable
+        Element-wise kernel func(*angle_values, *emw_values) with the attributes defined by angle_fields and
+        emw_fields as arguments.
+    angles : Angles
+        Geometries with N angles.
+    emw : EMW
+        Electromagnetic waves with the shape S.
+    angle_fields : tuple
+        Names of the attributes of angles which are passed to func. Default is ('iza',).
+    emw_fields : tuple
+        Names of the attributes of emw which are passed to func. Default is ('k0',).
+    workers : int or None
+        Number of threads. Default is 1 (blockwise in the calling thread). See respy.parallel.blockwise.
+    block_size : int
+        Maximum number of elements per block. Default is 2**18.
+    out : array_like, optional
+        Array with the shape (N,) + S in which the result is written.
+
+    Returns
+    -------
+    result : array_like
+        Result of func with the shape (N,) + S.
+    """
+    angle_values = [np.ravel(_attribute(angles, item)) for item in angle_fields]
+    emw_values = [np.asarray(_attribute(emw, item)) for item in emw_fields]
+
+    ndim = max([item.ndim for item in emw_values]) if len(emw_values) > 0 else 0
+    args = [item.reshape((-1,) + (1,) * ndim) for item in angle_values]
+    args += [item[np.newaxis] for item in emw_values]
+
+    return blockwise(func, tuple(args), workers=workers, block_size=block_size, out=out)
+
+
+def _attribute(obj, name):
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        raise ValueError("{0} has no attribute {1}.".format(type(obj).__name__, str(name)))
+
+
+def _check_workers(workers):
+    """
+    Check that workers is None or an integer greater than 0.
+    """
+    if workers is None:
+        return workers
+
+    if np.ndim(workers) != 0 or int(workers) != workers or workers < 1:
+        raise ValueError("The number of workers must be an integer greater than 0. The actual number is {0}".format(
+            str(workers)))
+
+    return int(workers)
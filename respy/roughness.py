@@ -0,0 +1,91 @@
+from __future__ import division
+
+import numpy as np
+
+from respy.angles import Angles
+from respy.auxiliary import tiles, rad, PI
+from respy.emw import EMW
+from respy.parallel import BLOCK_SIZE
+
+# Code tables of the roughness classes. 'SMOOTH' satisfies the Fraunhofer criterion (k * s * cos(iza) < pi / 16),
+# 'INTERMEDIATE' only the Rayleigh criterion (k * s * cos(iza) < pi / 4).
+ROUGHNESS_NAMES = ("SMOOTH", "INTERMEDIATE", "ROUGH")
+FRAUNHOFER = PI / 16
+RAYLEIGH = PI / 4
+
+
+def roughness(emw, iza, s, l=None, angle_unit='RAD', block_size=BLOCK_SIZE):
+    """
+    Roughness parameters and classes of a surface after the Rayleigh and the Fraunhofer criterion.
+
+    All quantities are computed in one pass over blocks of the broadcast shape, so apart from the outputs only the
+    temporary arrays of a single block are allocated.
+
+    Parameters
+    ----------
+    emw : EMW, int, float or array_like
+        Electromagnetic waves or free space wavenumbers k0 in [1/length].
+    iza : int, float, array_like or Angles
+        Incidence zenith angle in DEG or RAD. See parameter angle_unit. If iza is an Angles object the cached cosine
+        (Angles.mui) is used and angle_unit is ignored.
+    s : int, float or array_like
+        RMS height of the surface in the wavelength unit of emw.
+    l : int, float or array_like, optional
+        Correlation length of the surface in the wavelength unit of emw.
+    angle_unit : {'DEG', 'RAD'}
+        Unit of iza. Default is 'RAD'.
+    block_size : int
+        Maximum number of elements per block. Default is 2**18.
+
+    Returns
+    -------
+    roughness : dict
+        A dictionary with 'ks', 'ks_cos' (k * s * cos(iza)), 'kl' (if l is defined) and the roughness class 'codes'
+        (np.uint8). The names of the codes are defined in ROUGHNESS_NAMES: 0 ('SMOOTH') if ks_cos < pi / 16,
+        1 ('INTERMEDIATE') if ks_cos < pi / 4 and 2 ('ROUGH') otherwise.
+
+    Note
+    ----
+    k0, iza, s and l are broadcast against each other with the numpy rules. Use EMW.broadcast_with or
+    respy.parallel.outer to align angles and frequencies.
+    """
+    k0 = emw.k0 if isinstance(emw, EMW) else np.asarray(emw, dtype=np.double)
+
+    if isinstance(iza, Angles):
+        mui = iza.mui
+    elif angle_unit == 'DEG':
+        mui = np.cos(rad(np.asarray(iza, dtype=np.double)))
+    elif angle_unit == 'RAD':
+        mui = np.cos(np.asarray(iza, dtype=np.double))
+    else:
+        raise ValueError("angle_unit must be 'RAD' or 'DEG'")
+
+    arrays = [k0, mui, np.asarray(s, dtype=np.double)]
+
+    if l is not None:
+        arrays.append(np.asarray(l, dtype=np.double))
+
+    arrays = np.broadcast_arrays(*arrays)
+    shape = arrays[0].shape
+
+    result = {'ks': np.empty(shape), 'ks_cos': np.empty(shape), 'codes': np.empty(shape, dtype=np.uint8)}
+
+    if l is not None:
+        result['kl'] = np.empty(shape)
+
+    for tile in tiles(shape, block_size):
+        # The Ellipsis keeps views for 0-dimensional inputs.
+        tile = tile + (Ellipsis,)
+        k = arrays[0][tile]
+
+        ks = np.multiply(k, arrays[2][tile], out=result['ks'][tile])
+        ks_cos = np.multiply(ks, arrays[1][tile], out=result['ks_cos'][tile])
+
+        codes = result['codes'][tile]
+        codes[...] = ks_cos >= FRAUNHOFER
+        codes += ks_cos >= RAYLEIGH
+
+        if l is not None:
+            np.multiply(k, arrays[3][tile], out=result['kl'][tile])
+
+    return result
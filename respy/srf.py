@@ -0,0 +1,275 @@
+from __future__ import division
+
+from collections import OrderedDict
+
+import numpy as np
+
+from respy.auxiliary import TILE_SIZE
+from respy.emw import EMW
+from respy.emw.grid import SpectralGrid, convert_spectral
+
+
+class SparseMatrix(object):
+    def __init__(self, data, indices, indptr, shape):
+        """
+        A minimal sparse matrix in the compressed sparse row (CSR) format.
+
+        Parameters
+        ----------
+        data : array_like
+            Nonzero values of all rows.
+        indices : array_like
+            Column index of each value in data.
+        indptr : array_like
+            The values of row i are data[indptr[i]:indptr[i + 1]].
+        shape : tuple
+            (rows, columns) of the matrix.
+
+        Methods
+        -------
+        transform : Multiply arrays along an axis with the matrix.
+        todense : Convert the matrix to a dense array.
+        """
+        self.data = np.asarray(data, dtype=np.double)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = tuple(shape)
+
+        if self.indptr.shape[0] != self.shape[0] + 1:
+            raise ValueError("indptr must have rows + 1 elements.")
+
+        # Rows with contiguous columns (e.g. a spectral response function) are accessed with slices instead of
+        # fancy indexing, which avoids a copy of the columns.
+        self.__columns = list()
+
+        for row in range(self.shape[0]):
+            index = self.indices[self.indptr[row]:self.indptr[row + 1]]
+
+            if index.shape[0] > 0 and np.all(np.diff(index) == 1):
+                self.__columns.append(slice(int(index[0]), int(index[-1]) + 1))
+            else:
+                self.__columns.append(index)
+
+    @property
+    def nnz(self):
+        return self.data.shape[0]
+
+    def todense(self):
+        """
+        Convert the matrix to a dense array.
+
+        Returns
+        -------
+        matrix : array_like
+        """
+        dense = np.zeros(self.shape)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+
+        return dense
+
+    def transform(self, values, axis=-1, chunk_size=TILE_SIZE):
+        """
+        Multiply an array along an axis with the matrix.
+
+        The array is processed in chunks of pixels. For each chunk and row the product is a single dense matrix-vector
+        product (BLAS) over the nonzero columns of the row.
+
+        Parameters
+        ----------
+        values : array_like
+            Array with shape[1] elements along axis.
+        axis : int
+            Axis of values which is reduced by the matrix. Default is -1.
+        chunk_size : int
+            Maximum number of elements of values per chunk. Default is 2**22.
+
+        Returns
+        -------
+        result : array_like
+            Array of the shape of values in which axis has shape[0] elements.
+        """
+        values = np.moveaxis(np.asarray(values), axis, -1)
+
+        if values.shape[-1] != self.shape[1]:
+            raise ValueError("The axis of values must have {0} elements. The actual number is {1}.".format(
+                str(self.shape[1]), str(values.shape[-1])))
+
+        outer = values.shape[:-1]
+        values = values.reshape((-1, self.shape[1]))
+        dtype = np.result_type(values.dtype, np.float32)
+        result = np.empty((values.shape[0], self.shape[0]), dtype=dtype)
+
+        step = chunk_size // self.shape[1] if self.shape[1] > 0 else chunk_size
+        step = step if step > 1 else 1
+
+        for start in range(0, values.shape[0], step):
+            chunk = values[start:start + step]
+
+            for row in range(self.shape[0]):
+                weights = self.data[self.indptr[row]:self.indptr[row + 1]].astype(dtype, copy=False)
+                result[start:start + step, row] = chunk[:, self.__columns[row]].dot(weights)
+
+        return np.moveaxis(result.reshape(outer + (self.shape[0],)), -1, axis)
+
+
+class SpectralResponse(object):
+    def __init__(self, wavelengths, responses, names=None, unit='nm', cache_size=8):
+        """
+        Spectral response functions (SRF) of the channels of a sensor.
+
+        The SRF are resampled on spectral grids as sparse (channels x grid) weight matrices, which are cached for the
+        most recently used grids. Band-averaging of high resolution spectra is a single sparse-dense product.
+
+        Parameters
+        ----------
+        wavelengths : array_like or list
+            Increasing wavelengths of the SRF tables. Either one array per channel or one array for all channels.
+        responses : array_like or list
+            Relative response of each channel with the shape of the corresponding wavelengths.
+        names : list, optional
+            Names of the channels. Default is the channel number.
+        unit : {'nm', 'um', 'cm', 'dm', 'mm', 'm', 'km'} or {'Hz', 'PHz', 'kHz', 'daHz', 'MHz', 'THz', 'hHz', 'GHz'}
+            Unit of wavelengths. Default is 'nm'.
+        cache_size : int
+            Maximum number of cached weight matrices. The least recently used matrix is dropped first. Default is 8.
+
+        Attributes
+        ----------
+        names : tuple
+            Names of the channels.
+        centers : array_like
+            Response weighted center of each channel in the unit of unit.
+
+        Methods
+        -------
+        weights : Sparse weight matrix for a spectral grid.
+        band_average : Average spectra over the channels.
+        """
+        responses = [np.asarray(item, dtype=np.double) for item in responses]
+
+        if np.ndim(wavelengths[0]) == 0:
+            wavelengths = [np.asarray(wavelengths, dtype=np.double)] * len(responses)
+        else:
+            wavelengths = [np.asarray(item, dtype=np.double) for item in wavelengths]
+
+        if len(wavelengths) != len(responses):
+            raise ValueError("The number of wavelength tables must be equal to the number of responses.")
+
+        for wavelength, response in zip(wavelengths, responses):
+            if wavelength.shape != response.shape:
+                raise ValueError("The shape of the wavelengths {0} must agree with the shape of the responses "
+                                 "{1}.".format(str(wavelength.shape), str(response.shape)))
+
+            if np.any(np.diff(wavelength) <= 0):
+                raise ValueError("The wavelengths of the SRF must be strictly increasing.")
+
+        self.names = tuple(range(len(responses))) if names is None else tuple(names)
+        self.unit = unit
+        self.wavelengths = wavelengths
+        self.responses = responses
+
+        self.cache_size = int(cache_size)
+        self.__cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.responses)
+
+    @property
+    def centers(self):
+        return np.asarray([np.trapz(response * wavelength, wavelength) / np.trapz(response, wavelength)
+                           for wavelength, response in zip(self.wavelengths, self.responses)])
+
+    def weights(self, grid, unit=None):
+        """
+        Sparse weight matrix of the channels for a spectral grid.
+
+        The SRF are linearly interpolated on the grid and multiplied with the trapezoidal integration weights of the
+        grid. Each row is normalized to a sum of 1. The matrices are cached per grid (values and unit) with a least
+        recently used policy.
+
+        Parameters
+        ----------
+        grid : array_like, SpectralGrid or EMW
+            Spectral grid. For EMW objects the wavelengths are used.
+        unit : str, optional
+            Unit of grid. Default is the unit of the SRF. Ignored for SpectralGrid and EMW objects.
+
+        Returns
+        -------
+        weights : SparseMatrix
+            Matrix with the shape (channels, grid points).
+        """
+        grid, unit = _as_grid(grid, self.unit if unit is None else unit)
+        # The key holds the grid values themselves, so different grids never share a matrix.
+        key = (unit, grid.tobytes())
+
+        try:
+            matrix = self.__cache.pop(key)
+            self.__cache[key] = matrix
+
+            return matrix
+        except KeyError:
+            pass
+
+        position = grid if unit == self.unit else convert_spectral(grid, unit, self.unit)
+
+        widths = np.abs(np.diff(position))
+        integration = np.zeros(position.shape)
+        integration[:-1] += widths / 2.
+        integration[1:] += widths / 2.
+
+        data, indices, indptr = list(), list(), [0]
+
+        for wavelength, response in zip(self.wavelengths, self.responses):
+            weight = np.interp(position, wavelength, response, left=0., right=0.) * integration
+            index = np.flatnonzero(weight)
+            total = weight[index].sum()
+
+            data.append(weight[index] / total if total > 0 else weight[index])
+            indices.append(index)
+            indptr.append(indptr[-1] + index.shape[0])
+
+        matrix = SparseMatrix(np.concatenate(data), np.concatenate(indices), indptr, (len(self), grid.shape[0]))
+
+        if self.cache_size > 0:
+            self.__cache[key] = matrix
+
+            while len(self.__cache) > self.cache_size:
+                self.__cache.popitem(last=False)
+
+        return matrix
+
+    def band_average(self, spectra, grid, unit=None, axis=-1, chunk_size=TILE_SIZE):
+        """
+        Average high resolution spectra over the spectral response of the channels.
+
+        Parameters
+        ----------
+        spectra : array_like
+            Spectra with the grid points along axis, e.g. with shape (pixels, grid points).
+        grid : array_like, SpectralGrid or EMW
+            Spectral grid of spectra.
+        unit : str, optional
+            Unit of grid. Default is the unit of the SRF.
+        axis : int
+            Spectral axis of spectra. Default is -1.
+        chunk_size : int
+            Maximum number of elements of spectra per chunk. Default is 2**22.
+
+        Returns
+        -------
+        channels : array_like
+            Band-averaged values with the channels along axis.
+        """
+        return self.weights(grid, unit).transform(spectra, axis=axis, chunk_size=chunk_size)
+
+
+def _as_grid(grid, unit):
+    if isinstance(grid, EMW):
+        return np.ravel(grid.wavelength).astype(np.double), grid.wavelength_unit
+
+    if isinstance(grid, SpectralGrid):
+        return grid.values(), grid.unit
+
+    return np.ravel(np.asarray(grid, dtype=np.double)), unit
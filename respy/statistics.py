@@ -0,0 +1,304 @@
+from __future__ import division
+
+import numpy as np
+
+from respy.angles import Angles
+from respy.auxiliary import digitize
+from respy.conversion import dB, linear, _check_units, _from_linear
+
+
+class TemporalStatistics(object):
+    def __init__(self, unit='dB'):
+        """
+        Streaming per-pixel statistics of a backscatter time series.
+
+        The scenes are ingested one at a time. Mean and variance are accumulated in linear units with Welford's
+        algorithm, so only O(pixels) state is kept instead of the whole time series. Accumulators of different
+        processes can be combined with merge.
+
+        Parameters
+        ----------
+        unit : {'dB', 'linear'}
+            Unit of the ingested scenes. Default is 'dB'.
+
+        Attributes
+        ----------
+        count : array_like
+            Number of valid (not NaN) values per pixel.
+        mean, meandB : array_like
+            Mean per pixel in linear units and in dB.
+        variance, std : array_like
+            Variance and standard deviation per pixel in linear units.
+        min, mindB, max, maxdB : array_like
+            Minimum and maximum per pixel in linear units and in dB.
+        shape : tuple
+            Shape of the scenes.
+
+        Methods
+        -------
+        update : Ingest a scene.
+        merge : Merge with another TemporalStatistics object.
+
+        Note
+        ----
+        NaN values are treated as missing values. Pixels without a valid value have a NaN mean. All statistics are
+        None until the first scene is ingested.
+        """
+        _check_units(unit)
+
+        self.unit = unit
+
+        self.__count = None
+        self.__mean = None
+        self.__m2 = None
+        self.__min = None
+        self.__max = None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Magic Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def __len__(self):
+        return 0 if self.__count is None else int(self.__count.max())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Property Access
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def shape(self):
+        return None if self.__count is None else self.__count.shape
+
+    @property
+    def count(self):
+        return self.__count
+
+    @property
+    def mean(self):
+        if self.__count is None:
+            return None
+
+        with np.errstate(invalid='ignore'):
+            return np.where(self.__count > 0, self.__mean, np.nan)
+
+    @property
+    def meandB(self):
+        return self.__dB(self.mean)
+
+    @property
+    def variance(self):
+        """
+        Sample variance (ddof=1) per pixel in linear units.
+
+        Returns
+        -------
+        variance : array_like or None
+            None if no scene has been ingested.
+        """
+        if self.__count is None:
+            return None
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.__count > 1, self.__m2 / (self.__count - 1), np.nan)
+
+    @property
+    def std(self):
+        variance = self.variance
+
+        return None if variance is None else np.sqrt(variance)
+
+    @property
+    def min(self):
+        return None if self.__count is None else np.where(self.__count > 0, self.__min, np.nan)
+
+    @property
+    def mindB(self):
+        return self.__dB(self.min)
+
+    @property
+    def max(self):
+        return None if self.__count is None else np.where(self.__count > 0, self.__max, np.nan)
+
+    @property
+    def maxdB(self):
+        return self.__dB(self.max)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Public Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def update(self, scene):
+        """
+        Ingest a scene.
+
+        Parameters
+        ----------
+        scene : array_like
+            Scene in the unit of the accumulator. All scenes must have the same shape.
+
+        Returns
+        -------
+        self : TemporalStatistics
+        """
+        scene = np.asarray(scene, dtype=np.double)
+        scene = linear(scene) if self.unit == 'dB' else scene
+
+        if self.__count is None:
+            self.__initialize(scene.shape)
+
+        elif scene.shape != self.shape:
+            raise ValueError("The shape of the scene {0} must be equal to {1}.".format(str(scene.shape),
+                                                                                      str(self.shape)))
+
+        valid = ~np.isnan(scene)
+        value = np.where(valid, scene, 0.)
+
+        self.__count += valid
+
+        delta = np.where(valid, value - self.__mean, 0.)
+        self.__mean += np.divide(delta, self.__count, out=np.zeros_like(delta), where=valid)
+        self.__m2 += delta * np.where(valid, value - self.__mean, 0.)
+
+        np.fmin(self.__min, scene, out=self.__min)
+        np.fmax(self.__max, scene, out=self.__max)
+
+        return self
+
+    def merge(self, other):
+        """
+        Merge the statistics of another accumulator, e.g. from another process.
+
+        Parameters
+        ----------
+        other : TemporalStatistics
+
+        Returns
+        -------
+        self : TemporalStatistics
+        """
+        if not isinstance(other, TemporalStatistics):
+            raise TypeError("Only TemporalStatistics objects can be merged.")
+
+        if other.count is None:
+            return self
+
+        if self.__count is None:
+            self.__initialize(other.shape)
+
+        elif other.shape != self.shape:
+            raise ValueError("The shape of the statistics {0} must be equal to {1}.".format(str(other.shape),
+                                                                                           str(self.shape)))
+
+        count_a, count_b = self.__count.astype(np.double), other.count.astype(np.double)
+        count = count_a + count_b
+        mean_b = np.where(other.count > 0, other.mean, 0.)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean_b - self.__mean
+            weight = np.where(count > 0, count_b / count, 0.)
+
+            self.__m2 += other.__m2 + delta ** 2 * count_a * weight
+            self.__mean += delta * weight
+
+        self.__count += other.count
+
+        np.fmin(self.__min, other.__min, out=self.__min)
+        np.fmax(self.__max, other.__max, out=self.__max)
+
+        return self
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Private Methods
+    # ------------------------------------------------------------------------------------------------------------------
+    def __initialize(self, shape):
+        self.__count = np.zeros(shape, dtype=np.int64)
+        self.__mean = np.zeros(shape)
+        self.__m2 = np.zeros(shape)
+        self.__min = np.full(shape, np.nan)
+        self.__max = np.full(shape, np.nan)
+
+    def __dB(self, value):
+        # dB does not propagate NaN values, so the pixels without a valid value are masked again.
+        return None if value is None else np.where(self.__count > 0, dB(value), np.nan)
+
+
+def bin_by_angle(value, angles, edges=0.5, field='izaDeg', unit='dB', output=None, percentiles=None):
+    """
+    Aggregate backscatter samples in angle bins.
+
+    The samples are grouped with np.bincount in linear units. Percentiles are computed on the samples sorted by
+    bin and value (sorted-segment reduction), so no Python loop over the bins is needed.
+
+    Parameters
+    ----------
+    value : array_like
+        Backscatter samples. See parameter unit.
+    angles : array_like or Angles
+        Angle of each sample. If angles is an Angles object, the attribute defined by field is used.
+    edges : float or array_like
+        Monotonically increasing bin edges or, if edges is a scalar, the width of equally spaced bins. Default is
+        0.5.
+    field : str
+        Name of the angle attribute if angles is an Angles object. Default is 'izaDeg'.
+    unit : {'dB', 'linear'}
+        Unit of value. Default is 'dB'.
+    output : {'dB', 'linear'}, optional
+        Unit of the mean and the percentiles. Default is the unit of value.
+    percentiles : float or array_like, optional
+        Percentiles in a range between 0 and 100 to compute in each bin.
+
+    Returns
+    -------
+    binned : dict
+        A dictionary with the bin 'edges', bin 'center', sample 'count' and 'mean' of each bin and, if percentiles
+        are defined, the 'percentiles' with shape (bins, percentiles). Empty bins have a NaN mean.
+    """
+    output = _check_units(unit, output)
+
+    if isinstance(angles, Angles):
+        index, edges = angles.digitize(edges, field)
+    else:
+        index, edges = digitize(angles, edges)
+
+    value = np.asarray(value, dtype=np.double).ravel()
+    index = np.broadcast_to(index, value.shape) if index.size == 1 else index.ravel()
+
+    if index.shape != value.shape:
+        raise ValueError("The number of angles {0} must be equal to the number of values {1}.".format(
+            str(index.size), str(value.size)))
+
+    value = linear(value) if unit == 'dB' else value
+
+    valid = (index >= 0) & ~np.isnan(value)
+    index, value = index[valid], value[valid]
+    nbins = len(edges) - 1
+
+    count = np.bincount(index, minlength=nbins)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.bincount(index, weights=value, minlength=nbins) / count
+
+    binned = {'edges': edges, 'center': (edges[:-1] + edges[1:]) / 2., 'count': count,
+              'mean': _from_linear(mean, output, keep_nan=True)}
+
+    if percentiles is not None:
+        q = np.atleast_1d(np.asarray(percentiles, dtype=np.double)) / 100.
+        order = np.lexsort((value, index))
+        ordered = value[order]
+
+        start = np.concatenate(([0], np.cumsum(count)[:-1]))
+
+        # Linear interpolation between the closest ranks of each segment.
+        position = start[:, np.newaxis] + q[np.newaxis, :] * (count[:, np.newaxis] - 1)
+        position = np.where(count[:, np.newaxis] > 0, position, 0)
+
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        fraction = position - lower
+
+        if ordered.size > 0:
+            result = ordered[lower] * (1 - fraction) + ordered[upper] * fraction
+            result[count == 0] = np.nan
+        else:
+            result = np.full(position.shape, np.nan)
+
+        binned['percentiles'] = _from_linear(result, output, keep_nan=True)
+
+    return binned
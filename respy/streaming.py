@@ -0,0 +1,195 @@
+from __future__ import division
+
+import sys
+import time
+
+import numpy as np
+
+from respy.angles import Angles
+from respy.auxiliary import tiles, TILE_SIZE
+from respy.conversion import convert
+
+
+def open_cube(filename, shape=None, dtype=None, offset=0, mode='r'):
+    """
+    Memory-map a raster cube that is stored on disk.
+
+    Parameters
+    ----------
+    filename : str
+        Path to a '.npy' file or to a raw binary file.
+    shape : tuple, optional
+        Shape of the cube. Only needed for raw binary files.
+    dtype : numpy.dtype, optional
+        Data type of the cube. Only needed for raw binary files.
+    offset : int, optional
+        Offset in bytes of the data in a raw binary file. Default is 0.
+    mode : {'r', 'r+', 'c'}
+        Access mode of the memory-map. Default is 'r'.
+
+    Returns
+    -------
+    cube : numpy.memmap
+    """
+    if str(filename).endswith('.npy'):
+        return np.load(filename, mmap_mode=mode)
+
+    if shape is None or dtype is None:
+        raise ValueError("For raw binary files the parameters shape and dtype must be defined.")
+
+    return np.memmap(filename, dtype=dtype, mode=mode, shape=tuple(shape), offset=offset)
+
+
+def create_cube(filename, shape, dtype=np.double):
+    """
+    Create a memory-mapped raster cube on disk.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the output file. If the file ends with '.npy' a numpy file is written, otherwise a raw binary file.
+    shape : tuple
+        Shape of the cube.
+    dtype : numpy.dtype
+        Data type of the cube. Default is np.double.
+
+    Returns
+    -------
+    cube : numpy.memmap
+    """
+    if str(filename).endswith('.npy'):
+        return np.lib.format.open_memmap(filename, mode='w+', dtype=dtype, shape=tuple(shape))
+
+    return np.memmap(filename, dtype=dtype, mode='w+', shape=tuple(shape))
+
+
+def convert_file(src, dst, vza, value_unit='BSCdB', output='BSC', angle_unit='RAD', shape=None, dtype=None,
+                 offset=0, out_dtype=None, tile_size=TILE_SIZE, callback=None, verbose=False):
+    """
+    Convert a raster cube on disk tile by tile.
+
+    The input is memory-mapped, converted tile by tile with respy.conversion.convert and written into a
+    memory-mapped output. The peak memory is bounded by the tile size and independent of the size of the cube.
+
+    Parameters
+    ----------
+    src : str or numpy.ndarray
+        Input cube. A path to a '.npy' or raw binary file or an (memory-mapped) array.
+    dst : str or numpy.ndarray
+        Output cube. A path to a '.npy' or raw binary file or a writable (memory-mapped) array with the shape of src.
+    vza : int, float, array_like, str or Angles
+        Viewing zenith angle in DEG or RAD, or its cosine. It must be broadcastable to the shape of the cube. A path
+        to a '.npy' file will be memory-mapped. See parameter angle_unit.
+    value_unit, output : {'BRDF', 'BRF', 'BSC', 'BSCdB'}
+        The unit of the input cube and the desired output unit.
+    angle_unit : {'DEG', 'RAD', 'COS'} (default = 'RAD'), optional
+        * 'DEG': Input angle in [DEG].
+        * 'RAD': Input angle  in [RAD].
+        * 'COS': Input is the precomputed cosine of the angle.
+    shape, dtype, offset : optional
+        Shape, data type and byte offset of a raw binary input file. See respy.streaming.open_cube.
+    out_dtype : numpy.dtype, optional
+        Data type of a newly created output file. Default is the data type of the input.
+    tile_size : int
+        Maximum number of elements per tile. Default is 2**22.
+    callback : callable, optional
+        A function callback(done, total, elapsed) which is called after each tile with the number of converted and
+        total elements and the elapsed time in seconds.
+    verbose : bool
+        If True, the progress and throughput is printed to stdout. Default is False.
+
+    Returns
+    -------
+    report : dict
+        A dictionary with the number of 'tiles', 'elements' and 'bytes' processed, the elapsed 'seconds' and the
+        'throughput' in MB/s.
+
+    See Also
+    --------
+    respy.conversion.convert
+    """
+    cube = src if isinstance(src, np.ndarray) else open_cube(src, shape=shape, dtype=dtype, offset=offset)
+
+    if isinstance(dst, np.ndarray):
+        result = dst
+        if result.shape != cube.shape:
+            raise ValueError("The shape of dst {0} must be equal to the shape of src {1}.".format(str(result.shape),
+                                                                                               str(cube.shape)))
+    else:
+        result = create_cube(dst, cube.shape, cube.dtype if out_dtype is None else out_dtype)
+
+    if isinstance(vza, Angles):
+        vza, angle_unit = vza.muv, 'COS'
+    elif isinstance(vza, str):
+        vza = np.load(vza, mmap_mode='r')
+
+    # A broadcast view does not allocate memory, only the tiles are materialized.
+    vza = np.broadcast_to(vza, cube.shape)
+
+    def func(tile):
+        return convert(np.asarray(cube[tile], dtype=np.double), np.asarray(vza[tile]), value_unit=value_unit,
+                       output=output, angle_unit=angle_unit)
+
+    return process_tiles(func, result, tile_size=tile_size, callback=callback, verbose=verbose,
+                         itemsize=cube.dtype.itemsize)
+
+
+def process_tiles(func, result, tile_size=TILE_SIZE, callback=None, verbose=False, itemsize=0):
+    """
+    Fill an (memory-mapped) array tile by tile.
+
+    Parameters
+    ----------
+    func : callable
+        A function func(tile) that returns the values of a tile. The tile is a tuple of slices (see
+        respy.auxiliary.tiles).
+    result : numpy.ndarray
+        Writable (memory-mapped) output array.
+    tile_size : int
+        Maximum number of elements per tile. Default is 2**22.
+    callback : callable, optional
+        A function callback(done, total, elapsed) which is called after each tile with the number of processed and
+        total elements and the elapsed time in seconds.
+    verbose : bool
+        If True, the progress and throughput is printed to stdout. Default is False.
+    itemsize : int
+        Number of bytes read per element. It is only used for the throughput report. Default is 0.
+
+    Returns
+    -------
+    report : dict
+        A dictionary with the number of 'tiles', 'elements' and 'bytes' processed, the elapsed 'seconds' and the
+        'throughput' in MB/s.
+    """
+    total = int(np.prod(result.shape))
+    done = 0
+    ntiles = 0
+    start = time.time()
+
+    for tile in tiles(result.shape, tile_size):
+        value = np.asarray(func(tile))
+        result[tile] = value
+
+        ntiles += 1
+        done += value.size
+        elapsed = time.time() - start
+
+        if callback is not None:
+            callback(done, total, elapsed)
+
+        if verbose:
+            sys.stdout.write("\rProcessed {0} of {1} elements ({2:.1f} %)".format(done, total, 100. * done / total))
+            sys.stdout.flush()
+
+    if isinstance(result, np.memmap):
+        result.flush()
+
+    elapsed = time.time() - start
+    nbytes = done * (itemsize + result.dtype.itemsize)
+    throughput = nbytes / 1e6 / elapsed if elapsed > 0 else float('inf')
+
+    if verbose:
+        sys.stdout.write("\nProcessed {0} tiles in {1:.2f} s ({2:.1f} MB/s)\n".format(ntiles, elapsed, throughput))
+        sys.stdout.flush()
+
+    return {'tiles': ntiles, 'elements': done, 'bytes': nbytes, 'seconds': elapsed, 'throughput': throughput}
@@ -755,3 +755,19 @@ class TestNormalizeAndNbar:
 
         assert angles.nbar == angles.array[0][-1]
         assert angles.nbarDeg == angles.arrayDeg[0][-1]
+
+
+class TestCachedTrigonometry:
+    def test_read_only(self):
+        angles = Angles(iza=np.arange(0, 60, 10), vza=30, raa=0, angle_unit='DEG')
+
+        for item in (angles.mui, angles.muv, angles.sini):
+            with pytest.raises(ValueError):
+                item *= 2
+
+        assert allclose(angles.mui, np.cos(np.deg2rad(np.arange(0, 60, 10))))
+
+        mui = angles.mui
+        angles.dtype = np.float32
+        assert angles.mui is not mui
+        assert angles.mui.dtype == np.float32
@@ -1,7 +1,10 @@
 import numpy as np
 import pytest
 
-from respy import (BRF, BSC, BRDF, dB, sec, cot, linear, rad, deg, align_all)
+from respy import (BRF, BSC, BRDF, dB, sec, cot, linear, rad, deg, align_all, Angles, Conversion, multilook,
+                   block_reduce, boxcar, intensity, complex_to_BSC, radiometric)
+from respy import EMW
+from respy.parallel import blockwise, outer
 
 
 @pytest.mark.webtest
@@ -77,3 +80,196 @@ class TestAuxil:
         a, b = align_all((a, b), constant_values=1)
 
         assert b[-1] == 1
+
+
+class TestAnglesConversion:
+    def test_BSC_angles(self):
+        angles = Angles(iza=35, vza=[30, 40, 50], raa=50)
+        ref = np.array([0.01, 0.02, 0.03])
+
+        assert np.allclose(BSC(ref, angles), BSC(ref, angles.vzaDeg, angle_unit='DEG'))
+        assert np.allclose(BRDF(ref, angles), BRDF(ref, angles.vzaDeg, angle_unit='DEG'))
+
+    def test_BSC_cos(self):
+        vza = np.radians([30, 40, 50])
+        ref = np.array([0.01, 0.02, 0.03])
+
+        assert np.allclose(BSC(ref, np.cos(vza), angle_unit='COS'), BSC(ref, vza))
+        assert np.allclose(BRDF(ref, np.cos(vza), angle_unit='COS'), BRDF(ref, vza))
+
+    def test_muv_cache(self):
+        angles = Angles(iza=35, vza=[30, 40, 50], raa=50)
+
+        assert angles.muv is angles.muv
+        assert np.allclose(angles.muv, np.cos(np.radians([30, 40, 50])))
+
+        angles.dtype = np.float32
+        assert np.allclose(angles.muv, np.cos(np.radians([30, 40, 50])))
+
+    def test_conversion_angles(self):
+        angles = Angles(iza=35, vza=[30, 40, 50], raa=50)
+        ref = np.array([0.01, 0.02, 0.03])
+
+        conv_angles = Conversion(ref, angles, value_unit='BRDF')
+        conv_deg = Conversion(ref, angles.vzaDeg, value_unit='BRDF', angle_unit='DEG')
+
+        assert np.allclose(conv_angles.BSC, conv_deg.BSC)
+        assert np.allclose(conv_angles.BSCdB, conv_deg.BSCdB)
+
+
+class TestWorkers:
+    def test_blockwise_equal(self):
+        value = np.random.uniform(0.001, 0.5, (300, 1000))
+        vza = np.random.uniform(0.1, 1.0, 1000)
+
+        assert np.allclose(dB(value, workers=4), dB(value))
+        assert np.allclose(linear(value, workers=4), linear(value))
+        assert np.allclose(BRDF(value, vza, workers=4), BRDF(value, vza))
+        assert np.allclose(BSC(value, vza, angle_unit='DEG', workers=3), BSC(value, vza, angle_unit='DEG'))
+
+    def test_blockwise_out(self):
+        value = np.random.uniform(0.001, 0.5, 10000)
+        out = np.empty_like(value)
+
+        result = blockwise(np.sqrt, (value,), workers=2, block_size=1000, out=out)
+
+        assert result is out
+        assert np.allclose(out, np.sqrt(value))
+
+    def test_workers_raise(self):
+        with pytest.raises(ValueError):
+            blockwise(np.sqrt, (np.ones(10 ** 6),), workers=0)
+
+        # Small arrays are evaluated without blocks, but workers is checked anyway.
+        with pytest.raises(ValueError):
+            blockwise(np.sqrt, (np.ones(10),), workers=0)
+
+        with pytest.raises(ValueError):
+            dB(np.ones(10), workers=0)
+
+        with pytest.raises(ValueError):
+            blockwise(np.sqrt, (np.ones(10),), workers=1.5)
+
+    def test_outer(self):
+        angles = Angles(iza=np.arange(0, 60, 0.5), vza=30, raa=0)
+        emw = EMW(np.linspace(1, 40, 2000).reshape(40, 50))
+
+        result = outer(lambda mui, k0: k0 * mui, angles, emw, ('mui',), ('k0',), workers=2, block_size=5000)
+
+        assert result.shape == (120, 40, 50)
+        assert np.allclose(result, angles.mui[:, np.newaxis, np.newaxis] * emw.k0[np.newaxis])
+
+    def test_outer_raise(self):
+        angles = Angles(iza=[10, 20], vza=30, raa=0)
+
+        with pytest.raises(ValueError):
+            outer(np.add, angles, EMW(5.405), ('xyz',), ('k0',))
+
+
+class TestMultilook:
+    def test_multilook(self):
+        value = np.random.uniform(-25, 0, (2, 9, 10))
+        test = multilook(value, (3, 2))
+        ref = dB(linear(value).reshape(2, 3, 3, 5, 2).mean(axis=(2, 4)))
+
+        assert test.shape == (2, 3, 5)
+        assert np.allclose(test, ref)
+
+    def test_block_reduce_trim_linear(self):
+        value = np.random.uniform(0.001, 0.5, (7, 5))
+        test = block_reduce(value, (2, 2), unit='linear', output='dB')
+
+        assert test.shape == (3, 2)
+        assert np.allclose(test[0, 0], dB(value[0:2, 0:2].mean()))
+
+    def test_numpy_integer_and_tiles(self):
+        value = np.random.uniform(-25, 0, (3, 11, 9))
+        ref = dB(linear(value[:, :10, :8]).reshape(3, 5, 2, 4, 2).mean(axis=(2, 4)))
+
+        assert np.allclose(multilook(value, np.int64(2)), ref)
+        assert np.allclose(block_reduce(value, (np.int64(2), 2), tile_size=12), ref)
+
+    def test_boxcar(self):
+        value = np.random.uniform(0.001, 0.5, (6, 7))
+        test = boxcar(value, 3, unit='linear')
+
+        assert test.shape == value.shape
+        assert np.allclose(test[2, 3], value[1:4, 2:5].mean())
+        assert np.allclose(test[0, 0], value[0:2, 0:2].mean())
+
+    def test_unit_raise(self):
+        with pytest.raises(ValueError):
+            multilook(np.ones((4, 4)), 2, unit='XXX')
+
+
+class TestComplex:
+    def test_intensity(self):
+        z = (np.random.randn(50, 40) + 1j * np.random.randn(50, 40)).astype(np.complex64)
+        test = intensity(z)
+
+        assert test.dtype == np.float32
+        assert np.allclose(test, np.abs(z) ** 2, rtol=1e-5)
+
+    def test_interleaved(self):
+        z = np.random.randn(30, 20) + 1j * np.random.randn(30, 20)
+        buffer = z.view(np.float64)
+
+        assert buffer.shape == (30, 40)
+        assert np.allclose(intensity(buffer, interleaved=True), np.abs(z) ** 2)
+
+    def test_complex_to_BSC(self):
+        z = np.random.randn(600, 500) + 1j * np.random.randn(600, 500)
+        calibration = np.random.uniform(100, 200, 500)
+
+        test = complex_to_BSC(z, calibration, output='BSCdB', workers=2)
+        ref = dB(np.abs(z) ** 2 / calibration ** 2)
+
+        assert np.allclose(test, ref)
+        assert np.allclose(complex_to_BSC(z, calibration, output='BSC'), np.abs(z) ** 2 / calibration ** 2)
+
+    def test_complex_raise(self):
+        with pytest.raises(ValueError):
+            intensity(np.ones((3, 5)), interleaved=True)
+
+        with pytest.raises(ValueError):
+            complex_to_BSC(np.ones(3), output='BRDF')
+
+
+class TestRadiometric:
+    def setup_method(self):
+        self.iza = np.array([20., 35., 50.])
+        self.angles = Angles(iza=self.iza, vza=self.iza, raa=0)
+        self.sigma0 = np.array([0.05, 0.02, 0.01])
+
+    def test_sigma0_beta0_gamma0(self):
+        beta0 = radiometric(self.sigma0, self.angles, 'sigma0', 'beta0')
+        gamma0 = radiometric(self.sigma0, self.angles, 'sigma0', 'gamma0')
+
+        assert np.allclose(beta0, self.sigma0 / np.sin(np.radians(self.iza)))
+        assert np.allclose(gamma0, self.sigma0 / np.cos(np.radians(self.iza)))
+        assert np.allclose(radiometric(beta0, self.angles, 'beta0', 'gamma0'), gamma0)
+        assert np.allclose(radiometric(gamma0, self.iza, 'gamma0', 'sigma0', angle_unit='DEG'), self.sigma0)
+
+    def test_dB_out(self):
+        out = np.empty(3)
+        result = radiometric(dB(self.sigma0), self.angles, 'sigma0', 'gamma0', unit='dB', out=out)
+
+        assert result is out
+        assert np.allclose(out, dB(radiometric(self.sigma0, self.angles, 'sigma0', 'gamma0')))
+
+    def test_in_place(self):
+        ref = radiometric(self.sigma0, self.angles, 'sigma0', 'gamma0')
+
+        for unit, value in (('dB', dB(self.sigma0)), ('linear', self.sigma0.copy())):
+            result = radiometric(value, self.iza, 'sigma0', 'gamma0', unit=unit, angle_unit='DEG', out=value)
+
+            assert result is value
+            assert np.allclose(value, dB(ref) if unit == 'dB' else ref)
+
+    def test_sini_cache(self):
+        assert self.angles.sini is self.angles.sini
+        assert np.allclose(self.angles.sini, np.sin(np.radians(self.iza)))
+
+    def test_radiometric_raise(self):
+        with pytest.raises(ValueError):
+            radiometric(self.sigma0, self.angles, 'sigma0', 'XXX')
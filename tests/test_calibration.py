@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+import pytest
+
+from respy import dB
+from respy.calibration import CalibrationLUT, calibrate
+from respy.streaming import open_cube
+
+
+def full_lut(lines, pixels, values, shape):
+    """
+    Reference: dense bilinear interpolation of the LUT.
+    """
+    rows, cols = np.arange(shape[0]), np.arange(shape[1])
+    along_pixels = np.asarray([np.interp(cols, pixels, item) for item in values])
+
+    return np.asarray([np.interp(rows, lines, along_pixels[:, j]) for j in range(shape[1])]).T
+
+
+class TestCalibrationLUT:
+    def setup_method(self):
+        self.lines = np.array([0., 10., 25., 39.])
+        self.pixels = np.array([0., 8., 20., 31.])
+        self.values = np.random.uniform(100, 200, (4, 4))
+        self.lut = CalibrationLUT(self.lines, self.pixels, self.values)
+        self.ref = full_lut(self.lines, self.pixels, self.values, (40, 32))
+
+    def test_tile(self):
+        assert np.allclose(self.lut.tile((0, 40), (0, 32)), self.ref)
+        assert np.allclose(self.lut.tile((12, 17), (5, 29)), self.ref[12:17, 5:29])
+        assert np.allclose(self.lut[30:31, 0:10], self.ref[30:31, 0:10])
+
+    def test_slices(self):
+        assert self.lut.shape == (40, 32)
+        assert np.allclose(self.lut[:, :], self.ref)
+        assert np.allclose(self.lut[5:, :3], self.ref[5:, :3])
+        assert np.allclose(self.lut[-5:, 30:100], self.ref[-5:, 30:])
+
+        lut = CalibrationLUT(self.lines, self.pixels, self.values, shape=(50, 40))
+        assert lut[:, :].shape == (50, 40)
+
+        assert self.lut[5:5, :].shape == (0, 32)
+        assert self.lut[:, 3:3].shape == (40, 0)
+        assert self.lut.tile((7, 7), (0, 0)).shape == (0, 0)
+
+        with pytest.raises(IndexError):
+            self.lut[::2, :]
+
+    def test_tie_points(self):
+        assert np.allclose(self.lut.tile((10, 11), (8, 9)), self.values[1, 1])
+
+    def test_shape_raise(self):
+        with pytest.raises(ValueError):
+            CalibrationLUT(self.lines, self.pixels, self.values[:2])
+
+
+class TestCalibrate:
+    def test_calibrate_complex(self, tmpdir):
+        src = os.path.join(str(tmpdir), 'slc.npy')
+        dst = os.path.join(str(tmpdir), 'sigma0.npy')
+
+        lines, pixels = np.array([0., 20., 39.]), np.array([0., 15., 31.])
+        values = np.random.uniform(100, 200, (3, 3))
+        lut = CalibrationLUT(lines, pixels, values)
+
+        slc = (np.random.randn(40, 32) + 1j * np.random.randn(40, 32)).astype(np.complex64)
+        np.save(src, slc)
+
+        report = calibrate(src, dst, lut, output='BSCdB', tile_size=100)
+        ref = dB(np.abs(slc.astype(np.complex128)) ** 2 / full_lut(lines, pixels, values, (40, 32)) ** 2)
+
+        assert report['tiles'] > 1
+        assert np.allclose(np.load(dst), ref, atol=1e-3)
+
+    def test_calibrate_interleaved_raw(self, tmpdir):
+        src = os.path.join(str(tmpdir), 'slc.raw')
+        dst = os.path.join(str(tmpdir), 'sigma0.raw')
+
+        lut = CalibrationLUT([0., 9.], [0., 19.], [[100., 150.], [200., 250.]])
+        data = np.random.randint(-500, 500, (10, 40)).astype(np.int16)
+        data.tofile(src)
+
+        calibrate(src, dst, lut, output='BSC', interleaved=True, shape=data.shape, dtype=np.int16, tile_size=7)
+        result = open_cube(dst, shape=(10, 20), dtype=np.float32)
+
+        intensity = data[:, 0::2].astype(float) ** 2 + data[:, 1::2].astype(float) ** 2
+        ref = intensity / full_lut([0., 9.], [0., 19.], [[100., 150.], [200., 250.]], (10, 20)) ** 2
+
+        assert np.allclose(result, ref, rtol=1e-5)
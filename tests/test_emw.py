@@ -5,6 +5,8 @@ from distutils import dir_util
 import numpy as np
 import pytest
 import respy
+import respy.emw.converter
+import respy.emw.grid
 from numpy import loadtxt
 from pytest import fixture
 
@@ -251,3 +253,395 @@ class TestEMW:
         k0_true = respy.compute_wavenumber(11.5, 'GHz', 'cm')
 
         assert np.allclose(emw.k0, k0_true)
+
+
+class TestBandIndex:
+    def test_band_index_edges(self):
+        from respy.emw.emw import EMS, band_index
+
+        for i, item in enumerate(respy.emw.auxiliary.BANDS):
+            assert band_index(EMS[item][0]) == i
+            assert band_index(EMS[item][-1]) == i
+            assert np.all(band_index(EMS[item]) == i)
+
+    def test_band_index_none(self):
+        from respy.emw.emw import band_index
+
+        assert np.all(band_index([-1, 45, 1e20, np.nan]) == -1)
+
+    def test_which_band_unique(self):
+        frequency = np.array([1.26, 1.3, 10, 10.5, 45])
+
+        assert sorted(respy.which_band(frequency)) == ['L', 'X']
+
+
+class TestCodes:
+    def test_band_codes(self):
+        frequency = np.array([[1.26, 10, 5.26], [28, 45, 15000]])
+        codes, names = respy.band_codes(frequency, 'GHz')
+
+        assert codes.dtype == np.uint8
+        assert codes.shape == frequency.shape
+        assert [names[item] for item in codes.ravel()] == ['L', 'X', 'C', 'Ka', 'NONE', 'NONE']
+
+    def test_band_codes_wavelength(self):
+        codes, names = respy.band_codes([500, 800, 10000], 'nm')
+
+        assert [names[item] for item in codes] == ['VIS', 'NIR', 'LWIR']
+
+    def test_region_codes(self):
+        codes, names = respy.region_codes([500, 800, 10000, 5.6e7, 6.66e6], 'nm')
+
+        assert codes.dtype == np.uint8
+        assert [names[item] for item in codes] == ['OPTIC', 'OPTIC', 'THERMAL', 'MICROWAVE', 'NONE']
+
+
+class TestWhichRegion:
+    def test_which_region_array(self):
+        assert respy.which_region(np.array([1.26, 10, 5.26])) == 'MICROWAVE'
+        assert sorted(respy.which_region(np.array([1.26, 5e5]))) == ['MICROWAVE', 'OPTIC']
+        assert respy.which_region(45) == 'NONE'
+
+    def test_emw_codes(self):
+        emw = respy.EMW([1.26, 5.4, 5e5])
+
+        assert sorted(emw.band) == ['C', 'L', 'VIS']
+        assert sorted(emw.region) == ['MICROWAVE', 'OPTIC']
+        assert emw.band_codes.shape == (3,)
+
+        emw.frequency = np.array([5.4, 5.5])
+        assert emw.band == 'C'
+        assert emw.region == 'MICROWAVE'
+
+
+class TestLazyBands:
+    def test_band_edges(self):
+        from respy.emw.emw import band_edges
+
+        for item in respy.emw.auxiliary.BANDS:
+            grid = respy.select_band(item)
+            assert band_edges(item) == (grid[0], grid[-1])
+
+    def test_select_band_copy(self):
+        grid = respy.select_band("C", "MHz")
+        grid[0] = -1
+
+        assert np.allclose(respy.select_band("C", "MHz")[0], 4100)
+
+    def test_select_band_invalid(self):
+        with pytest.raises(ValueError):
+            respy.select_band("Q")
+
+
+class TestSpectralGrid:
+    def test_num(self):
+        grid = respy.emw.grid.SpectralGrid(1, 2, num=11)
+
+        assert len(grid) == 11
+        assert np.allclose(np.asarray(grid), np.linspace(1, 2, 11))
+
+    def test_step(self):
+        grid = respy.emw.grid.SpectralGrid(1, 2, step=0.25, unit='GHz')
+
+        assert np.allclose(grid.values(), np.arange(1, 2, 0.25))
+        assert np.allclose(grid.values('MHz'), np.arange(1000, 2000, 250))
+
+    def test_log(self):
+        grid = respy.emw.grid.SpectralGrid(1e3, 1e6, num=4, spacing='log', unit='Hz')
+
+        assert np.allclose(grid.values(), [1e3, 1e4, 1e5, 1e6])
+        assert np.allclose(grid[-1], 1e6)
+
+    def test_access(self):
+        grid = respy.emw.grid.SpectralGrid(0, 10, step=1)
+        values = np.arange(0, 10)
+
+        assert np.allclose(grid[3], 3)
+        assert np.allclose(grid[2:8:3], values[2:8:3])
+        assert np.allclose(grid[[1, -2]], values[[1, -2]])
+
+        with pytest.raises(IndexError):
+            grid[10]
+
+    def test_chunks(self):
+        grid = respy.emw.grid.SpectralGrid(1, 100, num=1000)
+        chunks = list(grid.chunks(300, output='cm'))
+
+        assert [len(item) for item in chunks] == [300, 300, 300, 100]
+        assert np.allclose(np.concatenate(chunks), respy.compute_wavelength(grid.values(), 'GHz', 'cm'))
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            respy.emw.grid.SpectralGrid(1, 2)
+
+        with pytest.raises(ValueError):
+            respy.emw.grid.SpectralGrid(1, 2, num=5, step=1)
+
+        with pytest.raises(ValueError):
+            respy.emw.grid.SpectralGrid(0, 2, num=5, spacing='log')
+
+    def test_band_grid(self):
+        grid = respy.emw.grid.band_grid("C", num=5)
+        lower, upper = respy.emw.emw.band_edges("C")
+
+        assert np.allclose(grid[[0, -1]], [lower, upper])
+
+        grid = respy.emw.grid.band_grid("C", num=5, unit='cm')
+        assert np.allclose(grid[[0, -1]], respy.compute_wavelength(np.array([upper, lower]), 'GHz', 'cm'))
+        assert np.all(np.diff(grid.values()) > 0)
+
+
+class TestConverter:
+    frequency = np.array([1.26, 5.405, 9.6])
+
+    def test_frequency_to_wavelength(self):
+        converter = respy.emw.converter.FrequencyToWavelength('GHz', 'cm')
+
+        assert np.allclose(converter(self.frequency), respy.compute_wavelength(self.frequency, 'GHz', 'cm'))
+        assert np.allclose(converter(5.405), respy.compute_wavelength(5.405, 'GHz', 'cm'))
+
+    def test_wavelength_to_frequency(self):
+        converter = respy.emw.converter.WavelengthToFrequency('mm', 'MHz')
+        wavelength = np.array([10., 55.5, 238.])
+
+        assert np.allclose(converter(wavelength), respy.compute_frequency(wavelength, 'mm', 'MHz'))
+
+    def test_wavenumber(self):
+        converter = respy.emw.converter.FrequencyToWavenumber('GHz', 'm')
+
+        assert np.allclose(converter(self.frequency), respy.compute_wavenumber(self.frequency, 'GHz', 'm'))
+
+    def test_scale(self):
+        assert np.allclose(respy.emw.converter.FrequencyConverter('GHz', 'kHz')(self.frequency), self.frequency * 1e6)
+        assert np.allclose(respy.emw.converter.WavelengthConverter('cm', 'mm')(self.frequency), self.frequency * 10)
+
+    def test_out(self):
+        out = np.empty(3, dtype=np.float32)
+        result = respy.emw.converter.FrequencyToWavelength()(self.frequency.astype(np.float32), out=out)
+
+        assert result is out
+        assert np.allclose(out, respy.compute_wavelength(self.frequency, 'GHz', 'cm'), rtol=1e-6)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            respy.emw.converter.FrequencyToWavelength('cm', 'GHz')
+
+
+class TestLazyEMW:
+    def test_setters(self):
+        emw = respy.EMW([1.26, 5.405])
+        emw.wavelength = np.array([3.1, 0.8])
+
+        assert np.allclose(emw.frequency, respy.compute_frequency(np.array([3.1, 0.8]), 'cm', 'GHz'))
+        assert np.allclose(emw.k0, 2 * np.pi / np.array([3.1, 0.8]))
+        assert emw.band == ['Ka', 'X']
+
+        emw.frequency = np.array([1.26])
+        assert emw.band == 'L'
+        assert emw.region == 'MICROWAVE'
+
+    def test_units(self):
+        emw = respy.EMW(5.405)
+        emw.wavelength_unit = 'm'
+
+        assert np.allclose(emw.k0, respy.compute_wavenumber(5.405, 'GHz', 'm'))
+        assert np.allclose(emw.array[1], emw.wavelength)
+
+        emw = respy.EMW(5.55, unit='cm', output='GHz')
+        emw.frequency_unit = 'MHz'
+
+        assert np.allclose(emw.frequency, respy.compute_frequency(5.55, 'cm', 'MHz'))
+
+
+class TestShapeEMW:
+    frequency = np.array([[1.26, 5.405], [9.6, 35.75]])
+
+    def test_shape(self):
+        emw = respy.EMW(self.frequency)
+
+        assert emw.shape == (2, 2)
+        assert emw.ndim == 2
+        assert emw.wavelength.shape == (2, 2)
+        assert emw.k0.shape == (2, 2)
+        assert emw.band_codes.shape == (2, 2)
+        assert emw.array.shape == (3, 2, 2)
+        assert sorted(emw.band) == ['C', 'Ka', 'L', 'X']
+
+    def test_scalar(self):
+        emw = respy.EMW(5.405)
+
+        assert emw.shape == (1,)
+        assert len(emw) == 1
+
+    def test_no_copy(self):
+        emw = respy.EMW(self.frequency)
+
+        assert np.shares_memory(emw.frequency, self.frequency)
+
+    def test_broadcast_with(self):
+        emw = respy.EMW(self.frequency)
+        angles = respy.Angles(iza=[10, 20, 30, 40], vza=30, raa=0)
+
+        iza, k0 = emw.broadcast_with(angles)
+
+        assert iza.shape == (2, 2)
+        assert np.allclose(iza, np.deg2rad([[10, 20], [30, 40]]))
+
+        iza, k0 = emw.broadcast_with(np.array([10, 20])[:, np.newaxis, np.newaxis])
+        assert iza.shape == k0.shape == (2, 2, 2)
+
+        with pytest.raises(ValueError):
+            emw.broadcast_with(angles, field='xyz')
+
+
+class TestLossyMedium:
+    frequency = np.array([1.26, 5.405, 9.6])
+    epsilon = np.array([[10 + 2j], [20 + 5j]])
+
+    def test_wavenumber(self):
+        emw = respy.EMW(self.frequency)
+        k = emw.wavenumber(self.epsilon)
+
+        assert k.shape == (2, 3)
+        assert k.dtype == np.complex128
+        assert np.allclose(k, emw.k0 * np.sqrt(self.epsilon))
+
+    def test_depths(self):
+        emw = respy.EMW(self.frequency)
+        k = emw.k0 * np.sqrt(self.epsilon)
+
+        assert np.allclose(emw.penetration_depth(self.epsilon), 1 / (2 * k.imag))
+        assert np.allclose(emw.skin_depth(self.epsilon), 1 / k.imag)
+        assert np.all(np.isinf(emw.skin_depth(4.)))
+
+    def test_single_precision(self):
+        emw = respy.EMW(self.frequency)
+        epsilon = self.epsilon.astype(np.complex64)
+
+        assert emw.wavenumber(epsilon).dtype == np.complex64
+        assert emw.penetration_depth(epsilon).dtype == np.float32
+
+    def test_out(self):
+        emw = respy.EMW(self.frequency)
+        out = np.empty((2, 3), dtype=np.float32)
+
+        result = emw.skin_depth(self.epsilon, out=out)
+
+        assert result is out
+        assert np.allclose(out, 1 / (emw.k0 * np.sqrt(self.epsilon)).imag, rtol=1e-5)
+
+
+class TestBandRegistry:
+    def test_register_overlap(self):
+        from respy.emw.registry import BandRegistry
+
+        registry = BandRegistry()
+        registry.register("UHF", 0.3, 1.0, region="RADIO")
+        registry.register("P", 0.25, 0.5, region="MICROWAVE")
+
+        index = registry.index([0.2, 0.25, 0.4, 0.5, 0.6, 1.0, 1.1])
+        assert [registry.band_names[item + 1] for item in index] == ['NONE', 'P', 'P', 'P', 'UHF', 'UHF', 'NONE']
+        assert registry.members("MICROWAVE") == ["P"]
+
+        registry.remove("P")
+        assert registry.band_names[registry.index(0.4) + 1] == "UHF"
+
+    def test_group_raise(self):
+        with pytest.raises(ValueError):
+            respy.emw.emw.REGISTRY.group("L", ["S"])
+
+        with pytest.raises(ValueError):
+            respy.emw.emw.REGISTRY.group("NONE", ["S"])
+
+        assert np.array_equal(respy.select_region("L"), respy.select_band("L"))
+
+    def test_remove_stable_codes(self):
+        from respy.emw.emw import names_from_codes
+        from respy.emw.registry import BandRegistry
+
+        registry = BandRegistry()
+        registry.register("A", 1, 2)
+        registry.register("B", 3, 4)
+        registry.register("C", 5, 6)
+
+        codes = (registry.index([1.5, 3.5, 5.5]) + 1).astype(np.uint8)
+        registry.remove("B")
+
+        assert registry.bands == ("A", "C")
+        assert list(names_from_codes(codes, registry.band_names)) == ["A", "B", "C"]
+        assert list(registry.index([1.5, 3.5, 5.5])) == [0, -1, 2]
+        assert list(registry.region_lookup) == [0, 1, 1, 1]
+
+        registry.register("B", 3, 4)
+        assert registry.band_names == ("NONE", "A", "B", "C", "B")
+        assert list(registry.index([1.5, 3.5, 5.5])) == [0, 3, 2]
+        assert names_from_codes(np.array([2, 4]), registry.band_names) == "B"
+
+    def test_register_band(self):
+        respy.emw.emw.register_band("P", 0.25, 0.5, region="MICROWAVE", step=0.05)
+
+        try:
+            assert respy.which_band(0.4) == 'P'
+            assert respy.which_region(np.array([0.4, 5.405])) == 'MICROWAVE'
+            assert np.allclose(respy.select_band("P"), [0.25, 0.3, 0.35, 0.4, 0.45, 0.5])
+            assert np.allclose(respy.select_region("MICROWAVE")[:6], [0.25, 0.3, 0.35, 0.4, 0.45, 0.5])
+            assert sorted(respy.EMW([0.3, 1.26]).band) == ['L', 'P']
+
+            with pytest.raises(ValueError):
+                respy.emw.emw.register_band("P", 0.25, 0.5)
+
+        finally:
+            respy.emw.emw.REGISTRY.remove("P")
+
+        assert respy.which_band(0.4) == 'UHF'
+
+    def test_select_region(self):
+        assert np.allclose(respy.select_region("RADAR")[[0, -1]], [1, 12])
+        assert respy.which_band(respy.select_region("THERMAL", "um"), 'um') == ['MWIR', 'LWIR']
+
+        with pytest.raises(ValueError):
+            respy.select_region("XYZ")
+
+    def test_select_slf(self):
+        assert np.allclose(respy.select_band("SLF", "Hz")[[0, -1]], [30.1, 300])
+        assert respy.which_band(1e-7) == 'SLF'
+        assert respy.which_region(1e-7) == 'RADIO'
+        assert respy.EMW(1.26).band == 'L'
+
+        radio = ["ELF", "ULF", "VLF", "LF", "MF", "HF", "VHF", "UHF"]
+        assert np.array_equal(respy.select_region("RADIO"), np.concatenate([respy.select_band(item) for item in radio]))
+
+
+class TestUnitLookup:
+    def test_wavelength_edges(self):
+        # Band edges in the unit of the band definition are classified without rounding errors.
+        codes, names = respy.band_codes([400., 750., 751., 1000., 2500.], 'nm')
+
+        assert [names[item] for item in codes] == ['VIS', 'VIS', 'NIR', 'NIR', 'SWIR']
+
+    def test_units_agree(self):
+        frequency = 10 ** np.random.uniform(-9, 10, 10000)
+        codes, _ = respy.band_codes(frequency, 'GHz')
+
+        for unit in ['nm', 'um', 'cm', 'm']:
+            wavelength = respy.compute_wavelength(frequency, 'GHz', unit)
+            assert np.mean(respy.band_codes(wavelength, unit)[0] == codes) > 0.999
+
+        assert np.mean(respy.band_codes(frequency * 1e3, 'MHz')[0] == codes) > 0.999
+
+    def test_edge_table(self):
+        from respy.emw.emw import REGISTRY
+
+        boundaries, codes = REGISTRY.edge_table('cm')
+
+        assert np.all(np.diff(boundaries) > 0)
+        assert codes.shape[0] == boundaries.shape[0] - 1
+        assert REGISTRY.edge_table('cm')[0] is boundaries
+
+        with pytest.raises(ValueError):
+            REGISTRY.edge_table('xyz')
+
+    def test_emw_wavelength(self):
+        emw = respy.EMW([500., 10000.], unit='nm', output='GHz')
+
+        assert emw.band == ['VIS', 'LWIR']
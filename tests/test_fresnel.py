@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from respy import Angles
+from respy.fresnel import fresnel_reflection, fresnel_transmission, fresnel_reflectivity
+
+
+class TestFresnel:
+    epsilon = np.array([4., 15 - 3j, 25 - 10j])
+
+    def test_normal_incidence(self):
+        rh = fresnel_reflection(0, self.epsilon, 'H')
+        rv = fresnel_reflection(0, self.epsilon, 'V')
+
+        n = np.sqrt(self.epsilon)
+        assert np.allclose(rh, (1 - n) / (1 + n))
+        assert np.allclose(rv, -rh)
+
+    def test_brewster(self):
+        assert np.allclose(fresnel_reflection(np.arctan(2.), 4., 'V'), 0)
+
+    def test_energy_conservation(self):
+        iza = np.linspace(0, 80, 50)
+        mui, sini = np.cos(np.deg2rad(iza)), np.sin(np.deg2rad(iza))
+        root = np.sqrt(4. - sini ** 2)
+
+        reflectivity = fresnel_reflectivity(iza, 4., 'H', angle_unit='DEG')
+        th = fresnel_transmission(iza, 4., 'H', angle_unit='DEG')
+        tv = fresnel_transmission(iza, 4., 'V', angle_unit='DEG')
+
+        assert np.allclose(reflectivity + root / mui * np.abs(th) ** 2, 1)
+        assert np.allclose(fresnel_reflectivity(iza, 4., 'V', angle_unit='DEG') + root / mui * np.abs(tv) ** 2, 1)
+
+    def test_angles(self):
+        angles = Angles(iza=[10, 35, 60], vza=30, raa=0)
+
+        assert np.allclose(fresnel_reflection(angles, self.epsilon, 'H'),
+                           fresnel_reflection([10, 35, 60], self.epsilon, 'H', angle_unit='DEG'))
+
+    def test_blockwise(self):
+        iza = np.random.uniform(0, 1.2, (100, 1))
+        epsilon = np.random.uniform(3, 30, 1000) - 1j * np.random.uniform(0, 5, 1000)
+        out = np.empty((100, 1000), dtype=np.complex128)
+
+        result = fresnel_reflection(iza, epsilon, 'V', workers=2, block_size=5000, out=out)
+
+        assert result is out
+        assert np.allclose(out, fresnel_reflection(iza, epsilon, 'V'))
+
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            fresnel_reflection(0.5, 4., 'X')
+
+        with pytest.raises(ValueError):
+            fresnel_reflection(0.5, 4., 'H', angle_unit='COS')
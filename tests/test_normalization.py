@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from respy import Angles, dB, linear
+from respy.normalization import SlopeNormalization, cosine_normalization
+
+
+class TestCosineNormalization:
+    def test_dB_linear(self):
+        value = np.random.uniform(-20, -5, (4, 3))
+        iza = np.random.uniform(25, 45, (4, 3))
+        test_dB = cosine_normalization(value, iza, reference=30)
+        test_linear = cosine_normalization(linear(value), iza, reference=30, unit='linear', output='dB')
+        ref = dB(linear(value) * (np.cos(np.radians(30)) / np.cos(np.radians(iza))) ** 2)
+
+        assert np.allclose(test_dB, ref)
+        assert np.allclose(test_linear, ref)
+
+    def test_angles_along_time(self):
+        value = np.random.uniform(-20, -5, (4, 3))
+        iza = np.array([25., 30., 35., 40.])
+        angles = Angles(iza=iza, vza=iza, raa=0)
+
+        test = cosine_normalization(value, angles, reference=30)
+        ref = cosine_normalization(value, iza[:, np.newaxis], reference=30)
+
+        assert np.allclose(test, ref)
+        assert np.allclose(cosine_normalization(value, iza, reference=30), ref)
+
+        # A square stack: one angle per time step, not per pixel.
+        value = np.random.uniform(-20, -5, (4, 4))
+        assert np.allclose(cosine_normalization(value, iza, reference=30),
+                           cosine_normalization(value, iza[:, np.newaxis], reference=30))
+
+
+class TestSlopeNormalization:
+    def setup_method(self):
+        self.slope = np.random.uniform(-0.3, -0.05, (5, 6))
+        self.intercept = np.random.uniform(-15, -5, (5, 6))
+        self.iza = np.random.uniform(20, 50, (30, 5, 6))
+        self.stack = self.intercept + self.slope * (self.iza - 40.)
+
+    def test_fit(self):
+        norm = SlopeNormalization(reference=40.).fit(self.stack, self.iza, block_size=60)
+
+        assert np.allclose(norm.slope, self.slope)
+        assert np.allclose(norm.intercept, self.intercept)
+        assert np.all(norm.count == 30)
+
+    def test_polyfit(self):
+        stack = self.stack + np.random.normal(0, 0.5, self.stack.shape)
+        norm = SlopeNormalization(reference=40.).fit(stack, self.iza)
+        slope, intercept = np.polyfit(self.iza[:, 2, 3] - 40., stack[:, 2, 3], 1)
+
+        assert np.allclose(norm.slope[2, 3], slope)
+        assert np.allclose(norm.intercept[2, 3], intercept)
+
+    def test_update_merge(self):
+        first, second = SlopeNormalization(), SlopeNormalization()
+
+        for i in range(15):
+            first.update(self.stack[i], self.iza[i])
+        for i in range(15, 30):
+            second.update(self.stack[i], self.iza[i])
+
+        first.merge(second)
+
+        assert np.allclose(first.slope, self.slope)
+
+    def test_normalize(self):
+        norm = SlopeNormalization(reference=40.).fit(self.stack, self.iza)
+        normalized = norm.normalize(self.stack, self.iza, block_size=50)
+
+        assert np.allclose(normalized, self.intercept[np.newaxis])
+
+    def test_time_array(self):
+        iza = np.linspace(20, 50, 6)
+        stack = -10 - 0.2 * (iza[:, np.newaxis] - 40.) + np.zeros((6, 6))
+
+        for angles in (iza, Angles(iza=iza, vza=iza, raa=0, angle_unit='DEG')):
+            norm = SlopeNormalization(reference=40.).fit(stack, angles)
+
+            assert np.allclose(norm.slope, -0.2)
+            assert np.allclose(norm.normalize(stack, angles), -10)
+
+    def test_empty(self):
+        norm = SlopeNormalization()
+
+        assert norm.count is None
+        assert norm.slope is None
+        assert norm.intercept is None
+
+    def test_normalize_raise(self):
+        with pytest.raises(ValueError):
+            SlopeNormalization().normalize(self.stack, self.iza)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from respy import EMW, Angles
+from respy.roughness import roughness, ROUGHNESS_NAMES
+
+
+class TestRoughness:
+    def test_products(self):
+        emw = EMW(np.array([1.26, 5.405]))
+        angles = Angles(iza=[20, 40], vza=30, raa=0)
+        s = np.array([0.5, 1.5])
+
+        result = roughness(emw, angles, s, l=10.)
+
+        assert np.allclose(result['ks'], emw.k0 * s)
+        assert np.allclose(result['ks_cos'], emw.k0 * s * angles.mui)
+        assert np.allclose(result['kl'], emw.k0 * 10.)
+
+    def test_codes(self):
+        k0 = 1.
+        s = np.array([np.pi / 32, np.pi / 8, np.pi])
+
+        result = roughness(k0, 0, s)
+
+        assert result['codes'].dtype == np.uint8
+        assert [ROUGHNESS_NAMES[item] for item in result['codes']] == ['SMOOTH', 'INTERMEDIATE', 'ROUGH']
+        assert 'kl' not in result
+
+    def test_blocks(self):
+        emw = EMW(np.linspace(1, 10, 50))
+        iza, k0 = emw.broadcast_with(np.linspace(0, 60, 40)[:, np.newaxis])
+        s = np.random.uniform(0.1, 3, (40, 50))
+
+        result = roughness(emw, iza, s, angle_unit='DEG', block_size=100)
+        ks_cos = emw.k0 * s * np.cos(np.deg2rad(iza))
+
+        assert np.allclose(result['ks_cos'], ks_cos)
+        assert np.array_equal(result['codes'], (ks_cos >= np.pi / 16).astype(int) + (ks_cos >= np.pi / 4))
+
+    def test_scalar(self):
+        result = roughness(2., 0.5, 0.3)
+
+        assert np.allclose(result['ks'], 0.6)
+        assert result['codes'].shape == ()
+
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            roughness(1., 0.5, 0.3, angle_unit='COS')
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from respy import EMW
+from respy.emw.grid import SpectralGrid
+from respy.srf import SpectralResponse, SparseMatrix
+
+
+def gaussian(center, width):
+    wavelength = np.linspace(center - 3 * width, center + 3 * width, 61)
+
+    return wavelength, np.exp(-0.5 * ((wavelength - center) / width) ** 2)
+
+
+@pytest.fixture
+def srf():
+    tables = [gaussian(490, 20), gaussian(560, 15), gaussian(665, 10)]
+
+    return SpectralResponse([item[0] for item in tables], [item[1] for item in tables], names=['B2', 'B3', 'B4'])
+
+
+class TestSparseMatrix:
+    def test_transform(self):
+        matrix = SparseMatrix([1., 2., 3., 4.], [0, 1, 1, 3], [0, 2, 4], (2, 4))
+        values = np.random.rand(5, 4)
+
+        assert np.allclose(matrix.todense(), [[1, 2, 0, 0], [0, 3, 0, 4]])
+        assert np.allclose(matrix.transform(values), values.dot(matrix.todense().T))
+        assert np.allclose(matrix.transform(values.T, axis=0), matrix.todense().dot(values.T))
+
+    def test_raise(self):
+        matrix = SparseMatrix([1.], [0], [0, 1], (1, 4))
+
+        with pytest.raises(ValueError):
+            matrix.transform(np.ones((3, 5)))
+
+
+class TestSpectralResponse:
+    grid = np.arange(400., 1000., 1.)
+
+    def test_weights(self, srf):
+        weights = srf.weights(self.grid)
+
+        assert weights.shape == (3, 600)
+        assert np.allclose(weights.todense().sum(axis=1), 1)
+        assert weights is srf.weights(self.grid)
+        assert np.allclose(srf.centers, [490, 560, 665])
+
+    def test_cache(self):
+        wavelength, response = gaussian(560, 15)
+        srf = SpectralResponse([wavelength], [response], cache_size=2)
+        first, second, third = self.grid, self.grid[:500], self.grid[100:]
+
+        weights = srf.weights(first)
+        srf.weights(second)
+        assert srf.weights(first) is weights
+
+        # Only the two most recently used grids are cached.
+        srf.weights(third)
+        assert srf.weights(first) is weights
+        assert srf.weights(second).shape == (1, 500)
+        assert srf.weights(third) is not weights
+        assert srf.weights(first) is not weights
+
+    def test_band_average(self, srf):
+        spectra = np.random.rand(1000, 600)
+        expected = spectra.dot(srf.weights(self.grid).todense().T)
+
+        assert np.allclose(srf.band_average(spectra, self.grid, chunk_size=6000), expected)
+        assert np.allclose(srf.band_average(np.ones(600), self.grid), 1)
+
+    def test_linear_spectrum(self, srf):
+        # A linear spectrum is averaged to its value at the center of symmetric SRF.
+        result = srf.band_average(self.grid, self.grid)
+
+        assert np.allclose(result, [490, 560, 665], atol=1e-6)
+
+    def test_grids(self, srf):
+        grid = SpectralGrid(400, 1000, step=1., unit='nm')
+        emw = EMW(self.grid / 1000., unit='um', output='GHz')
+        spectra = np.random.rand(10, 600)
+
+        expected = srf.band_average(spectra, self.grid)
+
+        assert np.allclose(srf.band_average(spectra, grid), expected)
+        assert np.allclose(srf.band_average(spectra, emw), expected)
+        assert np.allclose(srf.band_average(spectra, self.grid / 1000., unit='um'), expected)
@@ -0,0 +1,117 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from respy import Angles, dB, linear
+from respy.statistics import TemporalStatistics, bin_by_angle
+
+
+class TestTemporalStatistics:
+    def test_update(self):
+        series = np.random.uniform(-25, 0, (20, 4, 5))
+        stats = TemporalStatistics(unit='dB')
+
+        for scene in series:
+            stats.update(scene)
+
+        assert len(stats) == 20
+        assert stats.shape == (4, 5)
+        assert np.allclose(stats.mean, linear(series).mean(axis=0))
+        assert np.allclose(stats.meandB, dB(linear(series).mean(axis=0)))
+        assert np.allclose(stats.variance, linear(series).var(axis=0, ddof=1))
+        assert np.allclose(stats.mindB, series.min(axis=0))
+        assert np.allclose(stats.max, linear(series).max(axis=0))
+
+    def test_nan(self):
+        series = np.random.uniform(0.001, 0.5, (10, 6))
+        series[3, 2] = np.nan
+        series[:, 5] = np.nan
+
+        stats = TemporalStatistics(unit='linear')
+        for scene in series:
+            stats.update(scene)
+
+        assert stats.count[2] == 9
+        assert np.allclose(stats.mean[:5], np.nanmean(series[:, :5], axis=0))
+        assert np.isnan(stats.mean[5])
+        assert np.isnan(stats.meandB[5])
+
+    def test_merge(self):
+        series = np.random.uniform(-25, 0, (15, 8))
+        first, second = TemporalStatistics(), TemporalStatistics()
+
+        for scene in series[:6]:
+            first.update(scene)
+        for scene in series[6:]:
+            second.update(scene)
+
+        merged = pickle.loads(pickle.dumps(first)).merge(second)
+
+        assert np.allclose(merged.mean, linear(series).mean(axis=0))
+        assert np.allclose(merged.variance, linear(series).var(axis=0, ddof=1))
+        assert np.allclose(merged.min, linear(series).min(axis=0))
+
+    def test_empty(self):
+        stats = TemporalStatistics()
+
+        assert len(stats) == 0
+        assert stats.count is None
+
+        for item in ('mean', 'meandB', 'variance', 'std', 'min', 'mindB', 'max', 'maxdB'):
+            assert getattr(stats, item) is None
+
+        assert np.allclose(stats.merge(TemporalStatistics()).update(np.zeros(3)).meandB, [0, 0, 0])
+
+    def test_shape_raise(self):
+        stats = TemporalStatistics().update(np.zeros((3, 3)))
+
+        with pytest.raises(ValueError):
+            stats.update(np.zeros((2, 3)))
+
+
+class TestBinByAngle:
+    def test_bins(self):
+        iza = np.random.uniform(20, 45, 5000)
+        value = np.random.uniform(-25, 0, 5000)
+        angles = Angles(iza=iza, vza=iza, raa=0)
+
+        binned = bin_by_angle(value, angles, edges=0.5, percentiles=[10, 50, 90])
+        index = np.floor((iza - binned['edges'][0]) / 0.5).astype(int)
+
+        for i in [0, 7, 20]:
+            samples = linear(value[index == i])
+            assert binned['count'][i] == samples.size
+            assert np.allclose(binned['mean'][i], 10 * np.log10(samples.mean()))
+            assert np.allclose(binned['percentiles'][i], 10 * np.log10(np.percentile(samples, [10, 50, 90])))
+
+        assert binned['count'].sum() == 5000
+
+    def test_edges(self):
+        iza = np.array([10., 20., 25., 30., 40., 50.])
+        value = np.array([1., 2., 3., 4., 5., 6.])
+
+        binned = bin_by_angle(value, iza, edges=[20, 30, 40], unit='linear')
+
+        assert np.all(binned['count'] == [2, 2])
+        assert np.allclose(binned['mean'], [2.5, 4.5])
+
+    def test_no_valid_angles(self):
+        binned = bin_by_angle([1., 2.], [np.nan, np.nan])
+
+        assert np.allclose(binned['edges'], [0, 0.5])
+        assert np.array_equal(binned['count'], [0])
+        assert np.isnan(binned['mean']).all()
+
+        binned = bin_by_angle([1., 2., 3.], [10., np.inf, np.nan], edges=1., percentiles=50)
+        assert np.array_equal(binned['count'], [1])
+        assert np.allclose(binned['percentiles'], 1.)
+
+    def test_digitize_field(self):
+        angles = Angles(iza=[10, 20], vza=[31, 44], raa=0)
+        index, edges = angles.digitize([30, 40, 50], field='vzaDeg')
+
+        assert np.all(index == [0, 1])
+
+        with pytest.raises(ValueError):
+            angles.digitize(1, field='XXX')
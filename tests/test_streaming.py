@@ -0,0 +1,77 @@
+import os
+
+import numpy as np
+import pytest
+
+from respy import Angles, Conversion, convert
+from respy.streaming import convert_file, open_cube
+from respy.auxiliary import tiles
+
+
+class TestConvert:
+    @pytest.mark.parametrize("value_unit", ['BRDF', 'BRF', 'BSC', 'BSCdB'])
+    def test_convert(self, value_unit):
+        vza = np.array([10., 20., 30.])
+        value = np.array([0.01, 0.02, 0.03])
+        conv = Conversion(value, vza, value_unit=value_unit, angle_unit='DEG')
+
+        for output in ['BRDF', 'BRF', 'BSC', 'BSCdB']:
+            assert np.allclose(convert(value, vza, value_unit, output, angle_unit='DEG'), getattr(conv, output))
+
+    def test_convert_raise(self):
+        with pytest.raises(ValueError):
+            convert(0.01, 10, value_unit='XXX')
+
+
+class TestTiles:
+    @pytest.mark.parametrize("shape, tile_size", [
+        ((10, 20, 30), 1000),
+        ((10, 20, 30), 7),
+        ((3, 4), 100),
+        ((1000,), 64)
+    ])
+    def test_tiles_cover(self, shape, tile_size):
+        count = np.zeros(shape, dtype=int)
+
+        for tile in tiles(shape, tile_size):
+            assert count[tile].size <= tile_size
+            count[tile] += 1
+
+        assert np.all(count == 1)
+
+
+class TestConvertFile:
+    def test_npy(self, tmpdir):
+        src = os.path.join(str(tmpdir), 'src.npy')
+        dst = os.path.join(str(tmpdir), 'dst.npy')
+
+        cube = np.random.uniform(-25, 0, (4, 8, 16))
+        vza = np.random.uniform(20, 45, (8, 16))
+        np.save(src, cube)
+
+        report = convert_file(src, dst, vza, value_unit='BSCdB', output='BRDF', angle_unit='DEG', tile_size=50)
+
+        assert report['elements'] == cube.size
+        assert report['tiles'] > 1
+        assert np.allclose(np.load(dst), Conversion(cube, vza, 'BSCdB', 'DEG').BRDF)
+
+    def test_raw_angles(self, tmpdir):
+        src = os.path.join(str(tmpdir), 'src.raw')
+        dst = os.path.join(str(tmpdir), 'dst.raw')
+
+        cube = np.random.uniform(0.001, 0.1, (5, 12)).astype(np.float32)
+        cube.tofile(src)
+        angles = Angles(iza=35, vza=np.linspace(20, 45, 12), raa=0)
+
+        progress = list()
+        convert_file(src, dst, angles, value_unit='BSC', output='BSCdB', shape=cube.shape, dtype=np.float32,
+                     tile_size=12, callback=lambda done, total, elapsed: progress.append(done))
+
+        result = open_cube(dst, shape=cube.shape, dtype=np.float32)
+
+        assert progress[-1] == cube.size
+        assert np.allclose(result, 10 * np.log10(cube), atol=1e-4)
+
+    def test_raw_raise(self, tmpdir):
+        with pytest.raises(ValueError):
+            open_cube(os.path.join(str(tmpdir), 'src.raw'))